@@ -4,12 +4,14 @@
 ║   Last Known Positions · Behaviour Drift · Sprint/Fatigue · Coordination║
 ╚══════════════════════════════════════════════════════════════════════════╝
 """
+import heapq
 import math
 import random
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Set, Tuple
-from collections import deque
+from collections import defaultdict, deque
 from shared_constants import *
+from tick_context import TickContext
 
 # ─────────────────────────────────────────────────────────────────────
 #  1. AGENT MEMORY SYSTEM
@@ -18,6 +20,10 @@ from shared_constants import *
 MEMORY_TTL        = 20    # ticks before last-seen memory expires
 DANGER_ZONE_TTL   = 15    # avoid a zone this many ticks after getting killed there
 MAX_MEMORY_ENTRIES = 12
+MEMORY_LOG_LIMIT   = 50   # kill/death records kept per agent
+DANGER_ZONE_RADIUS = 20.0
+DANGER_CELL        = 20.0 # spatial index bucket size for danger zones
+SHARED_SIGHTING_THREAT = 0.5   # threat assumed for sightings read off the team board
 
 @dataclass
 class MemoryEntry:
@@ -35,6 +41,10 @@ class MemoryEntry:
         return min(1.0, age / MEMORY_TTL)
 
 
+def _danger_cell(pos: Tuple[float,float]) -> Tuple[int,int]:
+    return (int(pos[0] // DANGER_CELL), int(pos[1] // DANGER_CELL))
+
+
 class AgentMemory:
     """
     Per-agent memory of enemy positions, danger zones, and learned routes.
@@ -42,24 +52,58 @@ class AgentMemory:
       - Last seen position of each enemy (fades over 20 ticks)
       - Routes that led to deaths (avoid for 15 ticks)
       - Routes that led to successful kills (prefer for 10 ticks)
+
+    At most MAX_MEMORY_ENTRIES enemies are remembered; a new sighting past
+    the cap evicts the stalest entry (lowest threat on ties). Entries and
+    danger zones sit in expiry buckets so purge_stale() only touches what
+    expired, and danger zones are indexed on a coarse grid.
+
+    Hivemind-shared sightings are not copied in: `shared` is this agent's
+    view of the team blackboard, and get_last_known()/get_fresh_targets()
+    return whichever of the own entry and the shared track is newer.
     """
-    def __init__(self, owner_id: str):
+    def __init__(self, owner_id: str, shared: Optional[BlackboardView] = None):
         self.owner_id    = owner_id
+        self.shared      = shared
         self.entries:    Dict[str, MemoryEntry] = {}
-        self.danger_zones: List[Dict] = []    # {pos, radius, expires_tick}
         self.preferred_routes: List[str] = []  # landmark names
         self.avoided_routes:   List[str] = []
-        self.kill_log:   List[Dict] = []
-        self.death_log:  List[Dict] = []
+        self.kill_log:   deque = deque(maxlen=MEMORY_LOG_LIMIT)
+        self.death_log:  deque = deque(maxlen=MEMORY_LOG_LIMIT)
+        self._zones:     Dict[int, Dict] = {}      # zone id → {pos, radius, expires_tick}
+        self._zone_seq   = 0
+        self._zone_grid: Dict[Tuple[int,int], List[int]] = defaultdict(list)
+        # expiry tick → [("entry", target_id) | ("zone", zone_id)]
+        self._buckets:   Dict[int, List[Tuple[str, object]]] = defaultdict(list)
+        self._bucket_ticks: List[int] = []         # heap of bucket keys
+
+    @property
+    def danger_zones(self) -> List[Dict]:
+        return list(self._zones.values())
+
+    def _expire_at(self, tick: int, item: Tuple[str, object]):
+        if tick not in self._buckets:
+            heapq.heappush(self._bucket_ticks, tick)
+        self._buckets[tick].append(item)
+
+    def store(self, entry: MemoryEntry):
+        """Remember `entry` as the latest sighting of its target."""
+        tid = entry.target_id
+        if tid not in self.entries and len(self.entries) >= MAX_MEMORY_ENTRIES:
+            evict = min(self.entries.values(),
+                        key=lambda e: (e.seen_at_tick, e.threat_level))
+            del self.entries[evict.target_id]
+        self.entries[tid] = entry
+        self._expire_at(entry.seen_at_tick + MEMORY_TTL, ("entry", tid))
 
     def observe(self, target_id: str, pos: Tuple[float,float],
                 tick: int, threat_level: float = 0.5):
-        self.entries[target_id] = MemoryEntry(
+        self.store(MemoryEntry(
             target_id    = target_id,
             last_pos     = pos,
             seen_at_tick = tick,
             threat_level = threat_level,
-        )
+        ))
 
     def record_kill(self, victim_id: str, pos: Tuple[float,float],
                     tick: int, via_landmark: str = ""):
@@ -72,29 +116,71 @@ class AgentMemory:
     def record_death(self, pos: Tuple[float,float], tick: int,
                      near_landmark: str = ""):
         self.death_log.append({"pos":pos,"tick":tick})
-        self.danger_zones.append({
-            "pos":pos, "radius":20.0,
-            "expires_tick": tick + DANGER_ZONE_TTL
-        })
+        self._zone_seq += 1
+        zid  = self._zone_seq
+        zone = {"pos":pos, "radius":DANGER_ZONE_RADIUS,
+                "expires_tick": tick + DANGER_ZONE_TTL}
+        self._zones[zid] = zone
+        r = zone["radius"]
+        (x0, y0), (x1, y1) = _danger_cell((pos[0]-r, pos[1]-r)), _danger_cell((pos[0]+r, pos[1]+r))
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                self._zone_grid[(cx, cy)].append(zid)
+        self._expire_at(zone["expires_tick"], ("zone", zid))
         if near_landmark and near_landmark not in self.avoided_routes:
             self.avoided_routes.append(near_landmark)
 
     def is_danger_zone(self, pos: Tuple[float,float], tick: int) -> bool:
-        for zone in self.danger_zones:
+        for zid in self._zone_grid.get(_danger_cell(pos), ()):
+            zone = self._zones[zid]
             if (zone["expires_tick"] > tick and
                     dist(pos, zone["pos"]) < zone["radius"]):
                 return True
         return False
 
+    @staticmethod
+    def _from_track(track: EnemyTrack) -> MemoryEntry:
+        return MemoryEntry(track.target_id, track.pos, track.tick, SHARED_SIGHTING_THREAT)
+
     def get_last_known(self, target_id: str) -> Optional[MemoryEntry]:
-        return self.entries.get(target_id)
+        own   = self.entries.get(target_id)
+        track = self.shared.get(target_id) if self.shared is not None else None
+        if track is not None and (own is None or track.tick > own.seen_at_tick):
+            return self._from_track(track)
+        return own
 
     def get_fresh_targets(self, tick: int) -> List[MemoryEntry]:
-        return [e for e in self.entries.values() if e.is_fresh(tick)]
+        fresh = {e.target_id: e for e in self.entries.values() if e.is_fresh(tick)}
+        if self.shared is not None:
+            for track in self.shared.fresh(tick):
+                own = fresh.get(track.target_id)
+                if own is None or track.tick > own.seen_at_tick:
+                    fresh[track.target_id] = self._from_track(track)
+        return list(fresh.values())
 
     def purge_stale(self, tick: int):
-        self.entries    = {k:v for k,v in self.entries.items() if v.is_fresh(tick)}
-        self.danger_zones = [z for z in self.danger_zones if z["expires_tick"] > tick]
+        """Drop entries/zones whose expiry bucket is due (O(expired))."""
+        while self._bucket_ticks and self._bucket_ticks[0] <= tick:
+            for kind, key in self._buckets.pop(heapq.heappop(self._bucket_ticks)):
+                if kind == "entry":
+                    e = self.entries.get(key)
+                    if e is not None and not e.is_fresh(tick):
+                        del self.entries[key]
+                else:
+                    self._drop_zone(key)
+
+    def _drop_zone(self, zid: int):
+        zone = self._zones.pop(zid, None)
+        if zone is None:
+            return
+        pos, r = zone["pos"], zone["radius"]
+        (x0, y0), (x1, y1) = _danger_cell((pos[0]-r, pos[1]-r)), _danger_cell((pos[0]+r, pos[1]+r))
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = self._zone_grid[(cx, cy)]
+                cell.remove(zid)
+                if not cell:
+                    del self._zone_grid[(cx, cy)]
 
     def render(self, tick: int) -> str:
         lines = [f"  💾 Memory [{self.owner_id}]:"]
@@ -107,8 +193,8 @@ class AgentMemory:
                              f"{age}t ago  threat:{e.threat_level:.1f}")
         else:
             lines.append("    (no fresh enemy sightings)")
-        if self.danger_zones:
-            lines.append(f"    🚫 Danger zones: {len(self.danger_zones)}")
+        if self._zones:
+            lines.append(f"    🚫 Danger zones: {len(self._zones)}")
         if self.preferred_routes:
             lines.append(f"    ✅ Preferred routes: {', '.join(self.preferred_routes)}")
         return "\n".join(lines)
@@ -300,59 +386,111 @@ SPRINT_THRESHOLD    = 5      # ticks sprinting before penalty kicks in
 PENALTY_SPEED_MULT  = 0.70   # 30% speed reduction when fatigued
 STAMINA_WARN        = 25.0   # low stamina threshold
 
-@dataclass
+EV_FATIGUED   = "  😮‍💨 [{}] FATIGUED after {}t sprint! SPD −30%"
+EV_RECOVERED  = "  💪 [{}] Recovered from fatigue"
+EV_LOW_STAMINA = "  ⚠️  [{}] LOW STAMINA ({:.0f})"
+
+class StaminaPool:
+    """
+    Stamina for many agents as parallel columns (stamina, sprint ticks,
+    fatigue flags), advanced for all of them in one pass by tick_all().
+    Agents are ticked in slot order, so the low-stamina warning rolls draw
+    from `random` in the same order as per-agent ticks would.
+    """
+    def __init__(self, agent_ids=()):
+        self.slot_of:        Dict[str, int] = {}
+        self.ids:            List[str]   = []
+        self.stamina:        List[float] = []
+        self.sprinting:      List[bool]  = []
+        self.sprint_ticks:   List[int]   = []
+        self.fatigued:       List[bool]  = []
+        self.fatigued_ticks: List[int]   = []
+        self.logs:           List[EventLog] = []
+        for aid in agent_ids:
+            self.add(aid)
+
+    def add(self, owner_id: str) -> int:
+        slot = self.slot_of.get(owner_id)
+        if slot is None:
+            slot = self.slot_of[owner_id] = len(self.ids)
+            self.ids.append(owner_id)
+            self.stamina.append(MAX_STAMINA);  self.sprinting.append(False)
+            self.sprint_ticks.append(0)
+            self.fatigued.append(False);       self.fatigued_ticks.append(0)
+            self.logs.append(EventLog())
+        return slot
+
+    def _advance(self, slots, moving, sprinting, weather_drain_bonus: float) -> List[float]:
+        sta, spr, spr_t = self.stamina, self.sprinting, self.sprint_ticks
+        fat, fat_t      = self.fatigued, self.fatigued_ticks
+        sprint_drain    = SPRINT_DRAIN + weather_drain_bonus
+        rnd  = random.random
+        mults: List[float] = []
+        for i, is_moving, wants_sprint in zip(slots, moving, sprinting):
+            spr[i] = wants_sprint and is_moving
+            if spr[i]:
+                sta[i]    = max(0.0, sta[i] - sprint_drain)
+                spr_t[i] += 1
+                if spr_t[i] >= SPRINT_THRESHOLD and not fat[i]:
+                    fat[i], fat_t[i] = True, 0
+                    self.logs[i].emit(EV_FATIGUED, self.ids[i], spr_t[i])
+            elif is_moving:
+                sta[i]   = max(0.0, sta[i] - WALK_DRAIN - weather_drain_bonus)
+                spr_t[i] = max(0, spr_t[i] - 1)
+            else:
+                # Stationary: regen
+                sta[i]   = min(MAX_STAMINA, sta[i] + REGEN_RATE)
+                spr_t[i] = max(0, spr_t[i] - 2)
+                if fat[i] and sta[i] > 40:
+                    fat[i], fat_t[i] = False, 0
+                    self.logs[i].emit(EV_RECOVERED, self.ids[i])
+            if fat[i]:
+                fat_t[i] += 1
+            # Stamina warning (the roll stays even when nobody reads the log,
+            # so the shared random stream does not depend on logging)
+            if 0 < sta[i] <= STAMINA_WARN and rnd() < 0.3:
+                self.logs[i].emit(EV_LOW_STAMINA, self.ids[i], sta[i])
+            # Speed modifier
+            mults.append(PENALTY_SPEED_MULT if fat[i] else 1.35 if spr[i] else 1.0)
+        return mults
+
+    def tick_all(self, moving: List[bool], sprinting: List[bool],
+                 weather_drain_bonus: float = 0.0) -> List[float]:
+        """moving/sprinting are per-slot flags; returns per-slot speed multipliers."""
+        return self._advance(range(len(self.ids)), moving, sprinting, weather_drain_bonus)
+
+    def tick_slot(self, slot: int, is_moving: bool, sprinting: bool,
+                  weather_drain_bonus: float = 0.0) -> float:
+        return self._advance((slot,), (is_moving,), (sprinting,), weather_drain_bonus)[0]
+
+
+def _pool_column(name: str, doc: str) -> property:
+    return property(lambda self: getattr(self.pool, name)[self.slot],
+                    lambda self, v: getattr(self.pool, name).__setitem__(self.slot, v),
+                    doc=doc)
+
+
 class StaminaState:
-    owner_id:    str
-    stamina:     float = MAX_STAMINA
-    is_sprinting:bool  = False
-    sprint_ticks:int   = 0
-    is_fatigued: bool  = False
-    fatigued_ticks:int = 0
-    log: List[str] = field(default_factory=list)
+    """One agent's view onto a StaminaPool (a private pool if none is given)."""
+    stamina        = _pool_column("stamina",        "current stamina 0–100")
+    is_sprinting   = _pool_column("sprinting",      "sprinting this tick")
+    sprint_ticks   = _pool_column("sprint_ticks",   "recent sprint ticks")
+    is_fatigued    = _pool_column("fatigued",       "fatigue penalty active")
+    fatigued_ticks = _pool_column("fatigued_ticks", "ticks spent fatigued")
+
+    def __init__(self, owner_id: str, pool: Optional[StaminaPool] = None):
+        self.owner_id = owner_id
+        self.pool     = pool if pool is not None else StaminaPool()
+        self.slot     = self.pool.add(owner_id)
+
+    @property
+    def log(self) -> EventLog:
+        return self.pool.logs[self.slot]
 
     def tick(self, is_moving: bool, sprinting: bool,
              weather_drain_bonus: float = 0.0) -> float:
         """Returns current speed multiplier."""
-        self.is_sprinting = sprinting and is_moving
-
-        if self.is_sprinting:
-            drain = SPRINT_DRAIN + weather_drain_bonus
-            self.stamina    = max(0.0, self.stamina - drain)
-            self.sprint_ticks += 1
-            if self.sprint_ticks >= SPRINT_THRESHOLD and not self.is_fatigued:
-                self.is_fatigued   = True
-                self.fatigued_ticks = 0
-                self.log.append(
-                    f"  😮‍💨 [{self.owner_id}] FATIGUED after "
-                    f"{self.sprint_ticks}t sprint! SPD −30%")
-        elif is_moving:
-            self.stamina    = max(0.0, self.stamina - WALK_DRAIN - weather_drain_bonus)
-            self.sprint_ticks = max(0, self.sprint_ticks - 1)
-        else:
-            # Stationary: regen
-            old = self.stamina
-            self.stamina = min(MAX_STAMINA, self.stamina + REGEN_RATE)
-            self.sprint_ticks = max(0, self.sprint_ticks - 2)
-            if self.is_fatigued and self.stamina > 40:
-                self.is_fatigued    = False
-                self.fatigued_ticks = 0
-                self.log.append(f"  💪 [{self.owner_id}] Recovered from fatigue")
-
-        if self.is_fatigued:
-            self.fatigued_ticks += 1
-
-        # Stamina warning
-        if self.stamina <= STAMINA_WARN and self.stamina > 0:
-            if random.random() < 0.3:
-                self.log.append(
-                    f"  ⚠️  [{self.owner_id}] LOW STAMINA ({self.stamina:.0f})")
-
-        # Speed modifier
-        if self.is_fatigued:
-            return PENALTY_SPEED_MULT
-        if self.is_sprinting:
-            return 1.35  # sprint bonus
-        return 1.0
+        return self.pool.tick_slot(self.slot, is_moving, sprinting, weather_drain_bonus)
 
     def effective_speed(self, base_speed: float, is_moving: bool,
                         sprinting: bool, weather_drain: float = 0.0) -> float:
@@ -360,9 +498,7 @@ class StaminaState:
         return base_speed * mult
 
     def flush_log(self) -> List[str]:
-        out = self.log[:]
-        self.log.clear()
-        return out
+        return self.log.flush()
 
     def render(self) -> str:
         bar   = hp_bar(self.stamina, MAX_STAMINA, 12)
@@ -394,23 +530,29 @@ class HivemindState:
     log: List[str] = field(default_factory=list)
 
     def tick(self, agent_positions: Dict[str, Tuple[float,float]],
-             tick: int) -> bool:
+             tick: int, ctx: Optional[TickContext] = None) -> bool:
         self.was_active = self.active
-        positions = list(agent_positions.values())
-        ids       = list(agent_positions.keys())
 
-        if not positions:
+        if not agent_positions:
             self.active = False
             return False
 
-        centroid = midpoint(positions)
-
         # Count agents within hivemind radius of centroid
-        near = [(aid, pos) for aid, pos in agent_positions.items()
-                if dist(pos, centroid) <= HIVEMIND_RADIUS]
+        if ctx is not None:
+            centroid = ctx.centroid(self.team)
+            near     = ctx.near(centroid, HIVEMIND_RADIUS, self.team, inclusive=True)
+        else:
+            # one pass over the team's coordinate columns → distance vector
+            ids = list(agent_positions)
+            xs  = [p[0] for p in agent_positions.values()]
+            ys  = [p[1] for p in agent_positions.values()]
+            centroid = (sum(xs) / len(xs), sum(ys) / len(ys))
+            cx, cy   = centroid
+            d_to_c   = [math.sqrt((x - cx)**2 + (y - cy)**2) for x, y in zip(xs, ys)]
+            near     = [aid for aid, d in zip(ids, d_to_c) if d <= HIVEMIND_RADIUS]
 
         if len(near) >= HIVEMIND_MIN_AGENTS:
-            members = [aid for aid, _ in near]
+            members = near
             if not self.active:
                 self.active      = True
                 self.formed_tick = tick
@@ -451,6 +593,9 @@ class HivemindState:
     def is_member(self, agent_id: str) -> bool:
         return self.active and agent_id in self.member_ids
 
+    def active_members(self) -> Set[str]:
+        return set(self.member_ids) if self.active else set()
+
     def flush_log(self) -> List[str]:
         out = self.log[:]
         self.log.clear()
@@ -472,8 +617,13 @@ class HivemindState:
 class AIIntelligenceEngine:
     def __init__(self):
         all_agents = ALPHA_AGENTS + OMEGA_AGENTS
-        self.memory    = {aid: AgentMemory(aid)  for aid in all_agents}
-        self.stamina   = {aid: StaminaState(aid) for aid in all_agents}
+        # one track per enemy per team; hivemind members read it through views
+        self.blackboard = {team: TeamBlackboard(team, ttl=MEMORY_TTL)
+                           for team in ("ALPHA", "OMEGA")}
+        self.memory    = {aid: AgentMemory(aid, self.blackboard[TEAM_OF[aid]].view(aid))
+                          for aid in all_agents}
+        self.stamina_pool = StaminaPool(all_agents)
+        self.stamina   = {aid: StaminaState(aid, self.stamina_pool) for aid in all_agents}
         self.personality_engine = PersonalityDriftEngine()
         self.hivemind  = {
             "ALPHA": HivemindState("ALPHA"),
@@ -481,25 +631,41 @@ class AIIntelligenceEngine:
         }
         self.tick_num  = 0
 
-    def tick(self, agent_positions: Dict[str, Tuple[float,float]],
-             sprinting_agents: Set[str], weather_drain: float = 0.0) -> Dict:
+    def tick(self, agent_positions: Optional[Dict[str, Tuple[float,float]]] = None,
+             sprinting_agents: Optional[Set[str]] = None, weather_drain: float = 0.0,
+             ctx: Optional[TickContext] = None) -> Dict:
+        """
+        Either pass positions/sprinting/drain directly, or a shared TickContext
+        (positions, sprinting, weather stamina drain, team split and centroids
+        are then taken from it instead of being re-derived here).
+        """
         self.tick_num += 1
         results = {}
-
-        # Stamina
-        for aid, sta in self.stamina.items():
-            pos = agent_positions.get(aid)
-            moving   = pos is not None
-            sprinting= aid in sprinting_agents
-            spd_mult = sta.tick(moving, sprinting, weather_drain)
+        if ctx is not None:
+            agent_positions  = ctx.positions
+            sprinting_agents = ctx.sprinting
+            weather_drain    = ctx.weather.get("stamina_drain", weather_drain)
+        agent_positions  = agent_positions or {}
+        sprinting_agents = sprinting_agents or set()
+
+        # Stamina — every agent in one pass over the pool's columns
+        ids   = self.stamina_pool.ids
+        mults = self.stamina_pool.tick_all(
+            [agent_positions.get(aid) is not None for aid in ids],
+            [aid in sprinting_agents for aid in ids], weather_drain)
+        for aid, spd_mult in zip(ids, mults):
             results[aid] = {"speed_mult": spd_mult}
 
         # Hivemind per team
         for team in ["ALPHA","OMEGA"]:
-            team_agents = ALPHA_AGENTS if team == "ALPHA" else OMEGA_AGENTS
-            team_pos    = {aid: agent_positions[aid]
-                           for aid in team_agents if aid in agent_positions}
-            self.hivemind[team].tick(team_pos, self.tick_num)
+            if ctx is not None:
+                team_pos = ctx.team_positions(team)
+            else:
+                team_agents = ALPHA_AGENTS if team == "ALPHA" else OMEGA_AGENTS
+                team_pos    = {aid: agent_positions[aid]
+                               for aid in team_agents if aid in agent_positions}
+            self.hivemind[team].tick(team_pos, self.tick_num, ctx)
+            self.blackboard[team].purge_stale(self.tick_num)
 
         # Purge stale memories
         for mem in self.memory.values():
@@ -510,19 +676,21 @@ class AIIntelligenceEngine:
     def on_enemy_sighted(self, observer_id: str, target_id: str,
                           target_pos: Tuple[float,float],
                           observer_hp_pct: float = 1.0, target_hp_pct: float = 1.0):
-        mem = self.memory.get(observer_id)
-        if mem:
+        """
+        The observer remembers the sighting; if it is in an active hivemind
+        the sighting also goes to the team blackboard once, readable by the
+        members at this moment (no per-ally copies). They keep it for
+        MEMORY_TTL even after leaving; later joiners do not see it.
+        """
+        if observer_id in self.memory:
             threat = target_hp_pct / max(observer_hp_pct, 0.01)
-            mem.observe(target_id, target_pos, self.tick_num, threat)
-
-        # Hivemind vision share
+            self.memory[observer_id].store(
+                MemoryEntry(target_id, target_pos, self.tick_num, threat))
         team = TEAM_OF.get(observer_id, "")
-        hm = self.hivemind.get(team)
+        hm   = self.hivemind.get(team)
         if hm and hm.is_member(observer_id):
-            for ally in hm.member_ids:
-                if ally != observer_id:
-                    self.memory[ally].observe(
-                        target_id, target_pos, self.tick_num, 0.5)
+            self.blackboard[team].report(observer_id, target_id, target_pos, self.tick_num,
+                                         readers=frozenset(hm.member_ids))
 
     def on_kill(self, killer_id: str, victim_id: str,
                 kill_pos: Tuple[float, float]):
@@ -536,6 +704,11 @@ class AIIntelligenceEngine:
         self.memory[agent_id].record_death(death_pos, self.tick_num, near)
         self.personality_engine.on_own_death(agent_id)
 
+    def tone_map(self) -> Dict[str, str]:
+        """Current chat tone per agent (feeds CommsEngine auto-chatter)."""
+        return {aid: st.chat_tone()
+                for aid, st in self.personality_engine.states.items()}
+
     def flush_all_logs(self) -> List[str]:
         lines = []
         for sta in self.stamina.values():
@@ -604,3 +777,14 @@ if __name__ == "__main__":
             engine.on_death("Volt-Surge",(98.0,93.0))
 
     engine.render_full()
+
+    print("  Phase 2: Hivemind vision through the team blackboard\n")
+    for step in range(3):
+        engine.on_enemy_sighted("TerraKnight", "Voidwalker",
+                                (100.0 - 4*step, 100.0 - 3*step), 0.8, 0.6)
+        engine.tick(positions)
+    print(engine.blackboard["ALPHA"].render(engine.tick_num))
+    for aid in ALPHA_AGENTS:
+        e = engine.memory[aid].get_last_known("Voidwalker")
+        seen = f"({e.last_pos[0]:.0f},{e.last_pos[1]:.0f}) @T{e.seen_at_tick}" if e else "—"
+        print(f"    {aid:<18} sees Voidwalker: {seen}")
@@ -6,10 +6,13 @@
 """
 import random
 import math
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Optional, Dict, List, Tuple
 from shared_constants import *
 
+HISTORY_LIMIT = 512   # attack records kept in the ring buffer
+
 # ── Per-element base stats ─────────────────────────────────────────────
 ELEMENT_CRIT_STATS: Dict[str, Dict] = {
     "Fire":    {"crit_chance":0.18, "crit_mult":1.80, "dodge":0.05, "block":0.00, "parry":0.08},
@@ -22,6 +25,20 @@ ELEMENT_CRIT_STATS: Dict[str, Dict] = {
     "Dark":    {"crit_chance":0.28, "crit_mult":2.50, "dodge":0.18, "block":0.00, "parry":0.12},
 }
 
+# element → (crit_chance, crit_mult, dodge, block, parry), with resolve()'s defaults
+_ELEMENT_ROW: Dict[str, Tuple[float, float, float, float, float]] = {
+    el: (s["crit_chance"], s["crit_mult"], s["dodge"], s["block"], s["parry"])
+    for el, s in ELEMENT_CRIT_STATS.items()
+}
+_DEFAULT_ROW = (0.10, 1.5, 0.05, 0.0, 0.0)
+
+STAT_FIELDS = ("hits", "crits", "dodges", "blocks", "parries",
+               "total_dmg_dealt", "total_dmg_taken")
+
+# ── Batch outcome codes ────────────────────────────────────────────────
+HIT, CRIT, DODGE, BLOCK, PARRY = range(5)
+OUTCOME_NAMES = ("hit", "crit", "dodge", "block", "parry")
+
 @dataclass
 class CombatResult:
     raw_damage:      float
@@ -46,6 +63,34 @@ class CombatResult:
         return f"  ⚔️  Normal hit: {self.final_damage:.1f} dmg"
 
 
+@dataclass
+class BatchOutcome:
+    """Column-per-field outcome of resolve_batch(); row i is attack i."""
+    raw_damage:   List[float]
+    outcome:      List[int]     # HIT / CRIT / DODGE / BLOCK / PARRY
+    final_damage: List[float]
+    crit_mult:    List[float]
+
+    def __len__(self): return len(self.outcome)
+
+    def result(self, i: int) -> CombatResult:
+        code = self.outcome[i]
+        return CombatResult(self.raw_damage[i], self.final_damage[i],
+                            is_crit=code == CRIT, is_dodge=code == DODGE,
+                            is_block=code == BLOCK, is_parry=code == PARRY,
+                            crit_multiplier=self.crit_mult[i])
+
+
+def _column(value, n: int, name: str = "column") -> list:
+    """Broadcast a scalar (or None) to n rows; sequences must have n rows."""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return [value] * n
+    col = list(value)
+    if len(col) != n:
+        raise ValueError(f"{name} has {len(col)} entries, expected {n} (one per attack)")
+    return col
+
+
 class CritDodgeEngine:
     """
     Resolves attack outcomes including crits, dodges, blocks, and parries.
@@ -58,17 +103,35 @@ class CritDodgeEngine:
         # Streak tracking
         self.crit_streaks:  Dict[str, int] = {}   # consecutive crits
         self.dodge_streaks: Dict[str, int] = {}
-        # History
-        self.history: List[Dict] = []
-        self.stats:   Dict[str, Dict] = {}   # per agent combat stats
-
-    def _get_stats(self, agent_id: str) -> Dict:
-        if agent_id not in self.stats:
-            self.stats[agent_id] = {
-                "hits":0,"crits":0,"dodges":0,"blocks":0,"parries":0,
-                "total_dmg_dealt":0.0,"total_dmg_taken":0.0
-            }
-        return self.stats[agent_id]
+        # History (ring buffer) and per-agent counters, one array per stat
+        self.current_tick = 0
+        self.history: deque = deque(maxlen=HISTORY_LIMIT)
+        self.slot_of: Dict[str, int] = {}
+        self.agents:  List[str]      = []
+        self.counters: Dict[str, list] = {f: [] for f in STAT_FIELDS}
+
+    def _slot(self, agent_id: str) -> int:
+        slot = self.slot_of.get(agent_id)
+        if slot is None:
+            slot = self.slot_of[agent_id] = len(self.agents)
+            self.agents.append(agent_id)
+            for f, col in self.counters.items():
+                col.append(0.0 if f.startswith("total") else 0)
+        return slot
+
+    @property
+    def stats(self) -> Dict[str, Dict]:
+        """Per-agent combat stats as {agent_id: {stat: value}}."""
+        return {aid: {f: col[i] for f, col in self.counters.items()}
+                for i, aid in enumerate(self.agents)}
+
+    def set_tick(self, tick: int):
+        self.current_tick = tick
+
+    def _record(self, tick, kind, attacker_id, defender_id, raw, final):
+        self.history.append({"tick": self.current_tick if tick is None else tick,
+                             "type": kind, "attacker": attacker_id,
+                             "defender": defender_id, "raw": raw, "final": final})
 
     def add_crit_modifier(self, agent_id: str, bonus: float, source: str=""):
         self.crit_mods[agent_id] = self.crit_mods.get(agent_id, 0.0) + bonus
@@ -80,11 +143,14 @@ class CritDodgeEngine:
                 defender_id: str,  defender_element: str,
                 raw_damage: float,
                 attacker_buffs: List[str] = None,
-                defender_debuffs: List[str] = None) -> CombatResult:
+                defender_debuffs: List[str] = None,
+                tick: Optional[int] = None) -> CombatResult:
         """
         Full attack resolution pipeline:
         Dodge check → Block check → Parry check → Crit check → Damage calc
+        `tick` defaults to the engine's current_tick.
         """
+        c = self.counters
         atk_stats  = ELEMENT_CRIT_STATS.get(attacker_element, {})
         def_stats  = ELEMENT_CRIT_STATS.get(defender_element, {})
 
@@ -101,9 +167,8 @@ class CritDodgeEngine:
 
         if random.random() < dodge_chance:
             self.dodge_streaks[defender_id] = self.dodge_streaks.get(defender_id,0)+1
-            self._get_stats(defender_id)["dodges"] += 1
-            self.history.append({"tick":"?","type":"dodge","attacker":attacker_id,
-                                  "defender":defender_id,"dmg":0})
+            c["dodges"][self._slot(defender_id)] += 1
+            self._record(tick, "dodge", attacker_id, defender_id, raw_damage, 0.0)
             return CombatResult(raw_damage, 0.0, is_dodge=True,
                                 note=f"Dodge×{self.dodge_streaks[defender_id]}")
 
@@ -118,7 +183,7 @@ class CritDodgeEngine:
             if defender_element == "Earth":
                 mitigation = min(0.85, mitigation + 0.15)
             final_dmg   = raw_damage * (1 - mitigation)
-            self._get_stats(defender_id)["blocks"] += 1
+            c["blocks"][self._slot(defender_id)] += 1
             return CombatResult(raw_damage, final_dmg, is_block=True,
                                 note=f"Block {mitigation*100:.0f}% mitigated")
 
@@ -127,7 +192,7 @@ class CritDodgeEngine:
         if random.random() < parry_chance:
             # Parry returns 30–50% of incoming damage as counter-damage
             counter = raw_damage * random.uniform(0.30, 0.50)
-            self._get_stats(defender_id)["parries"] += 1
+            c["parries"][self._slot(defender_id)] += 1
             return CombatResult(raw_damage, counter, is_parry=True,
                                 note=f"Parry → counter {counter:.1f}")
 
@@ -161,20 +226,111 @@ class CritDodgeEngine:
 
         if is_crit:
             self.crit_streaks[attacker_id]  = 0
-            self._get_stats(attacker_id)["crits"] += 1
+            c["crits"][self._slot(attacker_id)] += 1
         else:
             self.crit_streaks[attacker_id] = self.crit_streaks.get(attacker_id,0)+1
 
-        self._get_stats(attacker_id)["hits"]            += 1
-        self._get_stats(attacker_id)["total_dmg_dealt"] += final_dmg
-        self._get_stats(defender_id)["total_dmg_taken"] += final_dmg
+        a = self._slot(attacker_id)
+        c["hits"][a]            += 1
+        c["total_dmg_dealt"][a] += final_dmg
+        c["total_dmg_taken"][self._slot(defender_id)] += final_dmg
 
-        self.history.append({"type":"crit" if is_crit else "hit",
-                              "attacker":attacker_id,"defender":defender_id,
-                              "raw":raw_damage,"final":final_dmg})
+        self._record(tick, "crit" if is_crit else "hit",
+                     attacker_id, defender_id, raw_damage, final_dmg)
         return CombatResult(raw_damage, final_dmg, is_crit=is_crit,
                             crit_multiplier=final_mult, note=note)
 
+    def resolve_batch(self, attacker_ids, attacker_elements,
+                      defender_ids, defender_elements,
+                      raw_damage,
+                      sharp=None, blind=None, slowed=None,
+                      tick: Optional[int] = None) -> BatchOutcome:
+        """
+        Resolve many attacks at once (e.g. one AoE hitting every target).
+        Every argument is a sequence with one entry per attack (all the same
+        length, else ValueError), or a scalar shared by all of them; sharp/blind/slowed are the attacker-buff and
+        defender-debuff flags. Same rules and odds as resolve(), but all
+        random draws for the batch are taken up front (5 per attack), so
+        the random stream differs from calling resolve() in a loop. Attacks
+        resolve in order, so crit streaks carry across a batch.
+        """
+        args = (attacker_ids, attacker_elements, defender_ids, defender_elements,
+                raw_damage, sharp, blind, slowed)
+        n    = next((len(v) for v in args
+                     if v is not None and not isinstance(v, (str, int, float, bool))), 1)
+        atk    = _column(attacker_ids, n, "attacker_ids")
+        atk_el = _column(attacker_elements, n, "attacker_elements")
+        dfn    = _column(defender_ids, n, "defender_ids")
+        def_el = _column(defender_elements, n, "defender_elements")
+        raw    = _column(raw_damage, n, "raw_damage")
+        shp, bld, slw = (_column(sharp, n, "sharp"), _column(blind, n, "blind"),
+                         _column(slowed, n, "slowed"))
+        rnd  = random.random
+        draws = [rnd() for _ in range(5 * n)]
+
+        outcome = [HIT] * n
+        final   = [0.0] * n
+        mults   = [1.0] * n
+        c = self.counters
+        for i in range(n):
+            a_id, d_id, dmg = atk[i], dfn[i], raw[i]
+            a_crit, a_mult, _, _, _        = _ELEMENT_ROW.get(atk_el[i], _DEFAULT_ROW)
+            _, _, d_dodge, d_block, d_parry = _ELEMENT_ROW.get(def_el[i], _DEFAULT_ROW)
+            u_fly, u_dodge, u_block, u_parry, u_crit = draws[5*i:5*i + 5]
+
+            dodge_chance = d_dodge + self.dodge_mods.get(d_id, 0.0)
+            if bld[i]:
+                dodge_chance *= 0.2
+            if def_el[i] == "Flying" and u_fly < 0.5:
+                dodge_chance *= 1.5
+            if u_dodge < min(dodge_chance, 0.60):
+                self.dodge_streaks[d_id] = self.dodge_streaks.get(d_id, 0) + 1
+                c["dodges"][self._slot(d_id)] += 1
+                outcome[i] = DODGE
+                self._record(tick, "dodge", a_id, d_id, dmg, 0.0)
+                continue
+            self.dodge_streaks[d_id] = 0
+
+            # a successful roll u < p leaves u/p uniform, reused as the magnitude
+            if u_block < d_block:
+                mitigation = 0.40 + 0.30 * (u_block / d_block)
+                if def_el[i] == "Earth":
+                    mitigation = min(0.85, mitigation + 0.15)
+                final[i], outcome[i] = dmg * (1 - mitigation), BLOCK
+                c["blocks"][self._slot(d_id)] += 1
+                continue
+            if u_parry < d_parry:
+                final[i], outcome[i] = dmg * (0.30 + 0.20 * (u_parry / d_parry)), PARRY
+                c["parries"][self._slot(d_id)] += 1
+                continue
+
+            crit_chance = a_crit + self.crit_mods.get(a_id, 0.0)
+            streak = self.crit_streaks.get(a_id, 0)
+            if streak >= 3:
+                crit_chance = min(0.80, crit_chance + 0.10 * (streak // 3))
+            if shp[i]: crit_chance += 0.15
+            if slw[i]: crit_chance += 0.08
+            is_crit = u_crit < min(crit_chance, 0.75)
+
+            mult = a_mult if is_crit else 1.0
+            if is_crit and atk_el[i] == "Dark":
+                mult += 0.50
+            out = dmg * mult
+            if is_crit:
+                self.crit_streaks[a_id] = 0
+                c["crits"][self._slot(a_id)] += 1
+                outcome[i] = CRIT
+            else:
+                self.crit_streaks[a_id] = streak + 1
+            a = self._slot(a_id)
+            c["hits"][a]            += 1
+            c["total_dmg_dealt"][a] += out
+            c["total_dmg_taken"][self._slot(d_id)] += out
+            final[i], mults[i] = out, mult
+            self._record(tick, OUTCOME_NAMES[outcome[i]], a_id, d_id, dmg, out)
+
+        return BatchOutcome(raw, outcome, final, mults)
+
     def render_stats(self):
         print(f"\n  ╔══ COMBAT STATS ══╗")
         print(f"  {'Agent':<18} {'Hits':>5} {'Crits':>6} {'CritRate':>9} "
@@ -208,4 +364,14 @@ if __name__ == "__main__":
             result = engine.resolve(atk_id, atk_el, def_id, def_el, dmg)
             print(f"  {atk_id} → {def_id}: {result.render()}")
 
+    print("  ── AoE: Volt-Surge chain lightning hits the whole OMEGA squad ──")
+    engine.set_tick(4)
+    aoe = engine.resolve_batch("Volt-Surge", "Thunder",
+                               list(OMEGA_AGENTS),
+                               [ELEMENT_OF[a] for a in OMEGA_AGENTS],
+                               42.0, slowed=[a == "DustSerpent" for a in OMEGA_AGENTS])
+    for i, def_id in enumerate(OMEGA_AGENTS):
+        print(f"  Volt-Surge → {def_id}: {aoe.result(i).render()}")
+
     engine.render_stats()
+    print(f"  History: {len(engine.history)} records, last at tick {engine.history[-1]['tick']}")
@@ -1,14 +1,16 @@
 """
 ╔══════════════════════════════════════════════════════════════════════════╗
-║   BACKEND — INFRASTRUCTURE: SAVE/LOAD · EVENT BUS · WEBSOCKET FEED     ║
-║   State Serialization · Pub-Sub · Async Real-Time Push                  ║
+║   BACKEND — INFRASTRUCTURE: SAVE/LOAD · EVENT BUS · WEBSOCKET · ROLLBACK ║
+║   State Serialization · Pub-Sub · Real-Time Push · Resimulation         ║
 ╚══════════════════════════════════════════════════════════════════════════╝
 """
-import json, time, asyncio, threading, queue
+import copy, heapq, io, json, os, pickle, random, time, threading, queue
 from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, Iterable, List, Optional, Callable, Any, Tuple
 from datetime import datetime
-from collections import defaultdict
+from bisect import bisect_left, bisect_right
+from collections import defaultdict, deque
+from itertools import islice
 from shared_constants import *
 
 # ─────────────────────────────────────────────────────────────────────
@@ -114,17 +116,81 @@ class FullGameState:
         )
 
 
+def _diff(old, new, path: list, ops: list):
+    """Append [path, value] / [path] (delete) ops turning `old` into `new`."""
+    if type(old) is dict and type(new) is dict:
+        for k, v in new.items():
+            if k not in old:
+                ops.append([path + [k], v])
+            else:
+                _diff(old[k], v, path + [k], ops)
+        ops.extend([path + [k]] for k in old if k not in new)
+    elif type(old) is list and type(new) is list and len(old) == len(new):
+        for i, (o, n) in enumerate(zip(old, new)):
+            _diff(o, n, path + [i], ops)
+    elif old != new:
+        ops.append([path, new])
+
+
+def _apply(doc: Dict, ops: List[list]) -> Dict:
+    for op in ops:
+        path = op[0]
+        if not path:
+            doc = op[1]
+            continue
+        node = doc
+        for key in path[:-1]:
+            node = node[key]
+        if len(op) == 1:
+            del node[path[-1]]
+        else:
+            node[path[-1]] = op[1]
+    return doc
+
+
+EV_SAVED    = "  💾 STATE SAVED: [{}] tick:{} → {} ({})"
+EV_SAVE_ERR = "  ❌ SAVE FAILED: [{}] {}: {}"
+EV_LOADED   = "  📂 STATE LOADED: [{}] tick:{} from {}"
+EV_ROLLBACK = "  ⏪ ROLLBACK to tick {} [{}]"
+EV_NO_CKPT  = "  ❌ No checkpoint at or before tick {}"
+
+CHECKPOINT_RETENTION = 32   # FullGameStates kept in memory; older ones reload from disk
+BASE_EVERY           = 10   # every Nth save is a full base, the rest deltas against it
+
+
 class SaveLoadSystem:
     """
     Serializes and deserializes full game state to/from JSON.
     Supports auto-save every N ticks and manual checkpoints.
+
+    Every BASE_EVERY-th save is a full base; the others store only the ops
+    that turn the latest base into that state. Files are compact JSON,
+    gzip'd when `compress` is on, and written by a background thread;
+    save() deep-copies the state first, so the caller's runtime dicts
+    (xp_records, controlled_points, ...) may keep changing after it
+    returns. Deltas diff against the base as written to disk, never
+    against live data. The newest CHECKPOINT_RETENTION states stay in memory;
+    every save's (tick, path) stays indexed so rollback_to() bisects and
+    reloads older ones from disk.
     """
-    def __init__(self, auto_save_interval: int = 10):
+    def __init__(self, auto_save_interval: int = 10, compress: bool = False,
+                 retention: int = CHECKPOINT_RETENTION, base_every: int = BASE_EVERY,
+                 save_dir: str = "saves"):
         self.auto_save_interval = auto_save_interval
-        self.checkpoints: List[FullGameState] = []
+        self.compress     = compress
+        self.retention    = retention
+        self.base_every   = base_every
+        self.save_dir     = save_dir
+        self.checkpoints: List[FullGameState] = []        # tick order, newest `retention`
         self.save_paths:  List[str] = []
+        self.save_index:  List[Tuple[int, str]] = []      # (tick, path) of every save, tick order
         self.tick_num:    int = 0
         self.last_auto_save: int = 0
+        self.log          = EventLog()
+        self._base: Optional[list] = None                 # [path, dict] deltas refer to
+        self._since_base  = 0
+        self._pool    = None
+        self._pending: List = []
 
     def create_state(self, tick: int,
                      alpha_data: Dict, omega_data: Dict,
@@ -178,26 +244,104 @@ class SaveLoadSystem:
             **extras
         )
 
+    # ── Writing (off the tick thread) ──────────────────────────────────
+    def _executor(self):
+        if self._pool is None:
+            from concurrent.futures import ThreadPoolExecutor   # only paid once saving starts
+            self._pool = ThreadPoolExecutor(max_workers=1,       # one writer keeps base → delta order
+                                            thread_name_prefix="saveload")
+        return self._pool
+
+    def _write(self, state: FullGameState, path: str, is_base: bool, base: Optional[list]):
+        try:
+            doc = state.to_dict()
+            if is_base:
+                record = {"kind": "base", "state": doc}
+            else:
+                ops = []
+                _diff(base[1], doc, [], ops)
+                record = {"kind": "delta", "base": base[0], "ops": ops}
+            blob = json.dumps(record, separators=(",", ":")).encode()
+            if is_base:
+                base[1] = json.loads(blob)["state"]   # detached, exactly what load() sees
+            if self.compress:
+                import gzip
+                blob = gzip.compress(blob, compresslevel=5)
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            tmp = path + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(blob)
+            os.replace(tmp, path)
+        except Exception as e:
+            emit(self.log, EV_SAVE_ERR, state.save_id, type(e).__name__, e)
+            raise
+
     def save(self, state: FullGameState,
              path: Optional[str] = None) -> str:
-        path = path or f"saves/{state.save_id}.json"
-        import os; os.makedirs("saves", exist_ok=True)
-        with open(path, "w") as f:
-            json.dump(state.to_dict(), f, indent=2)
-        self.checkpoints.append(state)
-        self.save_paths.append(path)
-        print(f"  💾 STATE SAVED: [{state.save_id}] tick:{state.tick} → {path}")
+        """Snapshot `state` and queue it for writing; returns its path immediately."""
+        state = copy.deepcopy(state)     # on the tick thread, before anything can change
+        ext  = ".json.gz" if self.compress else ".json"
+        path = path or os.path.join(self.save_dir, state.save_id + ext)
+        is_base = self._base is None or self._since_base >= self.base_every - 1
+        if is_base:
+            self._base, self._since_base = [path, None], 0   # dict filled in by the writer
+        else:
+            self._since_base += 1
+        self._pending = [f for f in self._pending if not f.done()]
+        self._pending.append(self._executor().submit(self._write, state, path,
+                                                     is_base, self._base))
+        self._remember(state, path)
+        emit(self.log, EV_SAVED, state.save_id, state.tick, path,
+             "base" if is_base else "delta")
         return path
 
+    def _remember(self, state: FullGameState, path: str):
+        i = bisect_right(self.save_index, state.tick, key=lambda e: e[0])
+        self.save_index.insert(i, (state.tick, path))
+        self.save_paths.append(path)
+        j = bisect_right(self.checkpoints, state.tick, key=_state_tick)
+        self.checkpoints.insert(j, state)
+        if len(self.checkpoints) > self.retention:
+            del self.checkpoints[:len(self.checkpoints) - self.retention]
+
+    def flush(self):
+        """Block until every queued save is on disk (re-raises write errors)."""
+        pending, self._pending = self._pending, []
+        for f in pending:
+            f.result()
+
+    def close(self):
+        self.flush()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    # ── Reading ────────────────────────────────────────────────────────
+    @staticmethod
+    def _read(path: str) -> Dict:
+        with open(path, "rb") as f:
+            blob = f.read()
+        if blob[:2] == b"\x1f\x8b":
+            import gzip
+            blob = gzip.decompress(blob)
+        return json.loads(blob)
+
     def load(self, path: str) -> FullGameState:
-        with open(path) as f:
-            data = json.load(f)
+        self.flush()
+        record = self._read(path)
+        if record.get("kind") == "delta":
+            data = _apply(self._read(record["base"])["state"], record["ops"])
+        else:
+            data = record.get("state", record)    # plain to_dict() files still load
         state = FullGameState.from_dict(data)
-        print(f"  📂 STATE LOADED: [{state.save_id}] tick:{state.tick} "
-              f"from {path}")
+        emit(self.log, EV_LOADED, state.save_id, state.tick, path)
         return state
 
+    def flush_log(self) -> List[str]:
+        return self.log.flush()
+
     def auto_save_check(self, tick: int, state_builder: Callable) -> Optional[str]:
+        """Builds the state on the caller's thread; encoding and I/O happen on the writer."""
         self.tick_num = tick
         if tick - self.last_auto_save >= self.auto_save_interval:
             state = state_builder()
@@ -207,20 +351,28 @@ class SaveLoadSystem:
         return None
 
     def list_saves(self):
-        print(f"\n  💾 Available checkpoints ({len(self.checkpoints)}):")
+        print(f"\n  💾 Available checkpoints ({len(self.save_index)}):")
         for state in self.checkpoints[-10:]:
             print(f"    [{state.save_id}] tick:{state.tick:4d}  "
                   f"ALPHA:{state.alpha.score}  OMEGA:{state.omega.score}  "
                   f"Tension:{state.map_state.tension:.1f}")
 
     def rollback_to(self, tick: int) -> Optional[FullGameState]:
-        candidates = [s for s in self.checkpoints if s.tick <= tick]
-        if candidates:
-            chosen = max(candidates, key=lambda s: s.tick)
-            print(f"  ⏪ ROLLBACK to tick {chosen.tick} [{chosen.save_id}]")
-            return chosen
-        print(f"  ❌ No checkpoint at or before tick {tick}")
-        return None
+        i = bisect_right(self.checkpoints, tick, key=_state_tick)
+        if i:
+            chosen = self.checkpoints[i - 1]
+        else:
+            k = bisect_right(self.save_index, tick, key=lambda e: e[0])
+            if not k:
+                emit(self.log, EV_NO_CKPT, tick)
+                return None
+            chosen = self.load(self.save_index[k - 1][1])   # aged out of memory
+        emit(self.log, EV_ROLLBACK, chosen.tick, chosen.save_id)
+        return chosen
+
+
+def _state_tick(state: FullGameState) -> int:
+    return state.tick
 
 
 # ─────────────────────────────────────────────────────────────────────
@@ -237,13 +389,23 @@ EVENT_TYPES = [
     "game_start", "game_end", "player_joined", "player_left",
 ]
 
+EVENT_HISTORY_LIMIT = 4096     # events kept in history; oldest drop off first
+EVENT_QUEUE_LIMIT   = 1024     # undrained feed events; oldest dropped when full
+DISPATCH_MODES      = ("sync", "batch", "thread")
+
 @dataclass
 class GameEvent:
     event_type: str
     tick:       int
-    timestamp:  str
+    created:    float              # time.time() at publish
     data:       Dict = field(default_factory=dict)
     source_id:  str  = ""
+    seq:        int  = 0
+
+    @property
+    def timestamp(self) -> str:
+        """Wall-clock time, formatted only when someone reads it."""
+        return datetime.fromtimestamp(self.created).strftime("%H:%M:%S.%f")[:12]
 
     def render(self) -> str:
         return (f"  📡 [{self.timestamp}] T{self.tick:03d} "
@@ -251,47 +413,144 @@ class GameEvent:
                 f"data:{self.data}")
 
 
+class _TickIndex:
+    """
+    Events of one stream in publish order. While ticks never go backwards
+    `since()` bisects; a late event with an older tick falls back to a scan.
+    """
+    __slots__ = ("events", "head", "ordered")
+
+    def __init__(self):
+        self.events: List[GameEvent] = []
+        self.head    = 0        # events[:head] already evicted from history
+        self.ordered = True
+
+    def add(self, evt: GameEvent):
+        if self.ordered and len(self.events) > self.head and evt.tick < self.events[-1].tick:
+            self.ordered = False
+        self.events.append(evt)
+
+    def drop_oldest(self):
+        self.head += 1
+        if self.head >= 64 and self.head * 2 >= len(self.events):
+            del self.events[:self.head]
+            self.head = 0
+            if not self.ordered:    # the out-of-order event may have aged out
+                self.ordered = all(a.tick <= b.tick
+                                   for a, b in zip(self.events, self.events[1:]))
+
+    def since(self, tick: int) -> List[GameEvent]:
+        if self.ordered:
+            i = bisect_left(self.events, tick, lo=self.head, key=_event_tick)
+            return self.events[i:]
+        return [e for e in self.events[self.head:] if e.tick >= tick]
+
+    def between(self, start: int, end: int) -> List[GameEvent]:
+        if self.ordered:
+            i = bisect_left(self.events, start, lo=self.head, key=_event_tick)
+            j = bisect_right(self.events, end, lo=i, key=_event_tick)
+            return self.events[i:j]
+        return [e for e in self.events[self.head:] if start <= e.tick <= end]
+
+    def last(self, n: int) -> List[GameEvent]:
+        return self.events[max(self.head, len(self.events) - n):]
+
+
+def _event_tick(evt: GameEvent) -> int:
+    return evt.tick
+
+
 class EventBus:
     """
     Central pub-sub event bus.
     All backends subscribe to relevant events.
-    When an event fires, all subscribers are notified.
+
+    dispatch="sync"   every subscriber runs inside publish() (default)
+    dispatch="batch"  publish() only records; flush() — called by
+                      advance_tick() — hands each subscriber its events for
+                      the tick in one go
+    dispatch="thread" like batch, but each subscriber's batch runs on a
+                      thread pool and advance_tick() does not wait for it.
+                      A callback never runs on two workers at once and sees
+                      its batches in publish order; different callbacks run
+                      concurrently (shared state must be thread-safe)
+
+    subscribe(..., batch=True) callbacks receive a List[GameEvent] per
+    flush instead of one call per event. History is a ring buffer of
+    EVENT_HISTORY_LIMIT events indexed by type and tick; the feed queue is
+    bounded and emptied with drain().
     """
-    def __init__(self):
+    def __init__(self, dispatch: str = "sync", max_workers: int = 4,
+                 history_limit: int = EVENT_HISTORY_LIMIT,
+                 queue_limit: int = EVENT_QUEUE_LIMIT):
+        if dispatch not in DISPATCH_MODES:
+            raise ValueError(f"dispatch must be one of {DISPATCH_MODES}, got {dispatch!r}")
+        self.dispatch     = dispatch
+        self.max_workers  = max_workers
         self.subscribers: Dict[str, List[Callable]] = defaultdict(list)
-        self.event_queue: queue.Queue = queue.Queue()
-        self.history:     List[GameEvent] = []
+        self.batch_subscribers: Dict[str, List[Callable]] = defaultdict(list)
+        self.event_queue: queue.Queue = queue.Queue(maxsize=queue_limit)
+        self.history:     deque = deque(maxlen=history_limit)
         self.tick_num:    int = 0
         self.stats:       Dict[str, int] = defaultdict(int)
+        self.total_published = 0
+        self.queue_dropped   = 0
+        self._by_type: Dict[str, _TickIndex] = defaultdict(_TickIndex)
+        self._all     = _TickIndex()
+        self._pending: List[GameEvent] = []
+        self._pool = None
+        self._lanes: Dict[Callable, deque] = {}    # thread mode: queued jobs per callback
+        self._lane_lock = threading.Lock()
+        self._lane_idle = threading.Condition(self._lane_lock)
 
     def subscribe(self, event_type: str, callback: Callable,
-                  subscriber_name: str = ""):
+                  subscriber_name: str = "", batch: bool = False):
         """Subscribe a callback to an event type. Use '*' for all events."""
-        self.subscribers[event_type].append(callback)
+        (self.batch_subscribers if batch else self.subscribers)[event_type].append(callback)
 
-    def subscribe_all(self, callback: Callable):
-        self.subscribers["*"].append(callback)
+    def subscribe_all(self, callback: Callable, batch: bool = False):
+        self.subscribe("*", callback, batch=batch)
 
     def publish(self, event_type: str, source_id: str = "",
                 tick: Optional[int] = None, **data):
-        """Fire an event — immediately calls all subscribers."""
-        ts  = datetime.now().strftime("%H:%M:%S.%f")[:12]
+        """Record an event; sync mode notifies subscribers immediately."""
+        self.total_published += 1
         evt = GameEvent(
             event_type = event_type,
             tick       = tick or self.tick_num,
-            timestamp  = ts,
+            created    = time.time(),
             data       = data,
             source_id  = source_id,
+            seq        = self.total_published,
         )
-        self.history.append(evt)
+        self._record(evt)
         self.stats[event_type] += 1
 
+        if self.dispatch == "sync":
+            self._notify(evt)
+        else:
+            self._pending.append(evt)
+
+        # Also enqueue for WebSocket feed
+        self._enqueue(evt)
+        return evt
+
+    def _record(self, evt: GameEvent):
+        if len(self.history) == self.history.maxlen:
+            oldest = self.history[0]
+            self._by_type[oldest.event_type].drop_oldest()
+            self._all.drop_oldest()
+        self.history.append(evt)
+        self._by_type[evt.event_type].add(evt)
+        self._all.add(evt)
+
+    def _notify(self, evt: GameEvent):
         # Notify direct subscribers
-        for cb in self.subscribers.get(event_type, []):
+        for cb in self.subscribers.get(evt.event_type, []):
             try:
                 cb(evt)
             except Exception as e:
-                print(f"  ⚠️  EventBus callback error [{event_type}]: {e}")
+                print(f"  ⚠️  EventBus callback error [{evt.event_type}]: {e}")
 
         # Notify wildcard subscribers
         for cb in self.subscribers.get("*", []):
@@ -300,58 +559,169 @@ class EventBus:
             except Exception as e:
                 print(f"  ⚠️  EventBus wildcard error: {e}")
 
-        # Also enqueue for WebSocket feed
-        self.event_queue.put(evt)
-        return evt
+        for key in (evt.event_type, "*"):
+            for cb in self.batch_subscribers.get(key, []):
+                self._deliver(cb, [evt], True, key)
+
+    @staticmethod
+    def _deliver(cb: Callable, events: List[GameEvent], batch: bool, key: str):
+        if batch:
+            try:
+                cb(events)
+            except Exception as e:
+                print(f"  ⚠️  EventBus batch callback error [{key}]: {e}")
+            return
+        for evt in events:
+            try:
+                cb(evt)
+            except Exception as e:
+                print(f"  ⚠️  EventBus callback error [{evt.event_type}]: {e}")
+
+    def _enqueue(self, evt: GameEvent):
+        try:
+            self.event_queue.put_nowait(evt)
+        except queue.Full:
+            try:
+                self.event_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self.event_queue.put_nowait(evt)
+            self.queue_dropped += 1
+
+    def drain(self, max_items: Optional[int] = None) -> List[GameEvent]:
+        """Take (up to `max_items`) queued feed events, oldest first."""
+        out: List[GameEvent] = []
+        while max_items is None or len(out) < max_items:
+            try:
+                out.append(self.event_queue.get_nowait())
+            except queue.Empty:
+                break
+        return out
+
+    # ── Batched dispatch ───────────────────────────────────────────────
+    def _executor(self):
+        if self._pool is None:
+            from concurrent.futures import ThreadPoolExecutor   # only paid in thread mode
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers,
+                                            thread_name_prefix="eventbus")
+        return self._pool
+
+    def flush(self, wait: bool = True) -> int:
+        """
+        Deliver everything published since the last flush: one job per
+        subscriber holding its events in publish order. Returns events
+        delivered (or queued for delivery, in thread mode with wait=False).
+        """
+        pending, self._pending = self._pending, []
+        jobs: Dict[Tuple[Callable, bool], List[GameEvent]] = {}
+        for evt in pending:
+            for key in (evt.event_type, "*"):
+                for cb in self.subscribers.get(key, ()):
+                    jobs.setdefault((cb, False), []).append(evt)
+                for cb in self.batch_subscribers.get(key, ()):
+                    jobs.setdefault((cb, True), []).append(evt)
+
+        if self.dispatch == "thread":
+            for (cb, batch), events in jobs.items():
+                self._submit(cb, (cb, events, batch, events[0].event_type))
+            if wait:
+                self.wait_idle()
+        else:
+            for (cb, batch), events in jobs.items():
+                self._deliver(cb, events, batch, events[0].event_type)
+        return len(pending)
+
+    def _submit(self, cb: Callable, job: Tuple):
+        """Queue `job` on cb's lane; a lane runs on at most one worker at a time."""
+        with self._lane_lock:
+            lane = self._lanes.setdefault(cb, deque())
+            lane.append(job)
+            if len(lane) > 1:
+                return          # that worker picks this batch up next
+        self._executor().submit(self._run_lane, cb, lane)
+
+    def _run_lane(self, cb: Callable, lane: deque):
+        while True:
+            self._deliver(*lane[0])
+            with self._lane_lock:
+                lane.popleft()
+                if not lane:
+                    del self._lanes[cb]
+                    self._lane_idle.notify_all()
+                    return
+
+    def wait_idle(self):
+        """Block until every queued thread-mode delivery has run."""
+        with self._lane_lock:
+            self._lane_idle.wait_for(lambda: not self._lanes)
+
+    def close(self):
+        self.flush()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
 
     def advance_tick(self, tick: int):
+        self.flush(wait=False)  # previous tick's batch (no-op in sync mode)
         self.tick_num = tick
         self.publish("tick", "ENGINE", tick=tick)
 
+    # ── Queries (history window only) ──────────────────────────────────
     def get_events(self, event_type: str,
                    since_tick: int = 0) -> List[GameEvent]:
-        return [e for e in self.history
-                if e.event_type == event_type and e.tick >= since_tick]
+        index = self._by_type.get(event_type)
+        return index.since(since_tick) if index is not None else []
+
+    def events_between(self, start_tick: int, end_tick: int,
+                       event_type: Optional[str] = None) -> List[GameEvent]:
+        index = self._all if event_type is None else self._by_type.get(event_type)
+        return index.between(start_tick, end_tick) if index is not None else []
 
     def render_stats(self):
         print(f"\n  ╔══ EVENT BUS STATS ══╗")
-        print(f"  Total events fired: {len(self.history)}")
+        print(f"  Total events fired: {self.total_published}")
         for etype, count in sorted(self.stats.items(), key=lambda x: x[1], reverse=True):
             bar = "█" * min(count, 30)
             print(f"  {etype:<22} {count:5d}  {bar}")
 
     def render_recent(self, n: int = 10, event_type: Optional[str] = None):
-        events = self.history
-        if event_type:
-            events = [e for e in events if e.event_type == event_type]
+        index = self._all if event_type is None else self._by_type.get(event_type, _TickIndex())
         print(f"\n  ╔══ RECENT EVENTS {'('+event_type+')' if event_type else ''} ══╗")
-        for evt in events[-n:]:
+        for evt in index.last(n):
             print(evt.render())
 
 
 # ─────────────────────────────────────────────────────────────────────
-#  3. WEBSOCKET REAL-TIME FEED  (simulation layer)
+#  3. WEBSOCKET REAL-TIME FEED
 # ─────────────────────────────────────────────────────────────────────
 
-# Note: In production, replace with `websockets` or `fastapi` WebSocket.
-# This module simulates the push feed with an async queue system.
+WS_CHANNELS     = ("broadcast", "team_alpha", "team_omega", "spectator")
+WS_REPLAY_LIMIT = 256     # frames kept per channel for reconnecting clients
 
 @dataclass
 class WsMessage:
-    msg_type:  str    # "state_update"|"event"|"chat"|"alert"|"tick"
+    msg_type:  str    # "state_update"|"event"|"chat"|"alert"|"tick"|"game_state"
     payload:   Dict
     tick:      int
     timestamp: str
     channel:   str = "broadcast"  # broadcast|team_alpha|team_omega|spectator
+    seq:       int = 0            # per-channel sequence number (resume point)
+    order:     int = 0            # feed-wide send order
+    meta:      Dict = field(default_factory=dict, repr=False)   # extra frame keys (battle_id)
+    wire:      str = field(default="", repr=False)   # JSON, built once on push
 
     def to_json(self) -> str:
-        return json.dumps({
-            "type":      self.msg_type,
-            "tick":      self.tick,
-            "timestamp": self.timestamp,
-            "channel":   self.channel,
-            "payload":   self.payload,
-        })
+        if not self.wire:
+            self.wire = json.dumps({
+                "type":      self.msg_type,
+                **self.meta,
+                "tick":      self.tick,
+                "timestamp": self.timestamp,
+                "channel":   self.channel,
+                "seq":       self.seq,
+                "data":      self.payload,
+            })
+        return self.wire
 
     def render(self) -> str:
         return (f"  📤 WS [{self.channel:<12}] T{self.tick:03d} "
@@ -359,19 +729,54 @@ class WsMessage:
                 f"{str(self.payload)[:60]}...")
 
 
+class _WsChannel:
+    __slots__ = ("name", "seq", "replay", "clients")
+
+    def __init__(self, name: str, replay_limit: int):
+        self.name    = name
+        self.seq     = 0
+        self.replay: deque = deque(maxlen=replay_limit)
+        self.clients: Dict = {}     # client → seq it joined at (earlier frames came by replay)
+
+    def since(self, seq: int) -> Tuple[List[WsMessage], bool]:
+        """Frames after `seq`; False if some were already out of the buffer."""
+        if not self.replay:
+            return [], seq >= self.seq
+        first = self.replay[0].seq
+        return (list(islice(self.replay, max(0, seq + 1 - first), None)),
+                seq >= first - 1)
+
+
 class WebSocketFeed:
     """
-    Simulates a WebSocket server that pushes game events to clients.
-    In production, connect to FastAPI/websockets library.
-    Channels: broadcast (all), team_alpha, team_omega, spectator
+    Pushes game events to WebSocket clients.
+    Channels: broadcast (all), team_alpha, team_omega, spectator.
+
+    Every client is in `broadcast` plus at most one other channel. A push is
+    serialized once and queued with its channel; `flush_async()` sends each
+    queued frame to that channel's clients and drops the ones that fail.
+    Clients only need an async `send_text(str)` (FastAPI/Starlette
+    WebSocket). Each channel numbers its frames and keeps the last
+    WS_REPLAY_LIMIT of them, so a reconnecting client passes its last seen
+    seq per channel to attach() and gets the gap replayed before any live
+    frame. `frame_meta` keys (e.g. battle_id) go into every frame.
     """
-    def __init__(self, event_bus: EventBus):
+    def __init__(self, event_bus: Optional[EventBus] = None,
+                 replay_limit: int = WS_REPLAY_LIMIT,
+                 frame_meta: Optional[Dict] = None):
         self.event_bus    = event_bus
-        self.message_log: List[WsMessage] = []
+        self.frame_meta   = dict(frame_meta or {})
         self.tick_num:    int = 0
-        self.connected_clients: Dict[str, List[str]] = defaultdict(list)
+        self.channels: Dict[str, _WsChannel] = {
+            ch: _WsChannel(ch, replay_limit) for ch in WS_CHANNELS}
         self.msg_seq:     int = 0
-        self._setup_subscriptions()
+        self.channel_counts: Dict[str, int] = defaultdict(int)
+        self.type_counts:    Dict[str, int] = defaultdict(int)
+        self.outbox: deque = deque(maxlen=replay_limit)   # (channel, seq, frame) awaiting send
+        self._lock = threading.Lock()
+        self._flushing = False
+        if event_bus is not None:
+            self._setup_subscriptions()
 
     def _setup_subscriptions(self):
         """Wire event bus events to WebSocket push messages."""
@@ -407,13 +812,23 @@ class WebSocketFeed:
 
     def _push(self, msg_type: str, payload: Dict,
               tick: int, channel: str):
-        self.msg_seq += 1
-        ts  = datetime.now().strftime("%H:%M:%S")
-        msg = WsMessage(msg_type, payload, tick, ts, channel)
-        self.message_log.append(msg)
-        # In production: await websocket.send(msg.to_json())
+        ch = self.channels[channel]
+        ts = datetime.now().strftime("%H:%M:%S")
+        with self._lock:        # bus callbacks may push from worker threads
+            ch.seq       += 1
+            self.msg_seq += 1
+            msg = WsMessage(msg_type, payload, tick, ts, channel, ch.seq, self.msg_seq,
+                            self.frame_meta)
+            ch.replay.append(msg)
+            self.channel_counts[channel] += 1
+            self.type_counts[msg_type]   += 1
+            if ch.clients:
+                self.outbox.append((channel, msg.seq, msg.to_json()))
         return msg
 
+    def push(self, msg_type: str, payload: Dict, channel: str = "broadcast"):
+        return self._push(msg_type, payload, self.tick_num, channel)
+
     def push_chat(self, sender: str, message: str,
                   channel: str = "broadcast"):
         self._push("chat", {"sender": sender, "message": message},
@@ -428,45 +843,300 @@ class WebSocketFeed:
                              channel: str = "broadcast"):
         self._push("state_update", state_data, self.tick_num, channel)
 
+    # ── Transport ──────────────────────────────────────────────────────
+    def _names(self, channel: str) -> List[str]:
+        if channel not in self.channels:
+            raise ValueError(f"unknown channel {channel!r}; expected one of {WS_CHANNELS}")
+        return ["broadcast"] if channel == "broadcast" else ["broadcast", channel]
+
+    def backlog(self, channel: str,
+                resume: Dict[str, int]) -> Tuple[List[WsMessage], bool]:
+        """
+        Frames after `resume` ({channel: last seen seq}) on broadcast
+        (+ `channel`) in send order, and whether the replay is complete
+        (False → some already left the buffer; the client must resync).
+        """
+        backlog, complete = [], True
+        with self._lock:
+            for name in self._names(channel):
+                if name in resume:
+                    msgs, ok = self.channels[name].since(resume[name])
+                    backlog.append(msgs)
+                    complete = complete and ok
+        return list(heapq.merge(*backlog, key=lambda m: m.order)), complete
+
+    def register(self, client, channel: str = "broadcast"):
+        """Add `client` to broadcast (+ `channel`); it gets every later flush."""
+        for name in self._names(channel):
+            ch = self.channels[name]
+            ch.clients[client] = ch.seq
+
+    async def attach(self, client, channel: str = "broadcast",
+                     resume: Optional[Dict[str, int]] = None) -> bool:
+        """
+        Replay what `client` missed, then register it. The backlog is
+        re-read until nothing new arrived during the sends, and the client
+        is registered with no await in between, so live frames can neither
+        overtake the replay nor fall into the gap. Returns False (after
+        sending a resync notice) when the replay was incomplete.
+        """
+        names    = self._names(channel)
+        complete = True
+        if resume:
+            # channels the client did not list start from now
+            cursor = {name: resume.get(name, self.channels[name].seq) for name in names}
+            msgs, complete = self.backlog(channel, cursor)
+            if not complete:
+                # gap older than the replay buffer; the next full state covers it
+                cursor = {name: self.channels[name].seq for name in names}
+                await client.send_text(json.dumps(
+                    {"type": "resync", **self.frame_meta, "seq": cursor}))
+                msgs, _ = self.backlog(channel, cursor)
+            while msgs:
+                for m in msgs:
+                    await client.send_text(m.to_json())
+                    cursor[m.channel] = m.seq
+                msgs, _ = self.backlog(channel, cursor)     # pushed while we sent
+        self.register(client, channel)
+        return complete
+
+    def disconnect(self, client):
+        for ch in self.channels.values():
+            ch.clients.pop(client, None)
+
+    @property
+    def client_count(self) -> int:
+        return len(self.channels["broadcast"].clients)
+
+    async def flush_async(self) -> int:
+        """
+        Send queued frames; each is serialized once and fanned out per
+        channel. One flusher at a time drains the outbox, so concurrent
+        callers cannot reorder frames for a client.
+        """
+        if self._flushing:
+            return 0            # the running flush picks up what we queued
+        self._flushing = True
+        try:
+            return await self._drain_outbox()
+        finally:
+            self._flushing = False
+
+    async def _drain_outbox(self) -> int:
+        import asyncio
+        sent = 0
+        while self.outbox:
+            channel, seq, frame = self.outbox.popleft()
+            clients = [c for c, joined in self.channels[channel].clients.items()
+                       if joined < seq]
+            if not clients:
+                continue
+            results = await asyncio.gather(*(c.send_text(frame) for c in clients),
+                                           return_exceptions=True)
+            for client, res in zip(clients, results):
+                if isinstance(res, Exception):
+                    self.disconnect(client)
+                else:
+                    sent += 1
+        return sent
+
+    # ── Queries (replay window only) ───────────────────────────────────
+    def messages(self, channel: Optional[str] = None) -> List[WsMessage]:
+        """Buffered messages in send order, for one channel (+ broadcast) or all."""
+        if channel is None:
+            streams = [ch.replay for ch in self.channels.values()]
+        else:
+            streams = [self.channels["broadcast"].replay]
+            if channel != "broadcast":
+                streams.append(self.channels[channel].replay)
+        return list(heapq.merge(*streams, key=lambda m: m.order))
+
     def get_messages_for(self, channel: str,
                           since_tick: int = 0) -> List[WsMessage]:
-        return [m for m in self.message_log
-                if (m.channel == channel or m.channel == "broadcast")
-                and m.tick >= since_tick]
+        return [m for m in self.messages(channel) if m.tick >= since_tick]
 
     def render_message_log(self, channel: Optional[str] = None,
                             last_n: int = 20):
-        msgs = self.message_log
-        if channel:
-            msgs = [m for m in msgs
-                    if m.channel in (channel, "broadcast")]
+        msgs = self.messages(channel)
         print(f"\n  ╔══ WEBSOCKET FEED {'['+channel+']' if channel else '[ALL]'} ══╗")
-        print(f"  Total messages: {len(self.message_log)}  "
+        print(f"  Total messages: {self.msg_seq}  "
               f"Seq: {self.msg_seq}")
         for m in msgs[-last_n:]:
             print(m.render())
 
     def render_channel_stats(self):
-        from collections import Counter
-        channels = Counter(m.channel for m in self.message_log)
-        msg_types = Counter(m.msg_type for m in self.message_log)
         print(f"\n  📊 WebSocket Channel Stats:")
-        for ch, count in channels.most_common():
+        for ch, count in sorted(self.channel_counts.items(), key=lambda x: -x[1]):
             print(f"    {ch:<15} {count:4d} messages")
         print(f"  📊 Message Types:")
-        for mt, count in msg_types.most_common():
+        for mt, count in sorted(self.type_counts.items(), key=lambda x: -x[1]):
             print(f"    {mt:<20} {count:4d}")
 
 
+# ─────────────────────────────────────────────────────────────────────
+#  4. ROLLBACK / RESIMULATION  (live engine state)
+# ─────────────────────────────────────────────────────────────────────
+
+ROLLBACK_INTERVAL = 5     # ticks between live-state snapshots
+ROLLBACK_WINDOW   = 24    # snapshots kept (≈ interval × window ticks of rewind)
+
+@dataclass
+class LiveSnapshot:
+    tick: int
+    blob: bytes    # pickled root state; roots and shared tables are references, not copies
+    rng:  tuple    # random.getstate() at the start of `tick`
+
+
+class _SnapshotPickler(pickle.Pickler):
+    def __init__(self, file, refs: Dict[int, tuple]):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.refs = refs
+
+    def persistent_id(self, obj):
+        return self.refs.get(id(obj))
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    def __init__(self, file, objects: Dict[tuple, object]):
+        super().__init__(file)
+        self.objects = objects
+
+    def persistent_load(self, pid):
+        return self.objects[pid]
+
+
+class RollbackEngine:
+    """
+    Rewindable live state for a set of root objects (BattleArena, Intel
+    engines, controllers …) plus the global `random` stream.
+
+    Every `interval` ticks the roots' attributes are pickled into one
+    immutable LiveSnapshot; references back to a root and to `shared`
+    read-only tables (ability lists, zone objects) are stored as ids, so a
+    snapshot holds only mutable state and any number of restores can read
+    it. restore() rebuilds the roots in place, so outside references to the
+    roots stay valid (references to their inner objects do not — keep
+    controllers as roots too). `exclude` names per-root attributes that
+    live outside the timeline (sockets, thread pools) and are left alone.
+
+    `step(tick, inputs)` runs one tick. Inputs go through advance() and
+    are logged, so resimulate() can rewind to the snapshot at or before a
+    tick, splice in late/corrected inputs and replay deterministically up
+    to the present; what_if() does the same on a throwaway branch.
+    """
+    def __init__(self, roots: Dict[str, object], step: Callable[[int, list], Any],
+                 interval: int = ROLLBACK_INTERVAL, window: int = ROLLBACK_WINDOW,
+                 shared: Iterable = (), exclude: Optional[Dict[str, Iterable[str]]] = None,
+                 start_tick: int = 0):
+        self.roots     = roots
+        self.step      = step
+        self.interval  = interval
+        self.tick      = start_tick
+        self.snapshots: deque = deque(maxlen=window)       # tick order
+        self.inputs:   Dict[int, list] = {}
+        self.exclude   = {name: set(attrs) for name, attrs in (exclude or {}).items()}
+        self._objects: Dict[tuple, object] = {("root", n): r for n, r in roots.items()}
+        for i, obj in enumerate(shared):
+            self._objects[("shared", i)] = obj
+        self._refs = {id(obj): pid for pid, obj in self._objects.items()}
+
+    # ── Snapshots ──────────────────────────────────────────────────────
+    def snapshot(self) -> LiveSnapshot:
+        state = {name: {k: v for k, v in vars(root).items()
+                        if k not in self.exclude.get(name, ())}
+                 for name, root in self.roots.items()}
+        buf = io.BytesIO()
+        _SnapshotPickler(buf, self._refs).dump(state)
+        return LiveSnapshot(self.tick, buf.getvalue(), random.getstate())
+
+    def restore(self, snap: LiveSnapshot):
+        state = _SnapshotUnpickler(io.BytesIO(snap.blob), self._objects).load()
+        for name, root in self.roots.items():
+            attrs = vars(root)
+            keep  = {k: attrs[k] for k in self.exclude.get(name, ()) if k in attrs}
+            attrs.clear()
+            attrs.update(state[name])
+            attrs.update(keep)
+        random.setstate(snap.rng)
+        self.tick = snap.tick
+
+    def _run_tick(self):
+        if self.tick % self.interval == 0 and (
+                not self.snapshots or self.snapshots[-1].tick < self.tick):
+            self.snapshots.append(self.snapshot())
+            oldest = self.snapshots[0].tick
+            for t in [t for t in self.inputs if t < oldest]:
+                del self.inputs[t]
+        result = self.step(self.tick, self.inputs.get(self.tick, []))
+        self.tick += 1
+        return result
+
+    def advance(self, inputs: Optional[list] = None):
+        """Run the current tick with `inputs` (logged for replay)."""
+        if inputs:
+            self.inputs[self.tick] = list(inputs)
+        return self._run_tick()
+
+    # ── Rewind ─────────────────────────────────────────────────────────
+    def rollback_to(self, tick: int) -> Optional[LiveSnapshot]:
+        """Restore the newest snapshot at or before `tick`; later ones are dropped."""
+        ticks = [s.tick for s in self.snapshots]
+        i = bisect_right(ticks, tick)
+        if not i:
+            return None
+        while len(self.snapshots) > i:
+            self.snapshots.pop()
+        snap = self.snapshots[-1]
+        self.restore(snap)
+        return snap
+
+    def resimulate(self, from_tick: int,
+                   corrections: Optional[Dict[int, list]] = None) -> List:
+        """
+        Rewind to `from_tick` (or the snapshot before it), replace the
+        logged inputs of the ticks in `corrections`, and replay back to the
+        present. Returns the step results of the replayed ticks.
+        """
+        present = self.tick
+        for t, inputs in (corrections or {}).items():
+            self.inputs[t] = list(inputs)
+        if self.rollback_to(from_tick) is None:
+            raise ValueError(f"tick {from_tick} is older than the rollback window")
+        return [self._run_tick() for _ in range(present - self.tick)]
+
+    def what_if(self, from_tick: int, inputs: Dict[int, list], until: Optional[int] = None,
+                probe: Optional[Callable[[], Any]] = None) -> Any:
+        """
+        Replay from `from_tick` to `until` (default: now) with `inputs`
+        overriding the log, return `probe()` (or the step results), then
+        put the real timeline back exactly as it was.
+        """
+        here      = self.snapshot()
+        saved_log = dict(self.inputs)
+        saved_snaps = list(self.snapshots)
+        until = self.tick if until is None else until
+        try:
+            self.inputs.update({t: list(v) for t, v in inputs.items()})
+            if self.rollback_to(from_tick) is None:
+                raise ValueError(f"tick {from_tick} is older than the rollback window")
+            results = [self._run_tick() for _ in range(until - self.tick)]
+            return probe() if probe is not None else results
+        finally:
+            self.restore(here)
+            self.inputs = saved_log
+            self.snapshots.clear()
+            self.snapshots.extend(saved_snaps)
+
+
 # ─────────────────────────────────────────────────────────────────────
 #  INFRASTRUCTURE ENGINE  (ties all three together)
 # ─────────────────────────────────────────────────────────────────────
 
 class InfrastructureEngine:
-    def __init__(self):
-        self.event_bus   = EventBus()
+    def __init__(self, dispatch: str = "sync", save_dir: str = "saves"):
+        self.event_bus   = EventBus(dispatch=dispatch)
         self.ws_feed     = WebSocketFeed(self.event_bus)
-        self.save_system = SaveLoadSystem(auto_save_interval=10)
+        self.save_system = SaveLoadSystem(auto_save_interval=10, save_dir=save_dir)
         self.tick_num    = 0
 
     def tick(self, tick: int):
@@ -477,6 +1147,10 @@ class InfrastructureEngine:
     def fire(self, event_type: str, source_id: str = "", **data):
         return self.event_bus.publish(event_type, source_id, **data)
 
+    def close(self):
+        self.event_bus.close()
+        self.save_system.close()
+
     def render_all(self):
         self.event_bus.render_stats()
         self.ws_feed.render_message_log(last_n=15)
@@ -486,8 +1160,10 @@ class InfrastructureEngine:
 
 # ── Demo ──────────────────────────────────────────────────────────────
 if __name__ == "__main__":
+    import shutil, tempfile
     print("╔══ INFRASTRUCTURE ENGINE DEMO ══╗\n")
-    infra = InfrastructureEngine()
+    save_dir = tempfile.mkdtemp(prefix="infra_saves_")   # keep demo saves out of the tree
+    infra = InfrastructureEngine(save_dir=save_dir)
 
     # Wire up example subscribers
     kill_log = []
@@ -555,6 +1231,7 @@ if __name__ == "__main__":
                 }
             )
             infra.save_system.save(dummy_state)
+            for line in infra.save_system.flush_log(): print(line)
 
         # Push chat via WS
         if t == 8:
@@ -570,4 +1247,73 @@ if __name__ == "__main__":
     for line in cap_log:  print(f"    {line}")
 
     infra.render_all()
+    saves = infra.save_system
+    back  = saves.rollback_to(15)
+    again = saves.load(saves.save_paths[-1])          # delta → base + ops
+    for line in saves.flush_log(): print(line)
+    print(f"  Delta reload matches: {again.to_dict() == saves.checkpoints[-1].to_dict()}  "
+          f"rollback(15) → tick {back.tick}")
+    infra.close()
+    shutil.rmtree(save_dir, ignore_errors=True)
     print()
+
+    # Batched bus: a slow subscriber gets one call per tick, off-thread
+    print("  Batched thread-pool bus, 200 ticks × 5 events, history capped at 256\n")
+    bus = EventBus(dispatch="thread", history_limit=256, queue_limit=64)
+    calls, seen = [], []
+    def slow_tally(events):
+        time.sleep(0.001)
+        calls.append(len(events))
+    bus.subscribe("kill", slow_tally, "tally", batch=True)
+    bus.subscribe("kill", lambda e: seen.append(e.seq))
+    for t in range(1, 201):
+        bus.advance_tick(t)
+        for k in range(5):
+            bus.publish("kill", "Ignis-Prime", victim=f"Mob_{k:03d}")
+    bus.close()
+    feed = bus.drain()
+    print(f"  Published {bus.total_published}  delivered kills {len(seen)} "
+          f"in {len(calls)} batch calls")
+    print(f"  History {len(bus.history)}/{bus.history.maxlen}  "
+          f"kills since T190: {len(bus.get_events('kill', since_tick=190))}  "
+          f"T195–T196 all: {len(bus.events_between(195, 196))}")
+    print(f"  Drained {len(feed)} feed events (dropped {bus.queue_dropped}); "
+          f"queue now {bus.event_queue.qsize()}")
+
+    # Rollback: late sprint input at T22 arrives at T40 → rewind + replay
+    from ai_intelligence import AIIntelligenceEngine
+    from weather_engine import WeatherEngine
+    print("\n  Rollback engine: AI + weather, snapshot every 5 ticks\n")
+    ai, weather = AIIntelligenceEngine(), WeatherEngine(start_weather="clear")
+
+    def step(tick, sprinting):
+        w = weather.tick()
+        ai.tick({aid: SPAWN_OF[TEAM_OF[aid]] for aid in ALPHA_AGENTS + OMEGA_AGENTS},
+                set(sprinting), w.get("stamina_drain", 0.0))
+        weather.flush_log(); ai.flush_all_logs()
+
+    def fingerprint():
+        return (weather.current.label,
+                tuple(round(ai.stamina[aid].stamina, 3) for aid in ALPHA_AGENTS))
+
+    rb = RollbackEngine({"ai": ai, "weather": weather}, step)
+    for t in range(40):
+        rb.advance(["ZephyrBlade"] if t % 3 == 0 else None)
+    live = fingerprint()
+    t0 = time.perf_counter()
+    rb.resimulate(22, {22: ["Volt-Surge", "ZephyrBlade"]})
+    took = (time.perf_counter() - t0) * 1e3
+    late = fingerprint()
+    rb.resimulate(22, {22: ["ZephyrBlade"]})
+    print(f"  Live T{rb.tick}: {live}")
+    print(f"  + late sprint @T22: {late}  (rewind+replay {took:.1f}ms)")
+    print(f"  Input withdrawn, replayed again — matches live: {fingerprint() == live}")
+    drained = rb.what_if(20, {t: ["Volt-Surge"] for t in range(20, 40)},
+                         probe=lambda: round(ai.stamina["Volt-Surge"].stamina, 1))
+    print(f"  What-if Volt-Surge sprints T20–T39: stamina {drained} "
+          f"(timeline untouched: {fingerprint() == live})")
+    snap = rb.snapshots[-1]
+    t0 = time.perf_counter()
+    for _ in range(100):
+        rb.restore(snap)
+    print(f"  Snapshot {len(snap.blob)} bytes, restore {(time.perf_counter() - t0) * 1e4:.0f}µs avg")
@@ -0,0 +1,158 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════╗
+║   BACKEND — INTEL TICK ORCHESTRATOR                                     ║
+║   One Shared World Context · Fixed Engine Order · Optional Parallelism  ║
+╚══════════════════════════════════════════════════════════════════════════╝
+
+Each tick builds one TickContext (positions, team membership, spatial index,
+centroids) and runs the engines in dependency order:
+
+  phase 1   weather                      → ctx.weather
+  phase 2   ai · map_events              → ctx.tone_map · ctx.controlled_points
+  phase 3   experience · progression     (read ctx.controlled_points / alive)
+  phase 4   comms · infrastructure       (read ctx.tone_map / tick)
+
+Engines inside one phase only read what earlier phases wrote, so with
+parallel=True they run on a thread pool. Engines still share the global
+`random` stream, so parallel runs are not bit-for-bit reproducible — keep
+parallel off for seeded replays.
+"""
+from typing import Dict, List, Optional, Set, Tuple
+from shared_constants import *
+from tick_context import TickContext
+
+PHASES: Tuple[Tuple[str, ...], ...] = (
+    ("weather",),
+    ("ai", "map_events"),
+    ("experience", "progression"),
+    ("comms", "infrastructure"),
+)
+
+
+class IntelOrchestrator:
+    """
+    Owns any subset of the Intel engines; missing engines are skipped and
+    their context fields keep neutral defaults.
+    """
+    def __init__(self, weather=None, ai=None, map_events=None, experience=None,
+                 progression=None, comms=None, infrastructure=None,
+                 parallel: bool = False, max_workers: int = 2):
+        self.engines = {
+            "weather": weather, "ai": ai, "map_events": map_events,
+            "experience": experience, "progression": progression,
+            "comms": comms, "infrastructure": infrastructure,
+        }
+        self.parallel     = parallel
+        self.max_workers  = max_workers
+        self.tick_num     = 0
+        self.last_context: Optional[TickContext] = None
+        self.last_results: Dict[str, object] = {}
+        self._pool = None
+
+    # ── Engine adapters (each reads/writes only its own ctx fields) ────
+    def _run_weather(self, ctx: TickContext):
+        ctx.weather = self.engines["weather"].tick()
+        return ctx.weather
+
+    def _run_ai(self, ctx: TickContext):
+        ai = self.engines["ai"]
+        result = ai.tick(ctx=ctx)
+        ctx.tone_map = ai.tone_map()
+        return result
+
+    def _run_map_events(self, ctx: TickContext):
+        events = self.engines["map_events"]
+        events.tick(ctx=ctx)
+        ctx.controlled_points = events.controlled_points()
+        return ctx.controlled_points
+
+    def _run_experience(self, ctx: TickContext):
+        return self.engines["experience"].tick(ctx.controlled_points, ctx.alive)
+
+    def _run_progression(self, ctx: TickContext):
+        return self.engines["progression"].tick(ctx.alive)
+
+    def _run_comms(self, ctx: TickContext):
+        tone_map = ctx.tone_map or {aid: "normal" for aid in ctx.alive}
+        return self.engines["comms"].tick(ctx.tick, tone_map)
+
+    def _run_infrastructure(self, ctx: TickContext):
+        return self.engines["infrastructure"].tick(ctx.tick)
+
+    # ── Tick ───────────────────────────────────────────────────────────
+    def _executor(self):
+        if self._pool is None:
+            from concurrent.futures import ThreadPoolExecutor   # only paid in parallel mode
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers,
+                                            thread_name_prefix="intel")
+        return self._pool
+
+    def _run_phase(self, names: List[str], ctx: TickContext) -> Dict[str, object]:
+        runners = [(n, getattr(self, f"_run_{n}")) for n in names]
+        if self.parallel and len(runners) > 1:
+            futures = [(n, self._executor().submit(fn, ctx)) for n, fn in runners]
+            return {n: f.result() for n, f in futures}
+        return {n: fn(ctx) for n, fn in runners}
+
+    def tick(self, agent_positions: Dict[str, Tuple[float, float]],
+             sprinting: Optional[Set[str]] = None,
+             team_of: Optional[Dict[str, str]] = None) -> TickContext:
+        """
+        agent_positions: {agent_id: (x,y)} for alive agents.
+        Returns the tick's context; per-engine return values are kept in
+        `last_results`.
+        """
+        self.tick_num += 1
+        ctx = TickContext(self.tick_num, agent_positions, team_of or TEAM_OF,
+                          sprinting=set(sprinting or ()))
+        results: Dict[str, object] = {}
+        for phase in PHASES:
+            active = [n for n in phase if self.engines.get(n) is not None]
+            if active:
+                results.update(self._run_phase(active, ctx))
+        self.last_context = ctx
+        self.last_results = results
+        return ctx
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+
+# ── Demo ──────────────────────────────────────────────────────────────
+if __name__ == "__main__":
+    import random
+    from weather_engine import WeatherEngine
+    from ai_intelligence import AIIntelligenceEngine
+    from map_events_territory import MapEventsEngine
+    from progression_system import ProgressionEngine
+
+    print("╔══ INTEL TICK ORCHESTRATOR DEMO ══╗\n")
+    orch = IntelOrchestrator(weather=WeatherEngine(start_weather="clear"),
+                             ai=AIIntelligenceEngine(),
+                             map_events=MapEventsEngine(),
+                             progression=ProgressionEngine())
+    positions = {aid: SPAWN_OF[TEAM_OF[aid]] for aid in ALPHA_AGENTS + OMEGA_AGENTS}
+    targets   = {aid: LANDMARKS[random.choice(KEY_POINTS)] for aid in positions}
+
+    for t in range(1, 31):
+        for aid, pos in positions.items():
+            dx, dy = targets[aid][0] - pos[0], targets[aid][1] - pos[1]
+            d = max(1e-9, (dx*dx + dy*dy) ** 0.5)
+            step = min(6.0, d)
+            positions[aid] = (round(pos[0] + dx/d*step, 2), round(pos[1] + dy/d*step, 2))
+        ctx = orch.tick(positions, sprinting={"Volt-Surge", "ZephyrBlade"})
+        lines  = orch.engines["weather"].flush_log()
+        lines += orch.engines["ai"].flush_all_logs()
+        lines += orch.engines["map_events"].flush_log()
+        for line in lines: print(f"  T{t:02d} {line.strip()}")
+
+    ctx = orch.last_context
+    print(f"\n  Tick {ctx.tick}: weather={ctx.weather['weather']}  "
+          f"controlled={ctx.controlled_points}")
+    for team in ("ALPHA", "OMEGA"):
+        c = ctx.centroid(team)
+        print(f"  {team} centroid ({c[0]:.0f},{c[1]:.0f})  "
+              f"near Parliament: {ctx.near(LANDMARKS['Parliament_Hall'], 25, team)}")
+    orch.engines["map_events"].render_territory()
@@ -8,6 +8,7 @@ import random
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Set, Tuple
 from shared_constants import *
+from tick_context import TickContext
 
 # ── Destructible object definitions ───────────────────────────────────
 DESTRUCTIBLES: Dict[str, Dict] = {
@@ -56,6 +57,10 @@ DESTRUCTIBLES: Dict[str, Dict] = {
     },
 }
 
+SIEGE_RADIUS   = 12.0   # agents closer than this count toward a siege
+CAPTURE_RADIUS = 10.0   # agents closer than this guard/capture a point
+OBJECTIVE_CELL = SIEGE_RADIUS
+
 @dataclass
 class DestructibleObject:
     obj_id:    str
@@ -220,6 +225,38 @@ class TerritoryPoint:
                 f"{contest}")
 
 
+# ── Objective spatial index ────────────────────────────────────────────
+class ObjectiveIndex:
+    """
+    Grid cell → objectives whose trigger circle reaches that cell.
+    Built once per objective layout; bucketing a tick's agents is then one
+    cell lookup plus a distance check per nearby objective — O(agents),
+    independent of how many objectives the map has.
+    """
+    def __init__(self, objectives: List[Tuple[Tuple[str, str], Tuple[float,float], float]],
+                 cell: float = OBJECTIVE_CELL):
+        self.cell  = cell
+        self.cells: Dict[Tuple[int,int], List[Tuple]] = {}
+        for key, pos, radius in objectives:
+            for gy in range(int((pos[1]-radius)//cell), int((pos[1]+radius)//cell) + 1):
+                for gx in range(int((pos[0]-radius)//cell), int((pos[0]+radius)//cell) + 1):
+                    self.cells.setdefault((gx, gy), []).append((key, pos, radius))
+
+    def bucket(self, positions: Dict[str, Tuple[float,float]],
+               team_of: Dict[str, str]) -> Dict[Tuple[str, str], Dict[str, List[str]]]:
+        """{objective_key: {"ALPHA": [...], "OMEGA": [...]}} in `positions` order."""
+        out: Dict[Tuple[str, str], Dict[str, List[str]]] = {}
+        c = self.cell
+        for aid, pos in positions.items():
+            team = team_of.get(aid)
+            if team not in ("ALPHA","OMEGA"):
+                continue
+            for key, opos, radius in self.cells.get((int(pos[0]//c), int(pos[1]//c)), ()):
+                if dist(pos, opos) < radius:
+                    out.setdefault(key, {"ALPHA": [], "OMEGA": []})[team].append(aid)
+        return out
+
+
 class MapEventsEngine:
     """
     Manages all destructible objects and territory points.
@@ -245,20 +282,34 @@ class MapEventsEngine:
         self.log:      List[str] = []
         self.scores:   Dict[str, int] = {"ALPHA":0,"OMEGA":0}
         self.blocked_roads: Set[str] = set()
-
-    def tick(self, agent_positions: Dict[str, Tuple[str, Tuple[float,float]]]):
+        self.objective_index = ObjectiveIndex(
+            [(("siege", k), LANDMARKS.get(k, (100.0,100.0)), SIEGE_RADIUS)
+             for k in self.destructibles] +
+            [(("cap", k), pt.position, CAPTURE_RADIUS)
+             for k, pt in self.territory.items()])
+
+    def tick(self, agent_positions: Optional[Dict[str, Tuple[str, Tuple[float,float]]]] = None,
+             ctx: Optional[TickContext] = None):
         """
         agent_positions: {agent_id: (team, (x,y))}
+        ctx:             shared TickContext (positions/teams taken from it)
+
+        Agents are bucketed by nearby objective once per tick through the
+        objective index, so siege and capture cost O(agents) in total.
         """
         self.tick_num += 1
+        if ctx is not None:
+            positions, team_of = ctx.positions, ctx.team_of
+        else:
+            agent_positions = agent_positions or {}
+            positions = {aid: pos for aid, (_, pos) in agent_positions.items()}
+            team_of   = {aid: tm  for aid, (tm, _) in agent_positions.items()}
+        buckets = self.objective_index.bucket(positions, team_of)
 
         # ── Siege processing ───────────────────────────────────────
         for obj_id, obj in self.destructibles.items():
             if obj.is_destroyed: continue
-            obj_pos = LANDMARKS.get(obj_id, (100.0,100.0))
-            near_agents = {team: [aid for aid,(tm,pos) in agent_positions.items()
-                                  if tm == team and dist(pos, obj_pos) < 12]
-                           for team in ["ALPHA","OMEGA"]}
+            near_agents = buckets.get(("siege", obj_id)) or {"ALPHA": [], "OMEGA": []}
             # Determine if any team is sieging
             for team, agents in near_agents.items():
                 enemy_team = "OMEGA" if team == "ALPHA" else "ALPHA"
@@ -281,12 +332,8 @@ class MapEventsEngine:
 
         # ── Territory capture ──────────────────────────────────────
         for pt_name, pt in self.territory.items():
-            pt_pos = LANDMARKS[pt_name]
-            alpha_here = [aid for aid,(tm,pos) in agent_positions.items()
-                          if tm == "ALPHA" and dist(pos, pt_pos) < 10]
-            omega_here = [aid for aid,(tm,pos) in agent_positions.items()
-                          if tm == "OMEGA" and dist(pos, pt_pos) < 10]
-            captured   = pt.tick(alpha_here, omega_here, self.log)
+            here     = buckets.get(("cap", pt_name)) or {"ALPHA": [], "OMEGA": []}
+            captured = pt.tick(here["ALPHA"], here["OMEGA"], self.log)
 
         # ── Score update ───────────────────────────────────────────
         for pt in self.territory.values():
@@ -321,6 +368,11 @@ class MapEventsEngine:
                 if obj_id in self.blocked_roads:
                     self.blocked_roads.discard(obj_id)
 
+    def controlled_points(self) -> Dict[str, str]:
+        """{point: owner} for every territory point held by a team."""
+        return {name: pt.owner for name, pt in self.territory.items()
+                if pt.owner in ("ALPHA","OMEGA")}
+
     def flush_log(self) -> List[str]:
         out = self.log[:]
         self.log.clear()
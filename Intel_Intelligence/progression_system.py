@@ -4,7 +4,9 @@
 ║   Agent Leveling · Stat Upgrades · Replay Log · Skill-Based Rating      ║
 ╚══════════════════════════════════════════════════════════════════════════╝
 """
-import json, math, random, time
+import heapq, json, math, random, time
+from array import array
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field, asdict
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
@@ -210,80 +212,204 @@ class ActionRecord:
                 f"→ {self.target:<18} val:{self.value:7.1f}  {self.extra}")
 
 
+HIGHLIGHT_ACTIONS = ("kill", "ultimate", "cap")
+MATCH_LOG_FORMAT  = "columnar-1"
+
+
 class MatchLogger:
+    """
+    Columnar action log. Every record is one slot in each column: tick,
+    wall time, x/y/value as typed arrays, and actor/action/target/extra as
+    codes into one interned string table. While ticks never go backwards
+    the tick column is its own tick→offset index (bisect); each action also
+    keeps its own offset list, so tick slices cost O(log n + k), highlights
+    (merged straight from those lists, whatever their ticks) cost O(k), and
+    the summary counts are kept as records arrive. A record logged with an
+    older tick (tick_num set back) switches tick slices to a column scan,
+    so results stay correct.
+    ActionRecord rows are only built for what a query returns.
+    """
     def __init__(self, match_id: str = ""):
         self.match_id   = match_id or f"M{int(time.time())}"
         self.started_at = datetime.now().isoformat()
-        self.records:   List[ActionRecord] = []
         self.tick_num   = 0
+        self.strings:  List[str]      = []
+        self.string_id: Dict[str, int] = {}
+        self._reset_columns()
+
+    def _reset_columns(self):
+        self.ticks   = array("l")
+        self.created = array("d")     # time.time() at log
+        self.actor   = array("l")
+        self.action  = array("l")
+        self.target  = array("l")
+        self.extra   = array("l")
+        self.xs      = array("d")
+        self.ys      = array("d")
+        self.values  = array("d")
+        self.by_action: Dict[int, array] = {}    # action code → offsets
+        self.ordered = True                       # tick column non-decreasing
+
+    def intern(self, text: str) -> int:
+        code = self.string_id.get(text)
+        if code is None:
+            code = self.string_id[text] = len(self.strings)
+            self.strings.append(text)
+        return code
+
+    def __len__(self) -> int:
+        return len(self.ticks)
 
     def log(self, actor_id: str, action: str, target: str = "",
             position: Tuple[float,float] = (0.0,0.0),
-            value: float = 0.0, extra: str = ""):
-        ts  = datetime.now().strftime("%H:%M:%S")
-        rec = ActionRecord(self.tick_num, ts, actor_id, action,
-                           target, position, value, extra)
-        self.records.append(rec)
-        return rec
+            value: float = 0.0, extra: str = "", created: Optional[float] = None) -> int:
+        """Append one record; returns its offset."""
+        offset = len(self.ticks)
+        act = self.intern(action)
+        if self.ordered and offset and self.tick_num < self.ticks[-1]:
+            self.ordered = False
+        self.ticks.append(self.tick_num)
+        self.created.append(time.time() if created is None else created)
+        self.actor.append(self.intern(actor_id))
+        self.action.append(act)
+        self.target.append(self.intern(target))
+        self.extra.append(self.intern(extra))
+        self.xs.append(position[0])
+        self.ys.append(position[1])
+        self.values.append(value)
+        postings = self.by_action.get(act)
+        if postings is None:
+            postings = self.by_action[act] = array("l")
+        postings.append(offset)
+        return offset
 
     def advance_tick(self):
         self.tick_num += 1
 
+    # ── Row access ─────────────────────────────────────────────────────
+    def record(self, i: int) -> ActionRecord:
+        s = self.strings
+        return ActionRecord(self.ticks[i],
+                            datetime.fromtimestamp(self.created[i]).strftime("%H:%M:%S"),
+                            s[self.actor[i]], s[self.action[i]], s[self.target[i]],
+                            (self.xs[i], self.ys[i]), self.values[i], s[self.extra[i]])
+
+    @property
+    def records(self) -> List[ActionRecord]:
+        """Every record as ActionRecord (materializes the whole log)."""
+        return [self.record(i) for i in range(len(self.ticks))]
+
+    def offset_range(self, from_tick: int, to_tick: int) -> Tuple[int, int]:
+        """[lo, hi) offsets of ticks from_tick..to_tick (ordered logs only)."""
+        if not self.ordered:
+            raise ValueError("tick column is not ordered; no contiguous offset range")
+        return (bisect_left(self.ticks, from_tick),
+                bisect_right(self.ticks, to_tick))
+
+    def _offsets(self, from_tick: int, to_tick: int,
+                 actions: Optional[Tuple[str, ...]] = None) -> List[int]:
+        if not self.ordered:
+            codes = None if actions is None else {self.string_id.get(a, -1) for a in actions}
+            act   = self.action
+            return [i for i, t in enumerate(self.ticks)
+                    if from_tick <= t <= to_tick and (codes is None or act[i] in codes)]
+        lo, hi = self.offset_range(from_tick, to_tick)
+        if actions is None:
+            return list(range(lo, hi))
+        runs = []
+        for name in actions:
+            postings = self.by_action.get(self.string_id.get(name, -1))
+            if postings:
+                runs.append(postings[bisect_left(postings, lo):bisect_left(postings, hi)])
+        return list(heapq.merge(*runs))
+
+    def _action_offsets(self, actions: Tuple[str, ...]) -> List[int]:
+        """Every offset logged with one of `actions`, in log order, any tick."""
+        runs = [self.by_action.get(self.string_id.get(name, -1), ()) for name in actions]
+        return list(heapq.merge(*runs))
+
+    # ── Queries ────────────────────────────────────────────────────────
     def get_highlights(self) -> List[ActionRecord]:
-        high_value = ["kill","ultimate","cap"]
-        return [r for r in self.records if r.action in high_value]
+        return [self.record(i) for i in self._action_offsets(HIGHLIGHT_ACTIONS)]
 
     def get_replay_slice(self, from_tick: int, to_tick: int) -> List[ActionRecord]:
-        return [r for r in self.records if from_tick <= r.tick <= to_tick]
+        return [self.record(i) for i in self._offsets(from_tick, to_tick)]
+
+    def count(self, action: str) -> int:
+        return len(self.by_action.get(self.string_id.get(action, -1), ()))
 
     def replay(self, from_tick: int = 0, to_tick: int = 9999,
                highlight_only: bool = False):
-        records = self.get_highlights() if highlight_only else self.records
-        records = [r for r in records if from_tick <= r.tick <= to_tick]
+        offsets = self._offsets(from_tick, to_tick,
+                                HIGHLIGHT_ACTIONS if highlight_only else None)
         print(f"\n  🎬 REPLAY [{self.match_id}] T{from_tick}→T{to_tick}"
-              f" ({len(records)} events):")
+              f" ({len(offsets)} events):")
         print(f"  {'─'*90}")
-        for r in records:
-            print(r.render())
+        for i in offsets:
+            print(self.record(i).render())
 
+    # ── Export ─────────────────────────────────────────────────────────
     def save_json(self, path: str = ""):
+        """Compact columnar export (gzip'd when the path ends in .gz)."""
         data = {
             "match_id":   self.match_id,
             "started_at": self.started_at,
             "total_ticks":self.tick_num,
-            "records":    [r.to_dict() for r in self.records],
+            "format":     MATCH_LOG_FORMAT,
+            "strings":    self.strings,
+            "columns": {
+                "tick": self.ticks.tolist(), "created": self.created.tolist(),
+                "actor": self.actor.tolist(), "action": self.action.tolist(),
+                "target": self.target.tolist(), "extra": self.extra.tolist(),
+                "x": self.xs.tolist(), "y": self.ys.tolist(),
+                "value": self.values.tolist(),
+            },
         }
         path = path or f"match_{self.match_id}.json"
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2)
+        blob = json.dumps(data, separators=(",", ":")).encode()
+        if path.endswith(".gz"):
+            import gzip
+            blob = gzip.compress(blob)
+        with open(path, "wb") as f:
+            f.write(blob)
         return path
 
     def load_json(self, path: str):
-        with open(path) as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            blob = f.read()
+        if blob[:2] == b"\x1f\x8b":
+            import gzip
+            blob = gzip.decompress(blob)
+        data = json.loads(blob)
         self.match_id   = data["match_id"]
         self.started_at = data["started_at"]
-        self.tick_num   = data["total_ticks"]
-        self.records    = [
-            ActionRecord(
-                r["tick"], r["timestamp"], r["actor"],
-                r["action"], r["target"], tuple(r["position"]),
-                r["value"], r["extra"]
-            )
-            for r in data["records"]
-        ]
+        self.strings, self.string_id = [], {}
+        self._reset_columns()
+        if data.get("format") == MATCH_LOG_FORMAT:
+            cols, strs = data["columns"], data["strings"]
+            rows = zip(cols["tick"], cols["created"], cols["actor"], cols["action"],
+                       cols["target"], cols["x"], cols["y"], cols["value"], cols["extra"])
+            for tick, created, actor, action, target, x, y, value, extra in rows:
+                self.tick_num = tick
+                self.log(strs[actor], strs[action], strs[target], (x, y),
+                         value, strs[extra], created)
+        else:   # older per-record files; their wall times only kept H:M:S
+            day = datetime.fromisoformat(self.started_at).date()
+            for r in sorted(data["records"], key=lambda r: r["tick"]):
+                t = datetime.combine(day, datetime.strptime(r["timestamp"], "%H:%M:%S").time())
+                self.tick_num = r["tick"]
+                self.log(r["actor"], r["action"], r["target"], tuple(r["position"]),
+                         r["value"], r["extra"], t.timestamp())
+        self.tick_num = data["total_ticks"]
         return self
 
     def stats_summary(self) -> str:
-        kills  = [r for r in self.records if r.action == "kill"]
-        caps   = [r for r in self.records if r.action == "cap"]
-        ults   = [r for r in self.records if r.action == "ultimate"]
         return (f"\n  📊 Match [{self.match_id}] Summary:\n"
                 f"    Total ticks: {self.tick_num}\n"
-                f"    Kill events: {len(kills)}\n"
-                f"    Captures:    {len(caps)}\n"
-                f"    Ultimates:   {len(ults)}\n"
-                f"    Total events:{len(self.records)}")
+                f"    Kill events: {self.count('kill')}\n"
+                f"    Captures:    {self.count('cap')}\n"
+                f"    Ultimates:   {self.count('ultimate')}\n"
+                f"    Total events:{len(self)}")
 
 
 # ─────────────────────────────────────────────────────────────────────
@@ -41,9 +41,31 @@ BARRIER_DEFS: Dict[str, Dict] = {
 BARRIER_WEAK_MULT  = 2.0
 BARRIER_STRONG_MULT = 0.5
 
+MAX_BARRIER_LAYERS = 3
+
+# ── Precomputed attacker-element × barrier-element matchups ────────────
+BARRIER_ELEMENTS: List[str]      = list(BARRIER_DEFS)
+BARRIER_ID:       Dict[str, int] = {el: i for i, el in enumerate(BARRIER_ELEMENTS)}
+NEUTRAL, WEAK, STRONG = 0, 1, 2
+_KIND_MULT = (1.0, BARRIER_WEAK_MULT, BARRIER_STRONG_MULT)
+
+# attacker element → matchup kind per barrier id (weakness wins over resistance)
+BARRIER_MATCHUP: Dict[str, List[int]] = {
+    atk: [WEAK if atk in BARRIER_DEFS[b]["weak_to"] else
+          STRONG if atk in BARRIER_DEFS[b]["strong_vs"] else NEUTRAL
+          for b in BARRIER_ELEMENTS]
+    for atk in {e for d in BARRIER_DEFS.values()
+                for e in [*BARRIER_DEFS, *d["weak_to"], *d["strong_vs"]]}
+}
+BARRIER_MULT: Dict[str, List[float]] = {
+    atk: [_KIND_MULT[k] for k in kinds] for atk, kinds in BARRIER_MATCHUP.items()
+}
+_NEUTRAL_KINDS = [NEUTRAL] * len(BARRIER_ELEMENTS)
+_NEUTRAL_MULTS = [1.0]     * len(BARRIER_ELEMENTS)
+
 @dataclass
 class BarrierLayer:
-    """Single barrier layer — stacking multiple creates a layered shield."""
+    """Single barrier layer — read-only snapshot of one BarrierStore cell."""
     element:    str
     max_absorb: float
     current:    float
@@ -53,39 +75,6 @@ class BarrierLayer:
     ticks_since_hit: int = 0
     broken:     bool = False
 
-    def absorb(self, damage: float, attacker_element: str) -> Tuple[float, float, str]:
-        """
-        Returns (damage_to_barrier, damage_passed_through, note).
-        """
-        if self.broken: return 0.0, damage, "broken"
-        defn      = BARRIER_DEFS[self.element]
-        note      = ""
-        mult      = 1.0
-        if attacker_element in defn["weak_to"]:
-            mult = BARRIER_WEAK_MULT
-            note = f"💥BARRIER WEAK ({attacker_element}→{self.element})"
-        elif attacker_element in defn["strong_vs"]:
-            mult = BARRIER_STRONG_MULT
-            note = f"🛡️ BARRIER RESISTS"
-
-        dmg_to_barrier = damage * mult
-        self.ticks_since_hit = 0
-
-        if dmg_to_barrier >= self.current:
-            overflow = dmg_to_barrier - self.current
-            self.current = 0.0
-            self.broken  = True
-            return self.current, overflow / mult, f"💔 BARRIER BROKEN! {note}"
-        else:
-            self.current -= dmg_to_barrier
-            return dmg_to_barrier, 0.0, note
-
-    def tick_regen(self):
-        if not self.broken:
-            self.ticks_since_hit += 1
-            if self.ticks_since_hit >= 3:   # regen starts 3 ticks after last hit
-                self.current = min(self.max_absorb, self.current + self.regen_rate)
-
     def pct(self) -> float:
         return (self.current / self.max_absorb) * 100 if self.max_absorb else 0.0
 
@@ -97,93 +86,245 @@ class BarrierLayer:
                 f"Regen:{self.regen_rate:.1f}/t")
 
 
+class BarrierStore:
+    """
+    Barrier layers for a whole team in flat columns: agent slot s owns cells
+    s*3 … s*3+2, outer layer first. Damage for many agents (AoE) goes through
+    damage_batch(), and tick_all() runs one regen pass over every cell.
+    Note strings are only built when `log_enabled` is set.
+    """
+    def __init__(self, log_enabled: bool = True):
+        self.log_enabled = log_enabled
+        self.slot_of:  Dict[str, int] = {}
+        self.owners:   List[str] = []
+        self.count:    List[int] = []        # live layers per agent
+        self.seq:      List[int] = []        # last layer id per agent
+        self.logs:     List[List[str]] = []
+        # per-cell columns (agents × MAX_BARRIER_LAYERS)
+        self.element:   List[int]   = []
+        self.current:   List[float] = []
+        self.max_absorb: List[float] = []
+        self.regen:     List[float] = []
+        self.since_hit: List[int]   = []
+        self.broken:    List[bool]  = []
+        self.layer_id:  List[int]   = []
+
+    def add_agent(self, owner_id: str) -> int:
+        slot = self.slot_of.get(owner_id)
+        if slot is None:
+            slot = self.slot_of[owner_id] = len(self.owners)
+            self.owners.append(owner_id)
+            self.count.append(0);  self.seq.append(0);  self.logs.append([])
+            for col, blank in ((self.element, -1), (self.current, 0.0),
+                               (self.max_absorb, 0.0), (self.regen, 0.0),
+                               (self.since_hit, 0), (self.broken, False),
+                               (self.layer_id, 0)):
+                col.extend([blank] * MAX_BARRIER_LAYERS)
+        return slot
+
+    # ── Layers ─────────────────────────────────────────────────────
+    def grant(self, slot: int, element: str):
+        owner = self.owners[slot]
+        if self.count[slot] >= MAX_BARRIER_LAYERS:
+            if self.log_enabled:
+                self.logs[slot].append(f"  ⚠️  [{owner}] Max barrier layers "
+                                       f"({MAX_BARRIER_LAYERS}) reached")
+            return
+        defn = BARRIER_DEFS.get(element)
+        if not defn: return
+        self.seq[slot] += 1
+        i = slot * MAX_BARRIER_LAYERS + self.count[slot]
+        self.element[i]    = BARRIER_ID[element]
+        self.current[i]    = self.max_absorb[i] = defn["absorb"]
+        self.regen[i]      = defn["regen"]
+        self.since_hit[i]  = 0
+        self.broken[i]     = False
+        self.layer_id[i]   = self.seq[slot]
+        self.count[slot]  += 1
+        if self.log_enabled:
+            self.logs[slot].append(f"  🛡️  [{owner}] Barrier L{self.seq[slot]} "
+                                   f"granted ({element} / {defn['absorb']} absorb)")
+
+    def cells(self, slot: int) -> range:
+        base = slot * MAX_BARRIER_LAYERS
+        return range(base, base + self.count[slot])
+
+    def layer(self, i: int) -> BarrierLayer:
+        el = BARRIER_ELEMENTS[self.element[i]]
+        return BarrierLayer(el, self.max_absorb[i], self.current[i], self.regen[i],
+                            BARRIER_DEFS[el]["icon"], self.layer_id[i],
+                            self.since_hit[i], self.broken[i])
+
+    # ── Damage ─────────────────────────────────────────────────────
+    def damage(self, slot: int, raw_damage: float, attacker_element: str,
+               notes: Optional[List[str]] = None) -> Tuple[float, float]:
+        """
+        Push one hit through an agent's layers outer→inner.
+        Returns (damage_absorbed_total, damage_to_hp); appends note lines
+        to `notes` when given.
+        """
+        kinds = BARRIER_MATCHUP.get(attacker_element, _NEUTRAL_KINDS)
+        mults = BARRIER_MULT.get(attacker_element, _NEUTRAL_MULTS)
+        cur, broken = self.current, self.broken
+        remaining      = raw_damage
+        total_absorbed = 0.0
+        for i in self.cells(slot):
+            if broken[i]: continue
+            if remaining <= 0:
+                break
+            bid  = self.element[i]
+            mult = mults[bid]
+            dmg_to_barrier = remaining * mult
+            self.since_hit[i] = 0
+            if dmg_to_barrier >= cur[i]:
+                overflow   = (dmg_to_barrier - cur[i]) / mult
+                cur[i]     = 0.0
+                broken[i]  = True
+                d_barrier  = 0.0
+            else:
+                cur[i]    -= dmg_to_barrier
+                overflow   = 0.0
+                d_barrier  = dmg_to_barrier
+            total_absorbed += (remaining - overflow)
+            remaining       = overflow
+            if notes is not None:
+                kind = kinds[bid]
+                note = (f"💥BARRIER WEAK ({attacker_element}→{BARRIER_ELEMENTS[bid]})"
+                        if kind == WEAK else "🛡️ BARRIER RESISTS" if kind == STRONG else "")
+                if broken[i]:
+                    note = f"💔 BARRIER BROKEN! {note}"
+                if note:
+                    notes.append(f"  🛡️  [{self.owners[slot]}] L{self.layer_id[i]}: {note} "
+                                 f"→ -{d_barrier:.1f} from barrier")
+            # Passive triggers
+            self._check_passive(i, notes)
+        return total_absorbed, remaining
+
+    def _check_passive(self, i: int, notes: Optional[List[str]]):
+        element = BARRIER_ELEMENTS[self.element[i]]
+        if element == "Sand":
+            if random.random() < 0.20 and notes is not None:
+                notes.append(f"  💨 Sand passive: attacker BLINDED!")
+        elif element == "Flying":
+            if random.random() < 0.10 and notes is not None:
+                notes.append(f"  🌪️  Flying passive: DODGE triggered!")
+        elif notes is None:
+            return
+        elif element == "Grass" and self.broken[i]:
+            notes.append(f"  🌿 Grass passive: barrier break ROOTS attacker (2t)!")
+        elif element == "Dark":
+            lifedrip = raw_dmg * 0.15 if (raw_dmg := self.max_absorb[i] * 0.1) else 0
+            notes.append(f"  🌑 Dark passive: +{lifedrip:.1f} HP drained from attacker")
+
+    def damage_batch(self, owner_ids: List[str], raw_damage,
+                     attacker_element) -> Tuple[List[float], List[float]]:
+        """
+        Apply one hit to each listed agent (e.g. an AoE), in order.
+        raw_damage / attacker_element are per-target lists or one value for all.
+        Returns (absorbed, to_hp) lists aligned with owner_ids.
+        """
+        n    = len(owner_ids)
+        raws = raw_damage if isinstance(raw_damage, (list, tuple)) else [raw_damage] * n
+        els  = attacker_element if isinstance(attacker_element, (list, tuple)) \
+               else [attacker_element] * n
+        absorbed, to_hp = [0.0] * n, [0.0] * n
+        for k, owner in enumerate(owner_ids):
+            slot  = self.slot_of[owner]
+            notes = self.logs[slot] if self.log_enabled else None
+            absorbed[k], to_hp[k] = self.damage(slot, raws[k], els[k], notes)
+        return absorbed, to_hp
+
+    # ── Regen ──────────────────────────────────────────────────────
+    def _regen(self, cells):
+        cur, cap, regen = self.current, self.max_absorb, self.regen
+        since, broken   = self.since_hit, self.broken
+        for i in cells:
+            if not broken[i]:
+                since[i] += 1
+                if since[i] >= 3:   # regen starts 3 ticks after last hit
+                    cur[i] = min(cap[i], cur[i] + regen[i])
+
+    def _drop_fallen(self, slot: int):
+        """Remove broken layers that have been broken > 5 ticks (they fall off)."""
+        keep = [i for i in self.cells(slot)
+                if not self.broken[i] or self.since_hit[i] < 5]
+        if len(keep) == self.count[slot]:
+            return
+        base = slot * MAX_BARRIER_LAYERS
+        for col in (self.element, self.current, self.max_absorb, self.regen,
+                    self.since_hit, self.broken, self.layer_id):
+            vals = [col[i] for i in keep]
+            col[base:base + len(vals)] = vals
+        for i in range(base + len(keep), base + self.count[slot]):
+            self.element[i] = -1
+        self.count[slot] = len(keep)
+
+    def tick_slot(self, slot: int):
+        self._regen(self.cells(slot))
+        self._drop_fallen(slot)
+
+    def tick_all(self):
+        """One regen step for every agent's layers."""
+        cells = [i for slot in range(len(self.owners)) for i in self.cells(slot)]
+        self._regen(cells)
+        for slot in range(len(self.owners)):
+            self._drop_fallen(slot)
+
+
 class BarrierSystem:
     """
     Manages layered elemental barriers for one agent.
     Up to 3 layers can be stacked — damage must break outer before reaching inner.
     Includes passive ability triggers per element.
+
+    A view onto a BarrierStore; systems created without one get a private
+    store. Share a store across a team to use damage_batch()/tick_all().
     """
-    def __init__(self, owner_id: str, element: str):
+    def __init__(self, owner_id: str, element: str,
+                 store: Optional[BarrierStore] = None, log_enabled: bool = True):
         self.owner_id  = owner_id
         self.element   = element
-        self.layers:   List[BarrierLayer] = []
-        self.log:      List[str] = []
-        self._layer_seq = 0
+        self.store     = store if store is not None else BarrierStore(log_enabled)
+        self.slot      = self.store.add_agent(owner_id)
         # Apply starter barrier for agent's own element
         self.grant_barrier(element, source="init")
 
+    @property
+    def log(self) -> List[str]:
+        return self.store.logs[self.slot]
+
+    @property
+    def layers(self) -> List[BarrierLayer]:
+        return [self.store.layer(i) for i in self.store.cells(self.slot)]
+
     def grant_barrier(self, element: str, source: str = "ability"):
-        if len(self.layers) >= 3:
-            self.log.append(f"  ⚠️  [{self.owner_id}] Max barrier layers (3) reached")
-            return
-        defn = BARRIER_DEFS.get(element)
-        if not defn: return
-        self._layer_seq += 1
-        layer = BarrierLayer(
-            element    = element,
-            max_absorb = defn["absorb"],
-            current    = defn["absorb"],
-            regen_rate = defn["regen"],
-            icon       = defn["icon"],
-            layer_id   = self._layer_seq,
-        )
-        self.layers.append(layer)
-        self.log.append(f"  🛡️  [{self.owner_id}] Barrier L{self._layer_seq} "
-                        f"granted ({element} / {defn['absorb']} absorb)")
+        self.store.grant(self.slot, element)
 
     def take_damage(self, raw_damage: float,
                     attacker_element: str) -> Tuple[float, float, List[str]]:
         """
         Process damage through barrier layers outer→inner.
-        Returns (damage_absorbed_total, damage_to_hp, event_notes).
+        Returns (damage_absorbed_total, damage_to_hp, event_notes);
+        event_notes stays empty when the store's logging is off.
         """
-        notes:       List[str] = []
-        remaining    = raw_damage
-        total_absorbed = 0.0
-        active_layers  = [l for l in self.layers if not l.broken]
-
-        for layer in active_layers:
-            if remaining <= 0:
-                break
-            d_barrier, overflow, note = layer.absorb(remaining, attacker_element)
-            total_absorbed += (remaining - overflow)
-            remaining       = overflow
-            if note:
-                notes.append(f"  🛡️  [{self.owner_id}] L{layer.layer_id}: {note} "
-                              f"→ -{d_barrier:.1f} from barrier")
-            # Passive triggers
-            self._check_passive(layer, attacker_element, notes)
-
-        self.log.extend(notes)
-        return total_absorbed, remaining, notes
-
-    def _check_passive(self, layer: BarrierLayer, attacker_element: str,
-                       notes: List[str]):
-        defn = BARRIER_DEFS[layer.element]
-        passive = defn.get("passive","")
-        if layer.element == "Sand" and random.random() < 0.20:
-            notes.append(f"  💨 Sand passive: attacker BLINDED!")
-        elif layer.element == "Flying" and random.random() < 0.10:
-            notes.append(f"  🌪️  Flying passive: DODGE triggered!")
-        elif layer.element == "Grass" and layer.broken:
-            notes.append(f"  🌿 Grass passive: barrier break ROOTS attacker (2t)!")
-        elif layer.element == "Dark":
-            lifedrip = raw_dmg * 0.15 if (raw_dmg := layer.max_absorb * 0.1) else 0
-            notes.append(f"  🌑 Dark passive: +{lifedrip:.1f} HP drained from attacker")
+        notes: Optional[List[str]] = [] if self.store.log_enabled else None
+        total_absorbed, remaining = self.store.damage(self.slot, raw_damage,
+                                                      attacker_element, notes)
+        if notes:
+            self.log.extend(notes)
+        return total_absorbed, remaining, notes or []
 
     def tick(self):
         """Regen tick for all layers; remove fully broken layers."""
-        for layer in self.layers:
-            layer.tick_regen()
-        # Remove broken layers that have been broken > 5 ticks (they fall off)
-        self.layers = [l for l in self.layers
-                       if not l.broken or l.ticks_since_hit < 5]
+        self.store.tick_slot(self.slot)
 
     def total_absorb_remaining(self) -> float:
-        return sum(l.current for l in self.layers if not l.broken)
+        st = self.store
+        return sum(st.current[i] for i in st.cells(self.slot) if not st.broken[i])
 
     def has_active_barrier(self) -> bool:
-        return any(not l.broken for l in self.layers)
+        st = self.store
+        return any(not st.broken[i] for i in st.cells(self.slot))
 
     def flush_log(self) -> List[str]:
         out = self.log[:]
@@ -193,9 +334,10 @@ class BarrierSystem:
     def render(self) -> str:
         lines = [f"  ╔ BARRIER [{self.owner_id}] — {self.element} — "
                  f"Total:{self.total_absorb_remaining():.0f} absorb remaining"]
-        if not self.layers:
+        layers = self.layers
+        if not layers:
             lines.append("    (no barriers)")
-        for layer in self.layers:
+        for layer in layers:
             lines.append(layer.render())
         lines.append(f"  ╚{'─'*50}")
         return "\n".join(lines)
@@ -222,3 +364,14 @@ if __name__ == "__main__":
         for line in terra.flush_log(): print(line)
         terra.tick()
         print(terra.render())
+
+    print("\n  ── Team store: Volt-Surge AoE on the OMEGA squad (logging off) ──")
+    team = BarrierStore(log_enabled=False)
+    squad = [BarrierSystem(aid, ELEMENT_OF[aid], team) for aid in OMEGA_AGENTS]
+    absorbed, to_hp = team.damage_batch(list(OMEGA_AGENTS), 140.0, "Thunder")
+    for aid, a, h in zip(OMEGA_AGENTS, absorbed, to_hp):
+        print(f"    {aid:<14} absorbed:{a:6.1f}  to HP:{h:6.1f}")
+    for _ in range(4):
+        team.tick_all()
+    for b in squad:
+        print(b.render())
@@ -3,6 +3,10 @@
 ║   BACKEND — STATUS EFFECT STACKING SYSTEM                               ║
 ║   Interactions · Combos · Counter-Effects · Stacking Rules              ║
 ╚══════════════════════════════════════════════════════════════════════════╝
+
+All agents' effects live in one columnar EffectTable; StatusEffectManager is
+a per-agent view onto it, and EffectTable.tick_all() advances every agent's
+DOT, penalties and expiries in a single pass.
 """
 import random
 from dataclasses import dataclass, field
@@ -83,125 +87,317 @@ class ActiveEffect:
                 f"ATK:-{self.effective_atk_pen()*100:.0f}%")
 
 
+# ── Event codes (formatted only when a log is read) ────────────────────
+EV_CANCELLED = "  ✨ [{}] {} CANCELLED {}!"
+EV_COMBO     = "  ⚡ COMBO [{}] {} (+{:.0f} burst dmg)"
+EV_EXPIRED   = "  ⏰ [{}] {}{} expired"
+
+# ── Compiled lookup tables ─────────────────────────────────────────────
+# Effects are integer ids; an agent's active effects are a bitmask of them.
+EFFECT_NAMES:   List[str]      = []
+EFFECT_ID:      Dict[str, int] = {}
+CANCEL_MASK:    List[int]      = []   # new effect id → mask of effects it cancels
+COMBO_PARTNERS: List[List[Tuple[int, int, float, str]]] = []
+#               new effect id → [(needed_mask, combo_id, bonus, msg)], COMBOS order
+
+def compile_effect_tables():
+    """
+    (Re)build the id-indexed tables from EFFECT_DEFS / COMBOS / COUNTERS.
+    Called at import; call again after a mod adds effects or combos.
+    Combos naming something that is not an effect can never fire and are
+    dropped here instead of being checked on every apply.
+    """
+    names = list(EFFECT_DEFS)
+    names += [c for c, _, _ in COMBOS.values() if c not in EFFECT_DEFS and c not in names]
+    ids = {n: i for i, n in enumerate(names)}
+
+    cancel = [0] * len(names)
+    for applied, existing in COUNTERS.items():
+        if applied in ids and existing in ids:
+            cancel[ids[applied]] |= 1 << ids[existing]
+
+    partners = [[] for _ in names]
+    for (a, b), (combo, bonus, msg) in COMBOS.items():
+        if a not in ids or b not in ids:
+            continue
+        need = (1 << ids[a]) | (1 << ids[b])
+        for eid in {ids[a], ids[b]}:
+            partners[eid].append((need, ids[combo], bonus, msg))
+
+    EFFECT_NAMES[:]   = names
+    EFFECT_ID.clear();  EFFECT_ID.update(ids)
+    CANCEL_MASK[:]    = cancel
+    COMBO_PARTNERS[:] = partners
+
+compile_effect_tables()
+
+
+def _mask_ids(mask: int):
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class EffectTable:
+    """
+    Every active effect on every agent in one table: one row per effect,
+    stored as parallel columns (owner, effect id, stacks, duration, dot,
+    penalties, burst). Rows of one agent keep application order, and each
+    agent's active effects are also kept as a bitmask of effect ids.
+
+    Removed rows are tombstoned and compacted once per tick_all(), so
+    apply/cancel/combo never rebuild the table. tick_all() advances every
+    agent in a single pass over the columns.
+    """
+    def __init__(self):
+        self.owner:    List[str]   = []
+        self.eid:      List[int]   = []
+        self.stacks:   List[int]   = []
+        self.duration: List[int]   = []
+        self.dot:      List[float] = []
+        self.move_pen: List[float] = []
+        self.atk_pen:  List[float] = []
+        self.icon:     List[str]   = []
+        self.burst:    List[float] = []
+        self.source:   List[str]   = []
+        self.alive:    List[bool]  = []
+        self.dead_rows = 0
+        self._rows:  Dict[str, List[int]] = {}                  # owner → live rows
+        self._named: Dict[Tuple[str, int], List[int]] = {}      # (owner, eid) → live rows
+        self.active_mask:   Dict[str, int]   = {}
+        self.burst_pending: Dict[str, float] = {}
+        self.logs:          Dict[str, EventLog] = {}
+
+    def manager(self, owner_id: str) -> "StatusEffectManager":
+        return StatusEffectManager(owner_id, table=self)
+
+    def register(self, owner_id: str):
+        self._rows.setdefault(owner_id, [])
+        self.active_mask.setdefault(owner_id, 0)
+        self.burst_pending.setdefault(owner_id, 0.0)
+        if owner_id not in self.logs:
+            self.logs[owner_id] = EventLog()
+
+    # ── Row ops ────────────────────────────────────────────────────
+    def add(self, owner_id: str, eid: int, source_id: str,
+            bonus_burst: float = 0.0, default_duration: int = 0,
+            default_icon: str = "?") -> int:
+        defn = EFFECT_DEFS.get(EFFECT_NAMES[eid], {})
+        row  = len(self.owner)
+        self.owner.append(owner_id);  self.eid.append(eid)
+        self.stacks.append(1)
+        self.duration.append(defn.get("duration", default_duration))
+        self.dot.append(defn.get("dot", 0.0))
+        self.move_pen.append(defn.get("move_pen", 0.0))
+        self.atk_pen.append(defn.get("atk_pen", 0.0))
+        self.icon.append(defn.get("icon", default_icon))
+        self.burst.append(defn.get("burst_dmg", 0.0) + bonus_burst)
+        self.source.append(source_id)
+        self.alive.append(True)
+        self._rows.setdefault(owner_id, []).append(row)
+        self._named.setdefault((owner_id, eid), []).append(row)
+        self.active_mask[owner_id] = self.active_mask.get(owner_id, 0) | (1 << eid)
+        return row
+
+    def rows_named(self, owner_id: str, eid: int) -> List[int]:
+        return self._named.get((owner_id, eid), [])
+
+    def rows_of(self, owner_id: str) -> List[int]:
+        return self._rows.get(owner_id, [])
+
+    def remove_mask(self, owner_id: str, mask: int) -> int:
+        """Tombstone every row of `owner_id` whose effect bit is in `mask`."""
+        mask &= self.active_mask.get(owner_id, 0)
+        if not mask:
+            return 0
+        dropped = []
+        for eid in _mask_ids(mask):
+            dropped.extend(self._named.pop((owner_id, eid), ()))
+        for row in dropped:
+            self.alive[row] = False
+        gone = set(dropped)
+        self._rows[owner_id] = [r for r in self._rows[owner_id] if r not in gone]
+        self.active_mask[owner_id] &= ~mask
+        self.dead_rows += len(dropped)
+        return len(dropped)
+
+    def snapshot(self, row: int) -> ActiveEffect:
+        return ActiveEffect(
+            name=EFFECT_NAMES[self.eid[row]], duration=self.duration[row],
+            dot=self.dot[row], move_penalty=self.move_pen[row],
+            atk_penalty=self.atk_pen[row], icon=self.icon[row],
+            stacks=self.stacks[row], burst_dmg=self.burst[row],
+            source_id=self.source[row])
+
+    # ── Ticking ────────────────────────────────────────────────────
+    def _advance(self, rows: List[int], out: Dict[str, List[float]]):
+        """Accumulate this tick's DOT/penalties for `rows` and age them."""
+        owner, stacks, duration = self.owner, self.stacks, self.duration
+        dot, mv, at, alive      = self.dot, self.move_pen, self.atk_pen, self.alive
+        expired = []
+        for row in rows:
+            acc = out[owner[row]]
+            stk = stacks[row]
+            acc[0] += dot[row] * min(stk, 3)
+            acc[1]  = max(acc[1], min(1.0, mv[row] * stk))
+            acc[2]  = max(acc[2], min(1.0, at[row] * stk))
+            duration[row] -= 1
+            if duration[row] <= 0:
+                alive[row] = False
+                expired.append(row)
+        for row in expired:
+            o, eid = owner[row], self.eid[row]
+            self.logs[o].emit(EV_EXPIRED, o, self.icon[row], EFFECT_NAMES[eid])
+            same = self._named[(o, eid)]
+            same.remove(row)
+            if not same:
+                del self._named[(o, eid)]
+                self.active_mask[o] &= ~(1 << eid)
+        if expired:
+            gone = set(expired)
+            for o in {owner[r] for r in expired}:
+                self._rows[o] = [r for r in self._rows[o] if r not in gone]
+            self.dead_rows += len(expired)
+
+    def _results(self, out: Dict[str, List[float]]) -> Dict[str, Tuple[float, float, float]]:
+        res = {}
+        for o, (total_dot, mv, at) in out.items():
+            res[o] = (total_dot + self.burst_pending.get(o, 0.0), mv, at)
+            self.burst_pending[o] = 0.0
+        return res
+
+    def tick_owner(self, owner_id: str) -> Tuple[float, float, float]:
+        out = {owner_id: [0.0, 0.0, 0.0]}
+        self._advance(list(self.rows_of(owner_id)), out)
+        if self.dead_rows > len(self.owner) // 2:
+            self.compact()
+        return self._results(out)[owner_id]
+
+    def tick_all(self) -> Dict[str, Tuple[float, float, float]]:
+        """Advance every registered agent; {owner: (total_dot, move_pen, atk_pen)}."""
+        out = {o: [0.0, 0.0, 0.0] for o in self._rows}
+        self._advance([r for r, live in enumerate(self.alive) if live], out)
+        self.compact()
+        return self._results(out)
+
+    def compact(self):
+        if not self.dead_rows:
+            return
+        keep = [r for r, live in enumerate(self.alive) if live]
+        for col in ("owner", "eid", "stacks", "duration", "dot", "move_pen",
+                    "atk_pen", "icon", "burst", "source"):
+            old = getattr(self, col)
+            setattr(self, col, [old[r] for r in keep])
+        self.alive     = [True] * len(keep)
+        self.dead_rows = 0
+        self._rows  = {o: [] for o in self._rows}
+        self._named = {}
+        for row, (o, eid) in enumerate(zip(self.owner, self.eid)):
+            self._rows[o].append(row)
+            self._named.setdefault((o, eid), []).append(row)
+
+
 class StatusEffectManager:
     """
     Manages all active status effects on one agent.
     Handles stacking, combos, counters, and tick processing.
+
+    A manager is a view onto an EffectTable. Managers created without a
+    table get a private one; managers sharing a table can be advanced
+    together with `table.tick_all()`.
     """
-    def __init__(self, owner_id: str):
+    def __init__(self, owner_id: str, table: Optional[EffectTable] = None):
         self.owner_id   = owner_id
-        self.effects:   List[ActiveEffect] = []
-        self.combo_log: List[str] = []
-        self.burst_pending: float = 0.0   # burst dmg to apply this tick
+        self.table      = table if table is not None else EffectTable()
+        self.table.register(owner_id)
+
+    @property
+    def effects(self) -> List[ActiveEffect]:
+        """Snapshot of this agent's active effects, in application order."""
+        return [self.table.snapshot(r) for r in self.table.rows_of(self.owner_id)]
+
+    @property
+    def combo_log(self) -> EventLog:
+        return self.table.logs[self.owner_id]
+
+    @property
+    def burst_pending(self) -> float:
+        return self.table.burst_pending[self.owner_id]
 
     # ── Apply a new effect ─────────────────────────────────────────
     def apply(self, effect_name: str, source_id: str,
               force: bool = False) -> Optional[ActiveEffect]:
-        defn = EFFECT_DEFS.get(effect_name)
-        if not defn: return None
+        eid = EFFECT_ID.get(effect_name)
+        if eid is None or effect_name not in EFFECT_DEFS: return None
+        t = self.table
 
         # Counter: does this effect cancel something?
-        cancelled = self._try_cancel(effect_name)
+        cancelled = self._try_cancel(eid)
 
         # Check if same effect already active → stack it
-        existing = next((e for e in self.effects if e.name == effect_name), None)
-        if existing and not force:
-            existing.stacks = min(existing.stacks + 1, 3)
-            existing.duration = max(existing.duration,
-                                    defn["duration"])  # refresh duration
-            fx = existing
+        same = t.rows_named(self.owner_id, eid)
+        if same and not force:
+            row = same[0]
+            t.stacks[row]   = min(t.stacks[row] + 1, 3)
+            t.duration[row] = max(t.duration[row],
+                                  EFFECT_DEFS[effect_name]["duration"])  # refresh duration
         else:
-            fx = ActiveEffect(
-                name         = effect_name,
-                duration     = defn["duration"],
-                dot          = defn.get("dot", 0.0),
-                move_penalty = defn.get("move_pen", 0.0),
-                atk_penalty  = defn.get("atk_pen", 0.0),
-                icon         = defn.get("icon", "?"),
-                burst_dmg    = defn.get("burst_dmg", 0.0),
-                source_id    = source_id,
-            )
-            self.effects.append(fx)
-            if fx.burst_dmg > 0:
-                self.burst_pending += fx.burst_dmg
+            row = t.add(self.owner_id, eid, source_id)
+            if t.burst[row] > 0:
+                t.burst_pending[self.owner_id] += t.burst[row]
+        fx = t.snapshot(row)
 
         # Check for combos
-        self._check_combos(effect_name, source_id)
+        self._check_combos(eid, source_id)
         return fx
 
-    def _try_cancel(self, new_effect: str) -> Optional[str]:
-        cancelled = COUNTERS.get(new_effect)
-        if cancelled:
-            before = len(self.effects)
-            self.effects = [e for e in self.effects if e.name != cancelled]
-            if len(self.effects) < before:
-                self.combo_log.append(
-                    f"  ✨ [{self.owner_id}] {new_effect} CANCELLED {cancelled}!")
-                return cancelled
-        return None
-
-    def _check_combos(self, new_effect: str, source_id: str):
-        active_names = {e.name for e in self.effects}
-        for (a, b), (combo_name, bonus_dmg, msg) in COMBOS.items():
-            if new_effect in (a, b) and (a in active_names and b in active_names):
+    def _try_cancel(self, eid: int) -> Optional[str]:
+        hit = CANCEL_MASK[eid] & self.table.active_mask[self.owner_id]
+        if not hit:
+            return None
+        self.table.remove_mask(self.owner_id, hit)
+        cancelled = ", ".join(EFFECT_NAMES[c] for c in _mask_ids(hit))
+        self.combo_log.emit(EV_CANCELLED, self.owner_id, EFFECT_NAMES[eid], cancelled)
+        return cancelled
+
+    def _check_combos(self, eid: int, source_id: str):
+        t = self.table
+        # activity is judged on the effects present before any combo fires
+        present = t.active_mask[self.owner_id]
+        for need, combo_id, bonus_dmg, msg in COMBO_PARTNERS[eid]:
+            if present & need == need:
                 # Remove source effects, apply combo
-                self.effects = [e for e in self.effects
-                                if e.name not in (a, b)]
-                combo_defn = EFFECT_DEFS.get(combo_name, {})
-                combo_fx = ActiveEffect(
-                    name         = combo_name,
-                    duration     = combo_defn.get("duration", 4),
-                    dot          = combo_defn.get("dot", 0.0),
-                    move_penalty = combo_defn.get("move_pen", 0.0),
-                    atk_penalty  = combo_defn.get("atk_pen", 0.0),
-                    icon         = combo_defn.get("icon","💥"),
-                    burst_dmg    = combo_defn.get("burst_dmg", 0.0) + bonus_dmg,
-                    source_id    = source_id,
-                )
-                self.effects.append(combo_fx)
-                if combo_fx.burst_dmg > 0:
-                    self.burst_pending += combo_fx.burst_dmg
-                self.combo_log.append(f"  ⚡ COMBO [{self.owner_id}] {msg} "
-                                      f"(+{bonus_dmg:.0f} burst dmg)")
+                t.remove_mask(self.owner_id, need)
+                row = t.add(self.owner_id, combo_id, source_id, bonus_burst=bonus_dmg,
+                            default_duration=4, default_icon="💥")
+                if t.burst[row] > 0:
+                    t.burst_pending[self.owner_id] += t.burst[row]
+                self.combo_log.emit(EV_COMBO, self.owner_id, msg, bonus_dmg)
 
     # ── Per-tick processing ────────────────────────────────────────
     def tick(self) -> Tuple[float, float, float]:
         """Returns (total_dot, move_penalty, atk_penalty) for this tick."""
-        total_dot  = 0.0
-        max_mv_pen = 0.0
-        max_at_pen = 0.0
-        burst      = self.burst_pending
-        self.burst_pending = 0.0
-
-        still_active = []
-        for fx in self.effects:
-            total_dot  += fx.effective_dot()
-            max_mv_pen  = max(max_mv_pen, fx.effective_move_pen())
-            max_at_pen  = max(max_at_pen, fx.effective_atk_pen())
-            fx.duration -= 1
-            if fx.duration > 0:
-                still_active.append(fx)
-            else:
-                self.combo_log.append(f"  ⏰ [{self.owner_id}] {fx.icon}{fx.name} expired")
-        self.effects = still_active
-        return total_dot + burst, max_mv_pen, max_at_pen
+        return self.table.tick_owner(self.owner_id)
 
     def has(self, name: str) -> bool:
-        return any(e.name == name for e in self.effects)
+        eid = EFFECT_ID.get(name)
+        return eid is not None and bool(self.table.active_mask[self.owner_id] >> eid & 1)
 
     def clear(self, name: str):
-        self.effects = [e for e in self.effects if e.name != name]
+        eid = EFFECT_ID.get(name)
+        if eid is not None:
+            self.table.remove_mask(self.owner_id, 1 << eid)
 
     def flush_log(self) -> List[str]:
-        out = self.combo_log[:]
-        self.combo_log.clear()
-        return out
+        return self.combo_log.flush()
 
     def render(self) -> str:
-        if not self.effects:
+        effects = self.effects
+        if not effects:
             return f"  [{self.owner_id}] No active effects"
-        lines = [f"  [{self.owner_id}] Active Effects ({len(self.effects)}):"]
-        for fx in self.effects:
+        lines = [f"  [{self.owner_id}] Active Effects ({len(effects)}):"]
+        for fx in effects:
             lines.append(f"    {fx.render()}")
         return "\n".join(lines)
 
@@ -238,4 +434,15 @@ if __name__ == "__main__":
     mgr2.apply("root",   "Sylvan-Wraith")
     for line in mgr2.flush_log(): print(line)
     print(mgr2.render())
+
+    print("\n  ── Shared table: whole squad in one tick ──")
+    table = EffectTable()
+    squad = {aid: table.manager(aid) for aid in ALPHA_AGENTS}
+    for aid, m in squad.items():
+        m.apply(random.choice(["burn", "bleed", "slow", "drain"]), "Voidwalker")
+    squad[ALPHA_AGENTS[0]].apply("burn", "Ignis-Prime")
+    for t in range(2):
+        for aid, (dot, mv, atk) in table.tick_all().items():
+            print(f"  Tick {t+1} {aid:<14} DOT={dot:5.1f}  MV_PEN={mv*100:3.0f}%  ATK_PEN={atk*100:3.0f}%")
+    print(f"  Rows live: {len(table.owner)}")
     print()
@@ -0,0 +1,93 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════╗
+║   BACKEND — SHARED PER-TICK WORLD CONTEXT                               ║
+║   Positions · Team Membership · Spatial Index · Centroids · Weather     ║
+╚══════════════════════════════════════════════════════════════════════════╝
+
+Built once per tick by the IntelOrchestrator and handed to every engine, so
+proximity lists, team splits and centroids are derived once instead of once
+per engine. MapEventsEngine only reads positions/team_of from it and buckets
+agents through its own ObjectiveIndex.
+"""
+import math
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+from collections import defaultdict
+from shared_constants import *
+
+CONTEXT_GRID_CELL = 10.0   # spatial index bucket size (map units)
+
+
+@dataclass
+class TickContext:
+    tick:              int
+    positions:         Dict[str, Tuple[float, float]]   # alive agents only
+    team_of:           Dict[str, str]                   # agent → ALPHA | OMEGA
+    sprinting:         Set[str]       = field(default_factory=set)
+    weather:           Dict           = field(default_factory=dict)
+    controlled_points: Dict[str, str] = field(default_factory=dict)   # point → owner
+    tone_map:          Dict[str, str] = field(default_factory=dict)   # agent → chat tone
+    by_team:   Dict[str, Dict[str, Tuple[float, float]]] = field(init=False)
+    _order:    Dict[str, int]                            = field(init=False, repr=False)
+    _grid:     Dict[Tuple[int, int], List[str]]          = field(init=False, repr=False)
+    _centroids: Dict[str, Optional[Tuple[float, float]]] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.by_team    = {"ALPHA": {}, "OMEGA": {}}
+        self._order     = {}
+        self._grid      = defaultdict(list)
+        self._centroids = {}
+        for i, (aid, pos) in enumerate(self.positions.items()):
+            self._order[aid] = i
+            self.by_team.setdefault(self.team_of.get(aid, "?"), {})[aid] = pos
+            self._grid[(int(pos[0] // CONTEXT_GRID_CELL),
+                        int(pos[1] // CONTEXT_GRID_CELL))].append(aid)
+
+    @classmethod
+    def from_team_positions(cls, tick: int,
+                            agent_positions: Dict[str, Tuple[str, Tuple[float, float]]],
+                            **kw) -> "TickContext":
+        """Build from MapEventsEngine-style {agent_id: (team, (x,y))}."""
+        return cls(tick,
+                   {aid: pos for aid, (_, pos) in agent_positions.items()},
+                   {aid: team for aid, (team, _) in agent_positions.items()}, **kw)
+
+    # ── Queries ────────────────────────────────────────────────────────
+    @property
+    def alive(self) -> List[str]:
+        return list(self.positions)
+
+    def team_positions(self, team: str) -> Dict[str, Tuple[float, float]]:
+        return self.by_team.get(team, {})
+
+    def centroid(self, team: str) -> Optional[Tuple[float, float]]:
+        """Mean position of a team's alive agents (memoized for the tick)."""
+        if team not in self._centroids:
+            pts = list(self.team_positions(team).values())
+            self._centroids[team] = midpoint(pts) if pts else None
+        return self._centroids[team]
+
+    def near(self, pos: Tuple[float, float], radius: float,
+             team: Optional[str] = None, inclusive: bool = False) -> List[str]:
+        """
+        Agents within `radius` of `pos` (strictly closer unless `inclusive`),
+        optionally of one team, in the same order as `positions`.
+        """
+        r  = int(math.ceil(radius / CONTEXT_GRID_CELL))
+        cx = int(pos[0] // CONTEXT_GRID_CELL)
+        cy = int(pos[1] // CONTEXT_GRID_CELL)
+        found = []
+        for gy in range(cy - r, cy + r + 1):
+            for gx in range(cx - r, cx + r + 1):
+                for aid in self._grid.get((gx, gy), ()):
+                    if team is not None and self.team_of.get(aid) != team:
+                        continue
+                    d = dist(pos, self.positions[aid])
+                    if d < radius or (inclusive and d == radius):
+                        found.append(aid)
+        found.sort(key=self._order.__getitem__)
+        return found
+
+    def element_mods(self, agent_id: str) -> Dict[str, float]:
+        """This tick's weather/day-phase stat multipliers for one agent."""
+        return self.weather.get("element_mods", {}).get(ELEMENT_OF.get(agent_id, ""), {})
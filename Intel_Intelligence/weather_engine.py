@@ -242,6 +242,7 @@ class WeatherEngine:
             "radar_mult":   self.current.defn["radar_range"],
             "dot_mult":     self.current.defn["dot_mult"],
             "fog_density":  self.current.defn["fog_density"],
+            "stamina_drain":self.current.defn.get("stamina_drain", 0.0),
             "element_mods": {},
         }
         # Merge weather + phase element mods
@@ -32,6 +32,8 @@ Features:
 """
 
 import math
+import os
+import sys
 import random
 import time
 from enum import Enum
@@ -39,23 +41,20 @@ from dataclasses import dataclass, field
 from typing import List, Tuple, Optional, Dict, Set
 from collections import defaultdict, deque
 
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_ROOT = os.path.dirname(_HERE)
+for _path in (_HERE, _ROOT):  # Navig siblings (minimap_canvas) · repo root → `world`
+    if _path not in sys.path:
+        sys.path.append(_path)
+from minimap_canvas import MinimapCanvas, static_layer
+from world.city import MAP_W, MAP_H, LANDMARKS
+from event_log import EventLog, emit
+
 # ─────────────────────────────────────────────────────────────────────
 #  SHARED MAP DATA
 # ─────────────────────────────────────────────────────────────────────
 
-MAP_W = 200
-MAP_H = 200
-
-LANDMARKS = {
-    "Parliament_Hall":  (100, 100), "Clock_Tower":      (100,  60),
-    "North_Stadium":    (100,  30), "South_Stadium":    (100, 170),
-    "East_Tower":       (160, 100), "West_Tower":       ( 40, 100),
-    "North_Shore":      ( 50,  10), "South_Shore":      (150, 190),
-    "Battle_Ground_A":  ( 60,  60), "Battle_Ground_B":  (140, 140),
-    "Road_Junction_N":  (100,  75), "Road_Junction_S":  (100, 125),
-    "Road_Junction_E":  (130, 100), "Road_Junction_W":  ( 70, 100),
-    "Alpha_Spawn":      ( 22,  22), "Omega_Spawn":      (178, 178),
-}
+# MAP_W/MAP_H, LANDMARKS → world.city
 
 def dist(a, b): return math.sqrt((a[0]-b[0])**2+(a[1]-b[1])**2)
 def move_toward(pos, tgt, spd):
@@ -83,6 +82,12 @@ FIRST_STRIKE_BONUS  = 0.25   # +25% dmg
 FIRST_STRIKE_SPEED  = 0.10   # +10% speed for 3 ticks
 JAMMER_RADIUS       = 18.0   # radar jammer suppression radius
 BOSS_RADAR_SIG      = 2.5    # boss signature multiplier on radar
+RADAR_SNAP          = 10     # blip positions snap to this grid (imprecise on purpose)
+RADAR_DEDUP_AGE     = 4      # ticks a blip can be refreshed instead of re-emitted
+BLIP_GRID_CELL      = 20.0   # spatial bucket size for blip lookups
+JAM_RASTER_CELL     = 10.0   # resolution of the jammer coverage raster
+# worst-case distance between a blip's snapped and exact position
+BLIP_SNAP_ERROR     = math.hypot(RADAR_SNAP / 2, RADAR_SNAP / 2)
 
 # Radar node positions (fixed sensors across the map)
 RADAR_NODES: Dict[str, Tuple[float,float]] = {
@@ -117,6 +122,30 @@ class BlipCategory(Enum):
     BOSS_MOB     = "Boss Mob"
     GRANDMASTER  = "Grand Master"
 
+PLAYER_BLIP_CATEGORIES = (BlipCategory.PLAYER_TEAM, BlipCategory.ENEMY_TEAM)
+
+# Radar minimap glyphs
+RADAR_LM_CHARS = {"Parliament_Hall":'P',"Clock_Tower":'C',"North_Stadium":'S',
+                  "South_Stadium":'s',"East_Tower":'E',"West_Tower":'W',
+                  "Battle_Ground_A":'A',"Battle_Ground_B":'B',
+                  "Alpha_Spawn":'α',"Omega_Spawn":'ω'}
+
+RADAR_BLIP_CHARS = {
+    BlipCategory.PLAYER_TEAM: '▲',
+    BlipCategory.ENEMY_TEAM:  '▼',
+    BlipCategory.BOSS_MOB:    '!',
+    BlipCategory.GRANDMASTER: '★',
+}
+
+def _radar_static_layer(width: int, height: int) -> Dict[Tuple[int,int], str]:
+    """Landmark markers, then radar nodes on top."""
+    sx, sy = MAP_W / width, MAP_H / height
+    layer = {(min(int(lx/sx), width-1), min(int(ly/sy), height-1)): RADAR_LM_CHARS.get(lm_n, '.')
+             for lm_n, (lx, ly) in LANDMARKS.items()}
+    for nx, ny in RADAR_NODES.values():
+        layer[(min(int(nx/sx), width-1), min(int(ny/sy), height-1))] = 'R'
+    return layer
+
 # ─────────────────────────────────────────────────────────────────────
 #  RADAR BLIP
 # ─────────────────────────────────────────────────────────────────────
@@ -134,6 +163,7 @@ class RadarBlip:
     direction:    str                  # compass direction from radar node
     is_stale:     bool = False
     first_strike_claimed: Optional[str] = None  # team/mob that claimed it
+    seq:          int = 0                       # emission order (for stable lookups)
 
     def age(self, current_tick: int) -> int:
         return current_tick - self.detected_tick
@@ -183,6 +213,22 @@ class RadarJammer:
     def suppresses(self, pos: Tuple[float,float]) -> bool:
         return dist(self.position, pos) <= self.radius
 
+    def covered_cells(self) -> List[Tuple[int,int]]:
+        """Raster cells the suppression circle overlaps."""
+        x0 = int((self.position[0] - self.radius) // JAM_RASTER_CELL)
+        x1 = int((self.position[0] + self.radius) // JAM_RASTER_CELL)
+        y0 = int((self.position[1] - self.radius) // JAM_RASTER_CELL)
+        y1 = int((self.position[1] + self.radius) // JAM_RASTER_CELL)
+        cells = []
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                # closest point of the cell to the jammer
+                nx = min(max(self.position[0], cx * JAM_RASTER_CELL), (cx + 1) * JAM_RASTER_CELL)
+                ny = min(max(self.position[1], cy * JAM_RASTER_CELL), (cy + 1) * JAM_RASTER_CELL)
+                if dist(self.position, (nx, ny)) <= self.radius:
+                    cells.append((cx, cy))
+        return cells
+
 # ─────────────────────────────────────────────────────────────────────
 #  BOSS MOB
 # ─────────────────────────────────────────────────────────────────────
@@ -205,6 +251,13 @@ BOSS_TEMPLATES = {
     },
 }
 
+# Event codes — formatted only when the log is read
+EV_BOSS_HUNT    = "  {} [{}] HUNTING blip [{}] dir {} strength {}"
+EV_BOSS_RAMPAGE = "  {} [{}] 🔥RAMPAGE — charging {}!"
+EV_JAMMER       = ("  📵 RADAR JAMMER [{}] deployed by [{}] ({}) @ ({:.0f},{:.0f}) "
+                   "radius:{:.0f}u dur:{}t")
+EV_FS_BONUS     = "  🏆 First Strike bonus applied to {}!"
+
 @dataclass
 class BossMob:
     mob_id:    str
@@ -253,13 +306,18 @@ class BossMob:
         return "█"*f + "░"*(width-f)
 
     def tick(self, all_players: List[dict], radar: 'RadarSystem',
-             jammers: List[RadarJammer], tick: int, log: List[str]):
+             tick: int, log: EventLog):
         """Boss AI tick: scan radar, hunt, guard, rampage."""
+        tick_boss_mobs([self], all_players, radar, tick, log)
+
+    # ── Tick phases (driven by tick_boss_mobs) ───────────────────────
+
+    def _sense(self, radar: 'RadarSystem', tick: int) -> bool:
+        """Jammer + HP transitions. Returns True if the boss wants a radar read."""
         self.pos_history.append(self.position)
 
         # Check if jammed
-        self.jammed = any(j.is_active(tick) and j.suppresses(self.position)
-                          for j in jammers)
+        self.jammed = radar.is_jammed(self.position, tick)
 
         # HP-based behaviour transitions
         if self.hp < self.max_hp * 0.25:
@@ -267,23 +325,17 @@ class BossMob:
         elif self.hp < self.max_hp * 0.5 and self.tier == MobTier.GRAND_MASTER:
             self.behaviour = MobBehaviour.RETREAT
 
-        # Radar-based hunting
-        if not self.jammed and self.behaviour not in (MobBehaviour.GUARD,
-                                                      MobBehaviour.RETREAT):
-            visible_blips = radar.get_blips_near(self.position, self.vision)
-            player_blips  = [b for b in visible_blips
-                             if b.category in (BlipCategory.PLAYER_TEAM,
-                                               BlipCategory.ENEMY_TEAM)]
-            if player_blips:
-                strongest = max(player_blips, key=lambda b: b.signal_strength)
-                self.behaviour = MobBehaviour.HUNT
-                self.target_pos = strongest.exact_pos
-                log.append(f"  {self.tier_icon()} [{self.mob_id}] "
-                            f"HUNTING blip [{strongest.blip_id}] "
-                            f"dir {strongest.direction} "
-                            f"strength {strongest.strength_label()}")
-
-        # Movement
+        return not self.jammed and self.behaviour not in (MobBehaviour.GUARD,
+                                                          MobBehaviour.RETREAT)
+
+    def _acquire(self, strongest: RadarBlip, log: EventLog):
+        """Radar-based hunting: lock onto the strongest player blip."""
+        self.behaviour = MobBehaviour.HUNT
+        self.target_pos = strongest.exact_pos
+        emit(log, EV_BOSS_HUNT, self.tier_icon(), self.mob_id, strongest.blip_id,
+             strongest.direction, strongest.strength_label())
+
+    def _move(self, nearest_player: Optional[dict], log: EventLog):
         if self.behaviour == MobBehaviour.GUARD and self.guard_point:
             guard_pos = LANDMARKS.get(self.guard_point, self.position)
             if dist(self.position, guard_pos) > 8:
@@ -297,12 +349,11 @@ class BossMob:
 
         elif self.behaviour == MobBehaviour.RAMPAGE:
             # Charge nearest player
-            if all_players:
-                nearest_p = min(all_players, key=lambda p: dist(self.position, p["pos"]))
-                self.position = clamp(move_toward(self.position, nearest_p["pos"],
+            if nearest_player is not None:
+                self.position = clamp(move_toward(self.position, nearest_player["pos"],
                                                   self.speed * 1.5))
-                log.append(f"  {self.tier_icon()} [{self.mob_id}] "
-                           f"🔥RAMPAGE — charging {nearest_p['id']}!")
+                emit(log, EV_BOSS_RAMPAGE, self.tier_icon(), self.mob_id,
+                     nearest_player['id'])
 
         elif self.behaviour == MobBehaviour.PATROL:
             # Random patrol drift
@@ -316,18 +367,6 @@ class BossMob:
             edge = (random.choice([0.0, 200.0]), random.uniform(0, 200))
             self.position = clamp(move_toward(self.position, edge, self.speed*0.8))
 
-        # Emit radar signature (if not jammed)
-        if not self.jammed:
-            radar.register_signature(
-                source_id  = self.mob_id,
-                category   = (BlipCategory.GRANDMASTER
-                              if self.tier == MobTier.GRAND_MASTER
-                              else BlipCategory.BOSS_MOB),
-                position   = self.position,
-                multiplier = self.radar_sig,
-                tick       = tick,
-            )
-
     def render_status(self) -> str:
         jam = "📵JAMMED" if self.jammed else ""
         return (f"  {self.tier_icon()} {self.mob_id:<22} [{self.element:<10}] "
@@ -336,6 +375,54 @@ class BossMob:
                 f"Pos:({self.position[0]:.0f},{self.position[1]:.0f})  "
                 f"Kills:{self.kills}  FS:{self.first_strikes_won}  {jam}")
 
+def tick_boss_mobs(bosses: List[BossMob], all_players: List[dict],
+                   radar: 'RadarSystem', tick: int, log: EventLog):
+    """
+    Batched boss AI tick.
+    Sensing, radar visibility and nearest-player lookups are resolved for
+    every boss in one pass each, then movement and radar emission run in
+    boss order (so RNG draws match a sequential per-boss tick).
+    """
+    live = [b for b in bosses if b.alive]
+    if not live:
+        return
+
+    # Phase 1 — jammers + HP transitions
+    wants_radar = [b._sense(radar, tick) for b in live]
+
+    # Phase 2 — strongest player blip for every radar-reading boss at once
+    readers   = [b for b, w in zip(live, wants_radar) if w]
+    strongest = radar.strongest_player_blips([(b.position, b.vision) for b in readers])
+    for boss, blip in zip(readers, strongest):
+        if blip is not None:
+            boss._acquire(blip, log)
+
+    # Phase 3 — nearest player for rampaging bosses (positions unpacked once)
+    nearest: Dict[str, dict] = {}
+    rampaging = [b for b in live if b.behaviour == MobBehaviour.RAMPAGE]
+    if rampaging and all_players:
+        pxs = [p["pos"][0] for p in all_players]
+        pys = [p["pos"][1] for p in all_players]
+        idx = range(len(all_players))
+        for boss in rampaging:
+            bx, by = boss.position
+            i = min(idx, key=lambda k: (pxs[k]-bx)**2 + (pys[k]-by)**2)
+            nearest[boss.mob_id] = all_players[i]
+
+    # Phase 4 — movement + radar signature (if not jammed)
+    for boss in live:
+        boss._move(nearest.get(boss.mob_id), log)
+        if not boss.jammed:
+            radar.register_signature(
+                source_id  = boss.mob_id,
+                category   = (BlipCategory.GRANDMASTER
+                              if boss.tier == MobTier.GRAND_MASTER
+                              else BlipCategory.BOSS_MOB),
+                position   = boss.position,
+                multiplier = boss.radar_sig,
+                tick       = tick,
+            )
+
 # ─────────────────────────────────────────────────────────────────────
 #  FIRST STRIKE TRACKER
 # ─────────────────────────────────────────────────────────────────────
@@ -356,6 +443,85 @@ class FirstStrikeEvent:
                 f"({self.location[0]:.0f},{self.location[1]:.0f}) "
                 f"| +{self.dmg_bonus*100:.0f}% dmg | +{self.spd_bonus*100:.0f}% spd")
 
+# ─────────────────────────────────────────────────────────────────────
+#  BLIP STORE  (keyed dedup · spatial grid · TTL buckets)
+# ─────────────────────────────────────────────────────────────────────
+
+def _blip_cell(pos: Tuple[float,float]) -> Tuple[int,int]:
+    return (int(pos[0] // BLIP_GRID_CELL), int(pos[1] // BLIP_GRID_CELL))
+
+class BlipStore:
+    """
+    Indexed container for radar blips.
+      - by_key:  (source_id, radar_node) → newest blip  — O(1) dedup
+      - grid:    cell → blips whose detected_pos falls in it
+      - buckets: detected_tick → blips, so expiry only touches old ticks
+    Iteration yields blips in emission order.
+    """
+    def __init__(self):
+        self._blips:   Dict[str, RadarBlip] = {}
+        self._by_key:  Dict[Tuple[str,str], RadarBlip] = {}
+        self._grid:    Dict[Tuple[int,int], Dict[str, RadarBlip]] = defaultdict(dict)
+        self._buckets: Dict[int, Dict[str, RadarBlip]] = defaultdict(dict)
+
+    def __len__(self):  return len(self._blips)
+    def __iter__(self): return iter(self._blips.values())
+
+    def latest(self, source_id: str, radar_node: str) -> Optional[RadarBlip]:
+        return self._by_key.get((source_id, radar_node))
+
+    def add(self, blip: RadarBlip):
+        self._blips[blip.blip_id] = blip
+        self._by_key[(blip.source_id, blip.radar_node)] = blip
+        self._grid[_blip_cell(blip.detected_pos)][blip.blip_id] = blip
+        self._buckets[blip.detected_tick][blip.blip_id] = blip
+
+    def refresh(self, blip: RadarBlip, tick: int, strength: float):
+        if blip.detected_tick != tick:
+            self._buckets[blip.detected_tick].pop(blip.blip_id, None)
+            self._buckets[tick][blip.blip_id] = blip
+        blip.detected_tick   = tick
+        blip.is_stale        = False
+        blip.signal_strength = strength
+
+    def _remove(self, blip: RadarBlip):
+        del self._blips[blip.blip_id]
+        key = (blip.source_id, blip.radar_node)
+        if self._by_key.get(key) is blip:
+            del self._by_key[key]
+        cell = _blip_cell(blip.detected_pos)
+        bucket = self._grid[cell]
+        del bucket[blip.blip_id]
+        if not bucket:
+            del self._grid[cell]
+
+    def expire(self, tick: int):
+        """Mark blips stale at TTL-2 and drop them at TTL+2 — walks only old buckets."""
+        for t in [t for t in self._buckets if tick - t >= RADAR_BLIP_TTL - 2]:
+            bucket = self._buckets[t]
+            if tick - t >= RADAR_BLIP_TTL + 2:
+                for blip in bucket.values():
+                    self._remove(blip)
+                del self._buckets[t]
+            else:
+                for blip in bucket.values():
+                    blip.is_stale = True
+            if not bucket:
+                self._buckets.pop(t, None)
+
+    def near(self, pos: Tuple[float,float], radius: float) -> List[RadarBlip]:
+        """Blips whose cell overlaps the query circle, in emission order (unfiltered)."""
+        x0, y0 = _blip_cell((pos[0] - radius, pos[1] - radius))
+        x1, y1 = _blip_cell((pos[0] + radius, pos[1] + radius))
+        out = []
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = self._grid.get((cx, cy))
+                if bucket:
+                    out.extend(bucket.values())
+        out.sort(key=lambda b: b.seq)
+        return out
+
 # ─────────────────────────────────────────────────────────────────────
 #  RADAR SYSTEM  (the core of this backend)
 # ─────────────────────────────────────────────────────────────────────
@@ -367,19 +533,28 @@ class RadarSystem:
     First team/mob to physically reach a blip claims First Strike.
     """
     def __init__(self):
-        self.blips:         List[RadarBlip] = []
+        self.store:         BlipStore = BlipStore()
         self.blip_seq:      int = 0
         self.jammers:       List[RadarJammer] = []
         self.jammer_seq:    int = 0
+        # raster cell → jammers whose radius overlaps it; changes only on deploy/purge
+        self.jam_raster:    Dict[Tuple[int,int], List[RadarJammer]] = defaultdict(list)
         self.first_strikes: List[FirstStrikeEvent] = []
         self.fs_seq:        int = 0
         self.tick:          int = 0
-        self.log:           List[str] = []
+        self.log:           EventLog = EventLog()
 
         # Stats per team
         self.detections:    Dict[str, int] = defaultdict(int)
         self.first_strike_board: Dict[str, int] = defaultdict(int)
 
+        # (width, height) → cached minimap canvas
+        self._minimaps:     Dict[Tuple[int,int], MinimapCanvas] = {}
+
+    @property
+    def blips(self) -> List[RadarBlip]:
+        return list(self.store)
+
     def register_signature(self, source_id: str, category: BlipCategory,
                            position: Tuple[float,float], multiplier: float,
                            tick: int):
@@ -387,32 +562,25 @@ class RadarSystem:
         Called by entities that move through the map.
         Each radar node within range creates a blip.
         """
+        if self.is_jammed(position, tick):
+            return
         for node_name, node_pos in RADAR_NODES.items():
             d = dist(position, node_pos)
             if d <= RADAR_SCAN_RADIUS * multiplier:
-                # Check jammer suppression
-                if any(j.is_active(tick) and j.suppresses(position)
-                       for j in self.jammers):
-                    continue
 
                 # Deduplicate: if same source already has recent blip from this node
-                existing = next((b for b in self.blips
-                                 if b.source_id == source_id and
-                                    b.radar_node == node_name and
-                                    b.age(tick) < 4), None)
-                if existing:
-                    # Refresh
-                    existing.detected_tick = tick
-                    existing.is_stale      = False
-                    existing.signal_strength = 1.0 - (d / (RADAR_SCAN_RADIUS * multiplier))
+                existing = self.store.latest(source_id, node_name)
+                if existing and existing.age(tick) < RADAR_DEDUP_AGE:
+                    self.store.refresh(existing, tick,
+                                       1.0 - (d / (RADAR_SCAN_RADIUS * multiplier)))
                     continue
 
                 # New blip
                 self.blip_seq += 1
                 angle    = angle_deg(node_pos, position)
-                # Approximate position = snap to 10-unit grid (imprecise on purpose)
-                approx_x = round(position[0] / 10) * 10
-                approx_y = round(position[1] / 10) * 10
+                # Approximate position = snap to grid (imprecise on purpose)
+                approx_x = round(position[0] / RADAR_SNAP) * RADAR_SNAP
+                approx_y = round(position[1] / RADAR_SNAP) * RADAR_SNAP
                 sig      = 1.0 - (d / (RADAR_SCAN_RADIUS * multiplier))
                 blip     = RadarBlip(
                     blip_id        = f"BLP{self.blip_seq:04d}",
@@ -424,8 +592,9 @@ class RadarSystem:
                     detected_tick  = tick,
                     signal_strength= max(0.1, sig),
                     direction      = compass(angle),
+                    seq            = self.blip_seq,
                 )
-                self.blips.append(blip)
+                self.store.add(blip)
                 self.detections[category.value] += 1
 
     def scan_all(self, entities: List[dict], tick: int):
@@ -445,18 +614,13 @@ class RadarSystem:
                 ent.get("radar_sig", 1.0), tick
             )
 
-        # Mark stale blips
-        for blip in self.blips:
-            if blip.age(tick) >= RADAR_BLIP_TTL - 2:
-                blip.is_stale = True
-
-        # Purge very old blips
-        self.blips = [b for b in self.blips if b.age(tick) < RADAR_BLIP_TTL + 2]
+        # Mark stale blips, purge very old ones
+        self.store.expire(tick)
 
     def check_first_strike(self, claimer_id: str, team: str,
                            position: Tuple[float,float], tick: int) -> Optional[FirstStrikeEvent]:
         """Check if this entity is first to reach any active blip."""
-        for blip in self.blips:
+        for blip in self.store.near(position, FIRST_STRIKE_RANGE + BLIP_SNAP_ERROR):
             if (blip.is_active(tick) and
                     blip.first_strike_claimed is None and
                     blip.source_id != claimer_id and   # can't claim your own blip
@@ -472,28 +636,77 @@ class RadarSystem:
                 )
                 self.first_strikes.append(fs)
                 self.first_strike_board[claimer_id] += 1
-                self.log.append(fs.render())
+                self.log.emit(FirstStrikeEvent.render, fs)
                 return fs
         return None
 
     def get_blips_near(self, pos: Tuple[float,float],
                        radius: float) -> List[RadarBlip]:
-        return [b for b in self.blips
+        return [b for b in self.store.near(pos, radius)
                 if dist(pos, b.detected_pos) <= radius and not b.is_stale]
 
+    def strongest_player_blips(self, observers: List[Tuple[Tuple[float,float], float]]
+                               ) -> List[Optional[RadarBlip]]:
+        """
+        For each (position, radius) observer, the strongest non-stale player
+        blip in range (ties → earliest emitted). Player blips are bucketed
+        once per call, so every observer only tests nearby cells.
+        """
+        if not observers:
+            return []
+        grid: Dict[Tuple[int,int], List[RadarBlip]] = defaultdict(list)
+        for b in self.store:
+            if not b.is_stale and b.category in PLAYER_BLIP_CATEGORIES:
+                grid[_blip_cell(b.detected_pos)].append(b)
+        out: List[Optional[RadarBlip]] = []
+        for pos, radius in observers:
+            best = None
+            if grid:
+                x0, y0 = _blip_cell((pos[0] - radius, pos[1] - radius))
+                x1, y1 = _blip_cell((pos[0] + radius, pos[1] + radius))
+                for cx in range(x0, x1 + 1):
+                    for cy in range(y0, y1 + 1):
+                        for b in grid.get((cx, cy), ()):
+                            if dist(pos, b.detected_pos) > radius:
+                                continue
+                            if (best is None or
+                                    (b.signal_strength, -b.seq) >
+                                    (best.signal_strength, -best.seq)):
+                                best = b
+            out.append(best)
+        return out
+
+    def is_jammed(self, pos: Tuple[float,float], tick: int) -> bool:
+        """Single raster lookup; only jammers overlapping this cell are tested."""
+        cell = (int(pos[0] // JAM_RASTER_CELL), int(pos[1] // JAM_RASTER_CELL))
+        candidates = self.jam_raster.get(cell)
+        if not candidates:
+            return False
+        return any(j.is_active(tick) and j.suppresses(pos) for j in candidates)
+
     def deploy_jammer(self, owner_id: str, team: str,
                       position: Tuple[float,float], tick: int):
         self.jammer_seq += 1
         jid = f"JAM{self.jammer_seq:03d}"
         jam = RadarJammer(jid, owner_id, team, position, tick)
         self.jammers.append(jam)
-        self.log.append(f"  📵 RADAR JAMMER [{jid}] deployed by [{owner_id}] "
-                        f"({team}) @ ({position[0]:.0f},{position[1]:.0f}) "
-                        f"radius:{JAMMER_RADIUS:.0f}u dur:{jam.duration}t")
+        for cell in jam.covered_cells():
+            self.jam_raster[cell].append(jam)
+        self.log.emit(EV_JAMMER, jid, owner_id, team, position[0], position[1],
+                      JAMMER_RADIUS, jam.duration)
         return jam
 
     def purge_jammers(self, tick: int):
+        expired = [j for j in self.jammers if not j.is_active(tick)]
+        if not expired:
+            return
         self.jammers = [j for j in self.jammers if j.is_active(tick)]
+        for jam in expired:
+            for cell in jam.covered_cells():
+                cell_jams = self.jam_raster[cell]
+                cell_jams.remove(jam)
+                if not cell_jams:
+                    del self.jam_raster[cell]
 
     # ── Renders ──────────────────────────────────────────────────────
 
@@ -502,11 +715,11 @@ class RadarSystem:
         print(f"\n{'═'*80}")
         print(f"  📡 RADAR SYSTEM DISPLAY  "
               f"| Tick {self.tick:03d}  "
-              f"| Active Blips: {sum(1 for b in self.blips if b.is_active(self.tick))}"
+              f"| Active Blips: {sum(1 for b in self.store if b.is_active(self.tick))}"
               f"  | Jammers: {sum(1 for j in self.jammers if j.is_active(self.tick))}")
         print(f"{'═'*80}")
 
-        active = [b for b in self.blips if b.is_active(self.tick)]
+        active = [b for b in self.store if b.is_active(self.tick)]
         if not active:
             print("  (no active radar blips)")
         else:
@@ -524,7 +737,7 @@ class RadarSystem:
         print(f"  {'Node':<25} {'Position':>14} {'Blips Detected':>16}")
         print(f"  {'─'*60}")
         for nname, npos in RADAR_NODES.items():
-            node_blips = sum(1 for b in self.blips
+            node_blips = sum(1 for b in self.store
                              if b.radar_node == nname and b.is_active(self.tick))
             print(f"  {nname:<25} ({npos[0]:3.0f},{npos[1]:3.0f})     {node_blips:>10}")
 
@@ -551,58 +764,51 @@ class RadarSystem:
         for rank, (eid, count) in enumerate(board[:8], 1):
             print(f"    #{rank}  {eid:<20}  {count} first strikes")
 
-    def render_radar_minimap(self, width=55, height=25):
-        """ASCII radar minimap showing blip positions and nodes."""
+    def _radar_canvas(self, width: int, height: int) -> MinimapCanvas:
+        """Cached canvas per resolution; only the blip/jammer layer is rebuilt."""
         sx = MAP_W / width
         sy = MAP_H / height
-        grid = [[' ']*width for _ in range(height)]
-
-        # Landmark markers
-        lm_chars = {"Parliament_Hall":'P',"Clock_Tower":'C',"North_Stadium":'S',
-                    "South_Stadium":'s',"East_Tower":'E',"West_Tower":'W',
-                    "Battle_Ground_A":'A',"Battle_Ground_B":'B',
-                    "Alpha_Spawn":'α',"Omega_Spawn":'ω'}
-        for lm_n, (lx,ly) in LANDMARKS.items():
-            gx = min(int(lx/sx), width-1)
-            gy = min(int(ly/sy), height-1)
-            grid[gy][gx] = lm_chars.get(lm_n, '.')
-
-        # Radar nodes
-        for nname, (nx,ny) in RADAR_NODES.items():
-            gx = min(int(nx/sx), width-1)
-            gy = min(int(ny/sy), height-1)
-            grid[gy][gx] = 'R'
-
-        # Blips
-        blip_chars = {
-            BlipCategory.PLAYER_TEAM: '▲',
-            BlipCategory.ENEMY_TEAM:  '▼',
-            BlipCategory.BOSS_MOB:    '!',
-            BlipCategory.GRANDMASTER: '★',
-        }
-        for b in self.blips:
+        canvas = self._minimaps.get((width, height))
+        if canvas is None:
+            canvas = self._minimaps[(width, height)] = MinimapCanvas(width, height)
+            canvas.load_static(static_layer("radar", width, height, _radar_static_layer))
+
+        # Blips, then jammers on top
+        marks: Dict[Tuple[int,int], str] = {}
+        for b in self.store:
             if b.is_active(self.tick):
-                gx = min(int(b.detected_pos[0]/sx), width-1)
-                gy = min(int(b.detected_pos[1]/sy), height-1)
-                grid[gy][gx] = blip_chars.get(b.category, '?')
-
-        # Jammers (show suppression area edges)
+                marks[(min(int(b.detected_pos[0]/sx), width-1),
+                       min(int(b.detected_pos[1]/sy), height-1))] = \
+                    RADAR_BLIP_CHARS.get(b.category, '?')
         for j in self.jammers:
             if j.is_active(self.tick):
-                gx = min(int(j.position[0]/sx), width-1)
-                gy = min(int(j.position[1]/sy), height-1)
-                grid[gy][gx] = '⊘'
-
+                marks[(min(int(j.position[0]/sx), width-1),
+                       min(int(j.position[1]/sy), height-1))] = '⊘'
+        canvas.set_overlay(marks)
+        return canvas
+
+    def radar_minimap_frame(self, width=55, height=25) -> str:
+        """Bordered ASCII radar minimap as one string."""
+        canvas = self._radar_canvas(width, height)
         border = '─' * (width + 4)
-        print(f"\n  ┌{border}┐")
-        print(f"  │  RADAR MAP  Tick:{self.tick:03d}  "
-              f"({'─'*(width - 24)}) │")
-        for row in grid:
-            print(f"  │  {''.join(row)}  │")
-        print(f"  ├{border}┤")
-        print(f"  │  R=RadarNode  ▲=Alpha  ▼=Omega  !=Boss  ★=GrandMaster  "
-              f"⊘=Jammer  P=Parliament  {'─'*2} │")
-        print(f"  └{border}┘")
+        lines  = [f"\n  ┌{border}┐",
+                  f"  │  RADAR MAP  Tick:{self.tick:03d}  "
+                  f"({'─'*(width - 24)}) │"]
+        lines.extend(f"  │  {row}  │" for row in canvas.rows())
+        canvas.diff()   # a full frame counts as sent
+        lines.append(f"  ├{border}┤")
+        lines.append(f"  │  R=RadarNode  ▲=Alpha  ▼=Omega  !=Boss  ★=GrandMaster  "
+                     f"⊘=Jammer  P=Parliament  {'─'*2} │")
+        lines.append(f"  └{border}┘")
+        return '\n'.join(lines)
+
+    def radar_minimap_diff(self, width=55, height=25) -> List[Tuple[int, str]]:
+        """Grid rows changed since the last frame/diff at this resolution."""
+        return self._radar_canvas(width, height).diff()
+
+    def render_radar_minimap(self, width=55, height=25):
+        """ASCII radar minimap showing blip positions and nodes."""
+        print(self.radar_minimap_frame(width, height))
 
     def detection_summary(self) -> str:
         lines = ["\n  📊 Radar Detection Summary:"]
@@ -611,9 +817,7 @@ class RadarSystem:
         return "\n".join(lines)
 
     def flush_log(self):
-        out = self.log[:]
-        self.log.clear()
-        return out
+        return self.log.flush()
 
 # ─────────────────────────────────────────────────────────────────────
 #  ISLAND GRAND MASTER REGISTRY
@@ -641,10 +845,11 @@ class GrandMasterRegistry:
             self.grand_masters.append(gm)
 
     def tick_all(self, all_players: List[dict], radar: RadarSystem,
-                 jammers: List[RadarJammer], tick: int, log: List[str]):
-        for gm in self.grand_masters:
-            if gm.alive:
-                gm.tick(all_players, radar, jammers, tick, log)
+                 tick: int, log: EventLog,
+                 extra_mobs: Optional[List[BossMob]] = None):
+        """Batched tick for the Grand Masters plus any Rogue/Elite mobs passed in."""
+        tick_boss_mobs(self.grand_masters + (extra_mobs or []),
+                       all_players, radar, tick, log)
 
     def render_status(self):
         print(f"\n  ── 👑 ISLAND GRAND MASTERS ─────────────────────────────────")
@@ -710,7 +915,7 @@ def run_mob_navigation_demo():
     gm_reg.render_status()
 
     for t in range(1, 35):
-        tick_log = []
+        tick_log = EventLog()
 
         # Move players
         advance_players(alpha_players, (1.0, 1.0), 4.0)
@@ -730,16 +935,14 @@ def run_mob_navigation_demo():
 
         # Boss ticks
         all_player_list = alpha_players + omega_players
-        gm_reg.tick_all(all_player_list, radar, radar.jammers, t, tick_log)
-        for mob in all_boss_mobs:
-            if mob.alive:
-                mob.tick(all_player_list, radar, radar.jammers, t, tick_log)
+        gm_reg.tick_all(all_player_list, radar, t, tick_log,
+                        extra_mobs=all_boss_mobs)
 
         # First strike checks
         for p in alpha_players + omega_players:
             fs = radar.check_first_strike(p["id"], p["team"], p["pos"], t)
             if fs:
-                tick_log.append(f"  🏆 First Strike bonus applied to {p['id']}!")
+                tick_log.emit(EV_FS_BONUS, p['id'])
 
         # Special events
         if t == 5:
@@ -755,7 +958,7 @@ def run_mob_navigation_demo():
         radar.purge_jammers(t)
 
         # Print log
-        for line in tick_log:
+        for line in tick_log.flush():
             print(line)
         for line in radar.flush_log():
             print(line)
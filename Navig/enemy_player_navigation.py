@@ -43,6 +43,8 @@ Features:
 """
 
 import math
+import os
+import sys
 import random
 import time
 from enum import Enum
@@ -50,34 +52,18 @@ from dataclasses import dataclass, field
 from typing import List, Tuple, Optional, Dict, Set
 from collections import deque, defaultdict
 
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)   # repo root → shared `world` package
+from world.city import MAP_W, MAP_H, ZONE_BOUNDS, ZONE_RASTER
+from world.city import POI_LANDMARKS as LANDMARKS, POI_RASTER as LANDMARK_RASTER
+
 # ─────────────────────────────────────────────────────────────────────
 #  SHARED MAP DATA
 # ─────────────────────────────────────────────────────────────────────
 
-MAP_W = 200
-MAP_H = 200
-
-LANDMARKS = {
-    "Parliament_Hall":  (100, 100), "Clock_Tower":      (100,  60),
-    "North_Stadium":    (100,  30), "South_Stadium":    (100, 170),
-    "East_Tower":       (160, 100), "West_Tower":       ( 40, 100),
-    "North_Shore":      ( 50,  10), "South_Shore":      (150, 190),
-    "Battle_Ground_A":  ( 60,  60), "Battle_Ground_B":  (140, 140),
-    "Alpha_Spawn":      ( 22,  22), "Omega_Spawn":      (178, 178),
-}
-
-ZONE_BOUNDS = {
-    "Parliament_Core": (85, 85, 115, 115),
-    "Clock_Tower":     (90, 50, 110,  70),
-    "North_Stadium":   (75, 15, 125,  45),
-    "South_Stadium":   (75,155, 125, 185),
-    "East_Tower":      (145,85, 175, 115),
-    "West_Tower":      (25, 85,  55, 115),
-    "Battle_A":        (45, 45,  75,  75),
-    "Battle_B":        (125,125,155, 155),
-    "North_Shore":     (0,   0,  80,  20),
-    "South_Shore":     (120,180,200, 200),
-}
+# MAP_W/MAP_H, ZONE_BOUNDS → world.city; LANDMARKS here are the
+# points of interest only (no road junctions).
 
 def dist(a, b): return math.sqrt((a[0]-b[0])**2+(a[1]-b[1])**2)
 def clamp(p): return (max(0.0,min(float(MAP_W),p[0])), max(0.0,min(float(MAP_H),p[1])))
@@ -91,11 +77,12 @@ def angle_deg(a, b): return math.degrees(math.atan2(b[1]-a[1], b[0]-a[0])) % 360
 def compass(ang):
     dirs = ["N","NE","E","SE","S","SW","W","NW","N"]
     return dirs[int((ang+22.5)//45)]
+
+def nearest_landmark(pos):
+    return LANDMARK_RASTER.nearest(pos)
+
 def get_zone(pos):
-    x, y = pos
-    for name, (x1,y1,x2,y2) in ZONE_BOUNDS.items():
-        if x1<=x<=x2 and y1<=y<=y2: return name
-    return "Open_Field"
+    return ZONE_RASTER.zone(pos)
 
 # ─────────────────────────────────────────────────────────────────────
 #  TENSION & ESCALATION CONSTANTS
@@ -113,6 +100,7 @@ TOTAL_WAR_DURATION        = 5      # ticks at full reveal
 ENGAGEMENT_RANGE          = 35.0   # distance for combat trigger
 GHOST_MOVE_DURATION       = 4      # ticks hidden from intel
 DECOY_DURATION            = 8      # ticks decoy broadcasts false position
+SUBGROUP_LINK_RANGE       = 40.0   # agents chained closer than this count as one sub-group
 
 # ─────────────────────────────────────────────────────────────────────
 #  ESCALATION STAGE
@@ -345,6 +333,91 @@ def compass(ang):
     dirs = ["N","NE","E","SE","S","SW","W","NW","N"]
     return dirs[int((ang+22.5)//45)]
 
+# ─────────────────────────────────────────────────────────────────────
+#  BATCHED GROUP GEOMETRY
+# ─────────────────────────────────────────────────────────────────────
+
+def count_clusters(xs: List[float], ys: List[float],
+                   link: float = SUBGROUP_LINK_RANGE) -> int:
+    """
+    Connected components of the "within `link` units" graph over the points.
+    Points are bucketed into link-sized cells so only neighbouring cells are
+    compared; components are merged with union-find.
+    """
+    n = len(xs)
+    if n == 0:
+        return 0
+    parent = list(range(n))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    cells: Dict[Tuple[int,int], List[int]] = defaultdict(list)
+    for i in range(n):
+        cells[(int(xs[i] // link), int(ys[i] // link))].append(i)
+    link_sq = link * link
+    for (cx, cy), members in cells.items():
+        for nx in (cx-1, cx, cx+1):
+            for ny in (cy-1, cy, cy+1):
+                for j in cells.get((nx, ny), ()):
+                    for i in members:
+                        if i < j and (xs[i]-xs[j])**2 + (ys[i]-ys[j])**2 <= link_sq:
+                            ri, rj = find(i), find(j)
+                            if ri != rj:
+                                parent[rj] = ri
+    return sum(1 for i in range(n) if find(i) == i)
+
+@dataclass
+class GroupStats:
+    """Raw geometry for one team — input to GroupIntel, before noise/decoys."""
+    alive:         List[PlayerEntity]
+    visible:       List[PlayerEntity]                   # alive and not ghosted
+    alive_center:  Optional[Tuple[float,float]] = None
+    center:        Optional[Tuple[float,float]] = None  # of visible agents
+    spread:        float = 0.0
+    avg_hp:        float = 0.0
+    velocity:      Tuple[float,float] = (0.0, 0.0)
+    sub_groups:    int = 1
+    likely_target: str = "Unknown"
+
+def build_group_stats(teams: Dict[str, List[PlayerEntity]]) -> Dict[str, GroupStats]:
+    """
+    One pass per team over column lists (x, y, vx, vy, hp%) to get centroid,
+    spread, mean velocity, sub-group count and heading-projected target.
+    """
+    out: Dict[str, GroupStats] = {}
+    for team, players in teams.items():
+        alive   = [p for p in players if p.alive]
+        visible = [p for p in alive if not p.ghost_active]
+        st      = GroupStats(alive=alive, visible=visible)
+        out[team] = st
+        if alive:
+            st.alive_center = midpoint([p.position for p in alive])
+        if not visible:
+            continue
+
+        n   = len(visible)
+        xs  = [p.position[0] for p in visible]
+        ys  = [p.position[1] for p in visible]
+        cx, cy = sum(xs) / n, sum(ys) / n
+        vx  = sum(p.velocity[0] for p in visible) / n
+        vy  = sum(p.velocity[1] for p in visible) / n
+
+        st.center   = (cx, cy)
+        st.spread   = (math.sqrt(max((x-cx)**2 + (y-cy)**2 for x, y in zip(xs, ys)))
+                       if n > 1 else 0.0)
+        st.avg_hp   = sum(p.hp_pct() for p in visible) / n
+        st.velocity = (vx, vy)
+        st.sub_groups = count_clusters(xs, ys)
+
+        # Likely target (which landmark they're heading toward)
+        aim = (cx+vx*15, cy+vy*15) if (vx != 0 or vy != 0) else (cx, cy)
+        st.likely_target = nearest_landmark(aim)
+    return out
+
 # ─────────────────────────────────────────────────────────────────────
 #  TENSION METER
 # ─────────────────────────────────────────────────────────────────────
@@ -440,28 +513,26 @@ class EnemyPlayerNavEngine:
     # ── Intel generation ─────────────────────────────────────────
     def _build_group_intel(self, about_team: str,
                            players: List[PlayerEntity],
-                           tick: int) -> GroupIntel:
-        stage   = self.tension.stage
-        alive   = [p for p in players if p.alive]
-        if not alive:
+                           tick: int,
+                           stats: Optional[GroupStats] = None) -> GroupIntel:
+        stage = self.tension.stage
+        if stats is None:
+            stats = build_group_stats({about_team: players})[about_team]
+        if not stats.alive:
             return GroupIntel(team=about_team, tick=tick, stage=stage,
                               alive_count=0)
 
-        # Filter ghost agents
-        visible = [p for p in alive if not p.ghost_active]
-        if not visible:
+        # Ghost agents are already filtered out of stats.visible
+        if not stats.visible:
             return GroupIntel(team=about_team, tick=tick, stage=stage,
                               alive_count=0, formation_hint="HIDDEN")
 
-        positions = [p.position for p in visible]
-        center    = midpoint(positions)
-        spread    = max(dist(center, p) for p in positions) if len(positions) > 1 else 0.0
-        avg_hp    = sum(p.hp_pct() for p in visible) / len(visible)
-        zone      = get_zone(center)
+        center = stats.center
+        spread = stats.spread
+        zone   = get_zone(center)
 
         # Heading: average velocity direction
-        vx = sum(p.velocity[0] for p in visible) / len(visible)
-        vy = sum(p.velocity[1] for p in visible) / len(visible)
+        vx, vy = stats.velocity
         if abs(vx) < 0.1 and abs(vy) < 0.1:
             hdg = "STATIONARY"
         else:
@@ -481,27 +552,10 @@ class EnemyPlayerNavEngine:
         else:
             approx_center = center
 
-        # Likely target (which landmark they're heading toward)
-        if vx != 0 or vy != 0:
-            future = (center[0]+vx*15, center[1]+vy*15)
-            likely = min(LANDMARKS.keys(), key=lambda k: dist(future, LANDMARKS[k]))
-        else:
-            likely = min(LANDMARKS.keys(), key=lambda k: dist(center, LANDMARKS[k]))
-
-        # Sub-group detection
-        sub_groups = 1
-        if len(visible) >= 3:
-            # Simple: if any pair is far apart, consider it split
-            for i in range(len(visible)):
-                for j in range(i+1, len(visible)):
-                    if dist(visible[i].position, visible[j].position) > 40:
-                        sub_groups = 2
-                        break
-
         # Formation type
         if spread < 8:
             form_type = "Wedge/Stack"
-        elif sub_groups == 2:
+        elif stats.sub_groups >= 2:
             form_type = "Split Push"
         else:
             form_type = "Line/Advance"
@@ -509,7 +563,7 @@ class EnemyPlayerNavEngine:
         # Exact positions (only at TOTAL WAR)
         exact = []
         if stage == EscalationStage.TOTAL_WAR:
-            exact = [(p.agent_id, p.position) for p in alive]
+            exact = [(p.agent_id, p.position) for p in stats.alive]
 
         return GroupIntel(
             team           = about_team,
@@ -519,12 +573,12 @@ class EnemyPlayerNavEngine:
             cluster_radius = spread,
             zone           = zone,
             heading        = hdg,
-            alive_count    = len(visible),
-            hp_pct_est     = avg_hp,
+            alive_count    = len(stats.visible),
+            hp_pct_est     = stats.avg_hp,
             formation_hint = form_hint,
             formation_type = form_type,
-            sub_groups     = sub_groups,
-            likely_target  = likely,
+            sub_groups     = stats.sub_groups,
+            likely_target  = stats.likely_target,
             exact_positions= exact,
             exact_expires_tick = tick + TOTAL_WAR_DURATION,
         )
@@ -561,13 +615,14 @@ class EnemyPlayerNavEngine:
 
     # ── Engagement detection ─────────────────────────────────────
     def _check_engagement(self, alpha: List[PlayerEntity],
-                           omega: List[PlayerEntity]):
-        alive_a = [p for p in alpha if p.alive]
-        alive_o = [p for p in omega if p.alive]
-        if not alive_a or not alive_o:
+                           omega: List[PlayerEntity],
+                           stats: Optional[Dict[str, GroupStats]] = None):
+        if stats is None:
+            stats = build_group_stats({"ALPHA": alpha, "OMEGA": omega})
+        center_a = stats["ALPHA"].alive_center
+        center_o = stats["OMEGA"].alive_center
+        if center_a is None or center_o is None:
             return
-        center_a = midpoint([p.position for p in alive_a])
-        center_o = midpoint([p.position for p in alive_o])
         d = dist(center_a, center_o)
         if d <= ENGAGEMENT_RANGE:
             if self.active_engagement is None:
@@ -609,18 +664,19 @@ class EnemyPlayerNavEngine:
             p.tick_move(tick_log)
             p.check_ghost_expiry(self.tick_num, tick_log)
 
-        # Build intel based on current stage
+        # Build intel based on current stage (geometry for both teams in one pass)
         stage = self.tension.stage
+        stats = build_group_stats({"ALPHA": alpha_players, "OMEGA": omega_players})
 
         if stage != EscalationStage.NORMAL:
             # ALPHA sees OMEGA's intel
             self.alpha_intel = self._build_group_intel(
-                "OMEGA", omega_players, self.tick_num)
+                "OMEGA", omega_players, self.tick_num, stats["OMEGA"])
             self.alpha_intel = self._inject_decoys("OMEGA", self.alpha_intel)
 
             # OMEGA sees ALPHA's intel
             self.omega_intel = self._build_group_intel(
-                "ALPHA", alpha_players, self.tick_num)
+                "ALPHA", alpha_players, self.tick_num, stats["ALPHA"])
             self.omega_intel = self._inject_decoys("ALPHA", self.omega_intel)
 
         # Stale old intel after 6 ticks
@@ -629,7 +685,7 @@ class EnemyPlayerNavEngine:
                 intel.is_stale = True
 
         # Engagement check
-        self._check_engagement(alpha_players, omega_players)
+        self._check_engagement(alpha_players, omega_players, stats)
 
         # Total War: special handling
         if stage == EscalationStage.TOTAL_WAR:
@@ -14,6 +14,8 @@ Features:
       * Visible ONLY to: same-team members + nearby Rogue Mobs in range
       * Generates a chat relay code: [FLARE:AgentID:X:Y:TICK]
   - Shared map state — agents broadcast their explored tiles to teammates
+      * Each agent keeps its own fog layer; teammates within share range
+        (transitively) pool their layers once per tick
   - Real-time minimap ASCII renderer (40×20 view)
   - Zone entry/exit events
   - Path overlay — draw A* routes on minimap
@@ -22,6 +24,8 @@ Features:
 """
 
 import math
+import os
+import sys
 import heapq
 import random
 import time
@@ -30,71 +34,27 @@ from dataclasses import dataclass, field
 from typing import List, Tuple, Optional, Dict, Set
 from collections import deque, defaultdict
 
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_ROOT = os.path.dirname(_HERE)
+for _path in (_HERE, _ROOT):  # Navig siblings (minimap_canvas) · repo root → `world`
+    if _path not in sys.path:
+        sys.path.append(_path)
+from minimap_canvas import MinimapCanvas, static_layer
+from world.city import (MAP_W, MAP_H, LANDMARKS, ROAD_GRAPH, ZONE_BOUNDS, KEY_POINTS,
+                        LANDMARK_DIST, LANDMARK_RASTER, ZONE_RASTER)
+from event_log import EventLog, emit
+
 # ─────────────────────────────────────────────────────────────────────
 #  MAP CONSTANTS  (shared with all backends)
 # ─────────────────────────────────────────────────────────────────────
-MAP_W = 200
-MAP_H = 200
-
-LANDMARKS: Dict[str, Tuple[float, float]] = {
-    "Parliament_Hall":  (100, 100),
-    "Clock_Tower":      (100,  60),
-    "North_Stadium":    (100,  30),
-    "South_Stadium":    (100, 170),
-    "East_Tower":       (160, 100),
-    "West_Tower":       ( 40, 100),
-    "North_Shore":      ( 50,  10),
-    "South_Shore":      (150, 190),
-    "Battle_Ground_A":  ( 60,  60),
-    "Battle_Ground_B":  (140, 140),
-    "Road_Junction_N":  (100,  75),
-    "Road_Junction_S":  (100, 125),
-    "Road_Junction_E":  (130, 100),
-    "Road_Junction_W":  ( 70, 100),
-    "Alpha_Spawn":      ( 22,  22),
-    "Omega_Spawn":      (178, 178),
-}
-
-ROAD_GRAPH: Dict[str, List[str]] = {
-    "Alpha_Spawn":     ["Road_Junction_W", "Battle_Ground_A", "North_Shore"],
-    "Omega_Spawn":     ["Road_Junction_E", "Battle_Ground_B", "South_Shore"],
-    "Road_Junction_N": ["Parliament_Hall", "Clock_Tower", "Road_Junction_W", "Road_Junction_E"],
-    "Road_Junction_S": ["Parliament_Hall", "Road_Junction_W", "Road_Junction_E", "South_Stadium"],
-    "Road_Junction_E": ["Parliament_Hall", "Road_Junction_N", "Road_Junction_S", "East_Tower"],
-    "Road_Junction_W": ["Parliament_Hall", "Road_Junction_N", "Road_Junction_S", "West_Tower"],
-    "Parliament_Hall": ["Road_Junction_N", "Road_Junction_S", "Road_Junction_E", "Road_Junction_W"],
-    "Clock_Tower":     ["Road_Junction_N", "North_Stadium"],
-    "North_Stadium":   ["Clock_Tower", "North_Shore"],
-    "South_Stadium":   ["Road_Junction_S", "South_Shore"],
-    "East_Tower":      ["Road_Junction_E", "Battle_Ground_B"],
-    "West_Tower":      ["Road_Junction_W", "Battle_Ground_A"],
-    "Battle_Ground_A": ["West_Tower", "Alpha_Spawn", "Road_Junction_W"],
-    "Battle_Ground_B": ["East_Tower", "Omega_Spawn", "Road_Junction_E"],
-    "North_Shore":     ["Alpha_Spawn", "North_Stadium"],
-    "South_Shore":     ["Omega_Spawn", "South_Stadium"],
-}
-
-ZONE_BOUNDS = {
-    "Parliament_Core": (85, 85, 115, 115),
-    "Clock_Tower":     (90, 50, 110,  70),
-    "North_Stadium":   (75, 15, 125,  45),
-    "South_Stadium":   (75,155, 125, 185),
-    "East_Tower":      (145,85, 175, 115),
-    "West_Tower":      (25,  85,  55, 115),
-    "Battle_A":        (45,  45,  75,  75),
-    "Battle_B":        (125,125, 155, 155),
-    "North_Shore":     (0,   0,   80,  20),
-    "South_Shore":     (120,180, 200, 200),
-}
-
-KEY_POINTS = ["Parliament_Hall", "Clock_Tower", "North_Stadium",
-              "South_Stadium", "East_Tower", "West_Tower"]
+# MAP_W/MAP_H, LANDMARKS, ROAD_GRAPH, ZONE_BOUNDS, KEY_POINTS → world.city
 
 VISION_RADIUS   = 25.0   # how far each agent sees
 FLARE_DURATION  = 8      # ticks flare stays active
 FLARE_BLINK     = 2      # blink every N ticks
 FLARE_RADIUS    = 45.0   # how far flare is visible
 MOB_FLARE_RANGE = 30.0   # rogue mobs can see flare within this range
+FLARE_GRID_CELL = FLARE_RADIUS   # spatial bucket size for flare lookups
 
 # ─────────────────────────────────────────────────────────────────────
 #  MATH
@@ -109,13 +69,10 @@ def move_toward(pos, tgt, spd):
 def clamp(pos): return (max(0.0,min(float(MAP_W),pos[0])), max(0.0,min(float(MAP_H),pos[1])))
 
 def nearest_landmark(pos):
-    return min(LANDMARKS.keys(), key=lambda k: dist(pos, LANDMARKS[k]))
+    return LANDMARK_RASTER.nearest(pos)
 
 def get_zone(pos):
-    x, y = pos
-    for name, (x1,y1,x2,y2) in ZONE_BOUNDS.items():
-        if x1<=x<=x2 and y1<=y<=y2: return name
-    return "Open_Field"
+    return ZONE_RASTER.zone(pos)
 
 # ─────────────────────────────────────────────────────────────────────
 #  A*  PATHFINDER
@@ -124,7 +81,8 @@ def get_zone(pos):
 def a_star(start_lm: str, goal_lm: str) -> List[str]:
     if start_lm == goal_lm: return [start_lm]
     if start_lm not in ROAD_GRAPH: return [start_lm, goal_lm]
-    def h(n): return dist(LANDMARKS[n], LANDMARKS[goal_lm])
+    h_row = LANDMARK_DIST[goal_lm]
+    def h(n): return h_row[n]
     open_q = [(h(start_lm), start_lm)]
     came   = {}
     g      = {start_lm: 0.0}
@@ -137,7 +95,7 @@ def a_star(start_lm: str, goal_lm: str) -> List[str]:
             path.append(start_lm)
             return list(reversed(path))
         for nb in ROAD_GRAPH.get(cur, []):
-            tg = g[cur] + dist(LANDMARKS[cur], LANDMARKS[nb])
+            tg = g[cur] + LANDMARK_DIST[cur][nb]
             if tg < g.get(nb, float('inf')):
                 came[nb] = cur; g[nb] = tg
                 heapq.heappush(open_q, (tg+h(nb), nb))
@@ -165,6 +123,7 @@ class FlareSignal:
     message:    str = ""          # optional attached message
     is_sos:     bool = False       # true = emergency/lost signal
     relay_code: str = ""           # [FLARE:sender:X:Y:tick]
+    seq:        int = 0            # firing order (for stable lookups)
 
     def __post_init__(self):
         x, y = self.position
@@ -206,6 +165,23 @@ class FlareSignal:
 # ─────────────────────────────────────────────────────────────────────
 
 FOG_TILE = 5   # each tile represents 5×5 map units
+FOG_SHARE_RANGE = VISION_RADIUS * 1.5   # teammates this close pool their fog
+
+def vision_tiles(center: Tuple[float,float], radius: float,
+                 cols: int, rows: int) -> List[Tuple[int,int]]:
+    """Fog tiles whose centre lies within `radius` of `center`."""
+    cx, cy = int(center[0]//FOG_TILE), int(center[1]//FOG_TILE)
+    tile_r = int(radius // FOG_TILE) + 1
+    tiles = []
+    for dy in range(-tile_r, tile_r+1):
+        for dx in range(-tile_r, tile_r+1):
+            tx, ty = cx+dx, cy+dy
+            if 0 <= tx < cols and 0 <= ty < rows:
+                world_x = tx * FOG_TILE + FOG_TILE//2
+                world_y = ty * FOG_TILE + FOG_TILE//2
+                if dist(center, (world_x, world_y)) <= radius:
+                    tiles.append((tx, ty))
+    return tiles
 
 class FogOfWar:
     """
@@ -219,32 +195,41 @@ class FogOfWar:
         # 0 = unexplored | 1 = explored (seen) | 2 = currently visible
         self.grid: List[List[int]] = [[0]*self.cols for _ in range(self.rows)]
         self.explored_pct = 0.0
+        self._explored = 0
+        self._visible: Set[Tuple[int,int]] = set()   # tiles currently at 2
+        # tiles changed since the last drain (consumed by cached minimaps)
+        self.dirty:   Set[Tuple[int,int]] = set()
+        self.epoch    = 0
+
+    def drain_dirty(self) -> Set[Tuple[int,int]]:
+        out, self.dirty = self.dirty, set()
+        self.epoch += 1
+        return out
 
     def reveal(self, center: Tuple[float,float], radius: float = VISION_RADIUS):
-        cx, cy = int(center[0]//FOG_TILE), int(center[1]//FOG_TILE)
-        tile_r = int(radius // FOG_TILE) + 1
+        return self.reveal_tiles(vision_tiles(center, radius, self.cols, self.rows))
+
+    def reveal_tiles(self, tiles: List[Tuple[int,int]]) -> int:
         revealed = 0
-        for dy in range(-tile_r, tile_r+1):
-            for dx in range(-tile_r, tile_r+1):
-                tx, ty = cx+dx, cy+dy
-                if 0 <= tx < self.cols and 0 <= ty < self.rows:
-                    world_x = tx * FOG_TILE + FOG_TILE//2
-                    world_y = ty * FOG_TILE + FOG_TILE//2
-                    if dist(center, (world_x, world_y)) <= radius:
-                        if self.grid[ty][tx] == 0:
-                            revealed += 1
-                        self.grid[ty][tx] = 2
-        total = self.cols * self.rows
-        explored = sum(1 for row in self.grid for v in row if v > 0)
-        self.explored_pct = (explored / total) * 100
+        for tx, ty in tiles:
+            v = self.grid[ty][tx]
+            if v == 2:
+                continue
+            if v == 0:
+                revealed += 1
+            self.grid[ty][tx] = 2
+            self._visible.add((tx, ty))
+            self.dirty.add((tx, ty))
+        self._explored += revealed
+        self.explored_pct = (self._explored / (self.cols * self.rows)) * 100
         return revealed
 
     def decay_visible(self):
         """After each tick, currently-visible (2) fades to explored (1)."""
-        for row in self.grid:
-            for i, v in enumerate(row):
-                if v == 2:
-                    row[i] = 1
+        for tx, ty in self._visible:
+            self.grid[ty][tx] = 1
+        self.dirty |= self._visible
+        self._visible = set()
 
     def is_visible(self, pos: Tuple[float,float]) -> bool:
         tx = int(pos[0] // FOG_TILE)
@@ -266,11 +251,120 @@ class FogOfWar:
             for rx in range(self.cols):
                 if other.grid[ry][rx] > self.grid[ry][rx]:
                     self.grid[ry][rx] = other.grid[ry][rx]
+                    self.dirty.add((rx, ry))
+                    if self.grid[ry][rx] == 2:
+                        self._visible.add((rx, ry))
+        self._explored = sum(1 for row in self.grid for v in row if v > 0)
+        self.explored_pct = (self._explored / (self.cols * self.rows)) * 100
+
+class FogLayer:
+    """
+    One agent's own fog knowledge, stored as two bitsets over the fog tiles
+    (bit = ty*cols + tx). Pooling a group of layers is a single OR per bitset.
+    """
+    __slots__ = ("cols", "rows", "explored", "visible")
+
+    def __init__(self):
+        self.cols     = MAP_W // FOG_TILE
+        self.rows     = MAP_H // FOG_TILE
+        self.explored = 0
+        self.visible  = 0
+
+    def reveal_tiles(self, tiles: List[Tuple[int,int]]):
+        mask = 0
+        for tx, ty in tiles:
+            mask |= 1 << (ty * self.cols + tx)
+        self.explored |= mask
+        self.visible  |= mask
+
+    def decay_visible(self):
+        self.visible = 0
+
+    def _bit(self, pos: Tuple[float,float]) -> int:
+        tx = int(pos[0] // FOG_TILE)
+        ty = int(pos[1] // FOG_TILE)
+        if 0 <= tx < self.cols and 0 <= ty < self.rows:
+            return 1 << (ty * self.cols + tx)
+        return 0
+
+    def state(self, bit: int) -> int:
+        """FogOfWar grid value (0/1/2) of tile bit `bit`."""
+        if self.visible >> bit & 1:
+            return 2
+        return self.explored >> bit & 1
+
+    def is_visible(self, pos: Tuple[float,float]) -> bool:
+        return bool(self.visible & self._bit(pos))
+
+    def is_explored(self, pos: Tuple[float,float]) -> bool:
+        return bool(self.explored & self._bit(pos))
+
+    @property
+    def explored_pct(self) -> float:
+        return bin(self.explored).count("1") / (self.cols * self.rows) * 100
+
+def share_fog_layers(agents: List['MapAgent'], share_range: float = FOG_SHARE_RANGE) -> int:
+    """
+    Pool fog between agents that are within `share_range` of each other,
+    transitively: every connected component of the proximity graph ends up
+    with the OR of its members' layers. Returns the number of groups merged.
+    """
+    agents = [a for a in agents if a.fog_layer is not None]
+    parent = list(range(len(agents)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    # bucket agents so each only tests neighbouring cells
+    cells: Dict[Tuple[int,int], List[int]] = defaultdict(list)
+    for i, a in enumerate(agents):
+        cells[(int(a.position[0] // share_range),
+               int(a.position[1] // share_range))].append(i)
+    for (cx, cy), members in cells.items():
+        for nx in (cx-1, cx, cx+1):
+            for ny in (cy-1, cy, cy+1):
+                for j in cells.get((nx, ny), ()):
+                    for i in members:
+                        if i < j and dist(agents[i].position, agents[j].position) < share_range:
+                            ri, rj = find(i), find(j)
+                            if ri != rj:
+                                parent[rj] = ri
+
+    groups: Dict[int, List[FogLayer]] = defaultdict(list)
+    for i, a in enumerate(agents):
+        groups[find(i)].append(a.fog_layer)
+    merged = 0
+    for layers in groups.values():
+        if len(layers) < 2:
+            continue
+        explored = visible = 0
+        for layer in layers:
+            explored |= layer.explored
+            visible  |= layer.visible
+        for layer in layers:
+            layer.explored = explored
+            layer.visible  = visible
+        merged += 1
+    return merged
 
 # ─────────────────────────────────────────────────────────────────────
 #  MAP AGENT
 # ─────────────────────────────────────────────────────────────────────
 
+# Event codes — formatted only when the log is read
+EV_ENTER_ZONE  = "  🗺️  [{}] entered zone [{}]"
+EV_DISCOVER_LM = "  📍 [{}] discovered landmark [{}]"
+EV_LOST        = "  ⚠️  [{}] LOST at ({:.0f},{:.0f})!"
+EV_RECOVERED   = "  ✅ [{}] recovered from LOST state"
+EV_TICK_RULE   = "\n" + "─" * 70
+EV_TICK_HEADER = "  🗺️  MAP NAV TICK {:03d} | Team {}"
+EV_CAPTURED    = "  🚩 [{}] CAPTURED [{}]!"
+EV_SEES_SOS    = "  📡 [{}] SEES SOS FLARE from [{}] → {}"
+EV_MOB_FLARE   = "  👾 MOB [{}] ATTRACTED by flare {} at ({:.0f},{:.0f})"
+
 @dataclass
 class MapAgent:
     agent_id:  str
@@ -290,6 +384,7 @@ class MapAgent:
 
     zone_history: List[str] = field(default_factory=list)
     explored_landmarks: Set[str] = field(default_factory=set)
+    fog_layer:    Optional[FogLayer] = None   # agent's own view (set by MapNavigator)
 
     def __post_init__(self):
         self.last_seen_pos = self.position
@@ -310,18 +405,21 @@ class MapAgent:
             jy = random.uniform(-0.5, 0.5)
             self.position = clamp((self.position[0]+jx, self.position[1]+jy))
 
-        # Reveal fog
-        fog.reveal(self.position, self.vision)
+        # Reveal fog (team view + own layer)
+        tiles = vision_tiles(self.position, self.vision, fog.cols, fog.rows)
+        fog.reveal_tiles(tiles)
+        if self.fog_layer is not None:
+            self.fog_layer.reveal_tiles(tiles)
 
         # Zone detection
         zone = get_zone(self.position)
         lm   = nearest_landmark(self.position)
         if zone not in self.zone_history:
             self.zone_history.append(zone)
-            log.append(f"  🗺️  [{self.agent_id}] entered zone [{zone}]")
+            emit(log, EV_ENTER_ZONE, self.agent_id, zone)
         if lm not in self.explored_landmarks and dist(self.position, LANDMARKS[lm]) < 15:
             self.explored_landmarks.add(lm)
-            log.append(f"  📍 [{self.agent_id}] discovered landmark [{lm}]")
+            emit(log, EV_DISCOVER_LM, self.agent_id, lm)
 
         # Stuck / lost detection
         if len(self.pos_history) >= 8:
@@ -331,8 +429,7 @@ class MapAgent:
                 if self.ticks_stuck >= 10 and not self.is_lost:
                     self.is_lost = True
                     self.ticks_stuck = 0
-                    log.append(f"  ⚠️  [{self.agent_id}] LOST at "
-                               f"({self.position[0]:.0f},{self.position[1]:.0f})!")
+                    emit(log, EV_LOST, self.agent_id, *self.position)
                     # Auto-fire SOS flare
                     if tick - self.flare_fired > FLARE_DURATION:
                         flare_manager.fire_flare(
@@ -346,7 +443,7 @@ class MapAgent:
                 self.ticks_stuck = 0
                 if self.is_lost:
                     self.is_lost = False
-                    log.append(f"  ✅ [{self.agent_id}] recovered from LOST state")
+                    emit(log, EV_RECOVERED, self.agent_id)
 
         self.last_seen_pos = self.position
 
@@ -371,11 +468,31 @@ class MapAgent:
 #  FLARE MANAGER
 # ─────────────────────────────────────────────────────────────────────
 
+def _flare_cell(pos: Tuple[float,float]) -> Tuple[int,int]:
+    return (int(pos[0] // FLARE_GRID_CELL), int(pos[1] // FLARE_GRID_CELL))
+
 class FlareManager:
+    """
+    Owns all flares for one navigator.
+    Flares are bucketed by expiry tick (purge touches only expiring flares)
+    and by map cell (range checks only touch nearby flares). Each observer's
+    in-range flare list is cached until the observer moves or the flare set
+    changes (the cache is emptied on every change, so observers that left
+    do not linger); blinking is then a per-tick filter on that list.
+    """
     def __init__(self):
         self.flares:    List[FlareSignal] = []
         self.flare_seq: int = 0
         self.relay_log: List[str] = []
+        self._expiry:   Dict[int, List[FlareSignal]] = defaultdict(list)
+        self._grid:     Dict[Tuple[int,int], List[FlareSignal]] = defaultdict(list)
+        # (observer_id, team, is_mob) → (pos, flares in range); emptied on any flare change
+        self._in_range: Dict[Tuple[str,str,bool],
+                             Tuple[Tuple[float,float], List[FlareSignal]]] = {}
+
+    def _changed(self):
+        """Flare set changed: every cached range list is now stale."""
+        self._in_range.clear()
 
     def fire_flare(self, sender_id: str, team: str,
                    position: Tuple[float,float], tick: int,
@@ -391,8 +508,12 @@ class FlareManager:
             fired_tick = tick,
             message    = message,
             is_sos     = is_sos,
+            seq        = self.flare_seq,
         )
         self.flares.append(flare)
+        self._expiry[tick + FLARE_DURATION].append(flare)
+        self._grid[_flare_cell(position)].append(flare)
+        self._changed()
         self.relay_log.append(flare.relay_code)
         sos_str = " 🆘 SOS SIGNAL" if is_sos else ""
         entry   = (f"  🔴 FLARE FIRED by [{sender_id}] ({team}) "
@@ -403,15 +524,61 @@ class FlareManager:
         if log is not None: log.append(entry)
         return flare
 
+    def _scan_range(self, observer_pos: Tuple[float,float],
+                    observer_team: str, is_mob: bool) -> List[FlareSignal]:
+        x0, y0 = _flare_cell((observer_pos[0] - FLARE_RADIUS, observer_pos[1] - FLARE_RADIUS))
+        x1, y1 = _flare_cell((observer_pos[0] + FLARE_RADIUS, observer_pos[1] + FLARE_RADIUS))
+        found = []
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                for f in self._grid.get((cx, cy), ()):
+                    if f.can_see(observer_pos, observer_team, is_mob):
+                        found.append(f)
+        found.sort(key=lambda f: f.seq)
+        return found
+
+    def _flares_in_range(self, observer_id: str, observer_pos: Tuple[float,float],
+                         observer_team: str, is_mob: bool) -> List[FlareSignal]:
+        key    = (observer_id, observer_team, is_mob)
+        cached = self._in_range.get(key)
+        if cached and cached[0] == observer_pos:
+            return cached[1]
+        found = self._scan_range(observer_pos, observer_team, is_mob)
+        self._in_range[key] = (observer_pos, found)
+        return found
+
+    def visible_flares_batch(self, observers: List[Tuple[str, Tuple[float,float], str, bool]],
+                             current_tick: int) -> List[List[FlareSignal]]:
+        """
+        Visible flares for many observers at once.
+        observers: [(observer_id, pos, team, is_mob), ...] → one list per observer.
+        Blink state is resolved once per flare, not once per observer.
+        """
+        lit = {f.flare_id for f in self.flares if f.is_visible(current_tick)}
+        if not lit:
+            return [[] for _ in observers]
+        return [[f for f in self._flares_in_range(oid, pos, team, is_mob)
+                 if f.flare_id in lit]
+                for oid, pos, team, is_mob in observers]
+
     def get_visible_flares(self, observer_pos: Tuple[float,float],
                            observer_team: str, current_tick: int,
                            is_mob: bool = False) -> List[FlareSignal]:
-        return [f for f in self.flares
-                if f.is_visible(current_tick) and
-                   f.can_see(observer_pos, observer_team, is_mob)]
+        return [f for f in self._scan_range(observer_pos, observer_team, is_mob)
+                if f.is_visible(current_tick)]
 
     def purge_expired(self, current_tick: int):
+        due = [t for t in self._expiry if t <= current_tick]
+        if not due:
+            return
+        for t in due:
+            for f in self._expiry.pop(t):
+                cell = _flare_cell(f.position)
+                self._grid[cell].remove(f)
+                if not self._grid[cell]:
+                    del self._grid[cell]
         self.flares = [f for f in self.flares if f.is_active(current_tick)]
+        self._changed()
 
     def render_active(self, current_tick: int):
         active = [f for f in self.flares if f.is_active(current_tick)]
@@ -421,6 +588,27 @@ class FlareManager:
         for f in active:
             print(f.render(current_tick))
 
+# ─────────────────────────────────────────────────────────────────────
+#  MINIMAP GLYPHS
+# ─────────────────────────────────────────────────────────────────────
+
+FOG_CHARS = {0: '░', 1: '·', 2: ' '}
+MINIMAP_LM_CHARS = {
+    "Parliament_Hall": 'P', "Clock_Tower": 'C',
+    "North_Stadium": 'S',   "South_Stadium": 's',
+    "East_Tower": 'E',       "West_Tower": 'W',
+    "Battle_Ground_A": 'A', "Battle_Ground_B": 'B',
+    "North_Shore": '~',      "South_Shore": '~',
+    "Alpha_Spawn": '⊕',     "Omega_Spawn": '⊗',
+}
+MINIMAP_TEAM_CHARS = {'ALPHA': '▲', 'OMEGA': '▼', 'MOB': 'M'}
+
+def _landmark_layer(width: int, height: int) -> Dict[Tuple[int,int], str]:
+    sx, sy = MAP_W / width, MAP_H / height
+    return {(min(int(lx / sx), width-1), min(int(ly / sy), height-1)):
+            MINIMAP_LM_CHARS.get(lm_name, 'L')
+            for lm_name, (lx, ly) in LANDMARKS.items()}
+
 # ─────────────────────────────────────────────────────────────────────
 #  MAP NAVIGATOR (team coordinator)
 # ─────────────────────────────────────────────────────────────────────
@@ -436,27 +624,32 @@ class MapNavigator:
         self.fog         = FogOfWar(team)
         self.flare_mgr   = FlareManager()
         self.tick_num    = 0
-        self.log: List[str] = []
+        self.log: EventLog = EventLog()
         self.captured_points: Dict[str, str] = {k: "Neutral" for k in KEY_POINTS}
         self.event_log:  List[str] = []
+        # (width, height, show_fog, viewer) → [canvas, fog tile → cells, fog sync state]
+        self._minimaps: Dict[Tuple[int,int,bool,Optional[str]], list] = {}
+        for agent in self.agents:
+            if agent.fog_layer is None:
+                agent.fog_layer = FogLayer()
 
     def tick(self, mob_agents: List[MapAgent] = None):
         self.tick_num += 1
-        tick_log = [f"\n{'─'*70}",
-                    f"  🗺️  MAP NAV TICK {self.tick_num:03d} | Team {self.team}"]
+        tick_log = self.log
+        tick_log.emit(EV_TICK_RULE)
+        tick_log.emit(EV_TICK_HEADER, self.tick_num, self.team)
 
         # Move all agents + reveal fog
         for agent in self.agents:
             agent.tick_move(self.fog, self.flare_mgr, self.tick_num, tick_log)
 
-        # Fog sharing between teammates
-        for i, a in enumerate(self.agents):
-            for j, b in enumerate(self.agents):
-                if i != j and dist(a.position, b.position) < VISION_RADIUS * 1.5:
-                    self.fog.merge_from(FogOfWar(self.team))   # simplified: shared view
+        # Fog sharing between teammates (one OR per proximity group)
+        share_fog_layers(self.agents)
 
         # Decay fog visibility
         self.fog.decay_visible()
+        for agent in self.agents:
+            agent.fog_layer.decay_visible()
 
         # Check landmark captures
         for lm_name in KEY_POINTS:
@@ -465,34 +658,33 @@ class MapNavigator:
                 if dist(agent.position, lm_pos) < 8:
                     if self.captured_points.get(lm_name) != self.team:
                         self.captured_points[lm_name] = self.team
-                        tick_log.append(f"  🚩 [{agent.agent_id}] CAPTURED [{lm_name}]!")
+                        tick_log.emit(EV_CAPTURED, agent.agent_id, lm_name)
+
+        # Flare visibility for agents + mobs in one batched pass
+        mobs      = mob_agents or []
+        observers = ([(a.agent_id, a.position, self.team, False) for a in self.agents] +
+                     [(m.agent_id, m.position, m.team, True) for m in mobs])
+        seen      = self.flare_mgr.visible_flares_batch(observers, self.tick_num)
 
         # Show visible flares to agents
-        for agent in self.agents:
-            visible = self.flare_mgr.get_visible_flares(
-                agent.position, self.team, self.tick_num)
+        for agent, visible in zip(self.agents, seen):
             for flare in visible:
                 if flare.is_sos:
-                    tick_log.append(f"  📡 [{agent.agent_id}] SEES SOS FLARE "
-                                    f"from [{flare.sender_id}] → {flare.relay_code}")
+                    tick_log.emit(EV_SEES_SOS, agent.agent_id, flare.sender_id,
+                                  flare.relay_code)
 
         # Mob flare detection
-        if mob_agents:
-            for mob in mob_agents:
-                visible = self.flare_mgr.get_visible_flares(
-                    mob.position, mob.team, self.tick_num, is_mob=True)
+        if mobs:
+            for mob, visible in zip(mobs, seen[len(self.agents):]):
                 for flare in visible:
-                    tick_log.append(f"  👾 MOB [{mob.agent_id}] ATTRACTED by flare "
-                                    f"{flare.relay_code} at "
-                                    f"({flare.position[0]:.0f},{flare.position[1]:.0f})")
+                    tick_log.emit(EV_MOB_FLARE, mob.agent_id, flare.relay_code,
+                                  *flare.position)
                     # Mob navigates toward flare
                     mob.navigate_to(nearest_landmark(flare.position), tick_log)
 
         # Purge expired flares
         self.flare_mgr.purge_expired(self.tick_num)
 
-        self.log.extend(tick_log)
-
     def player_fire_flare(self, agent_id: str, message: str = ""):
         """Player manually triggers a flare for their agent."""
         agent = next((a for a in self.agents if a.agent_id == agent_id), None)
@@ -513,77 +705,113 @@ class MapNavigator:
             return code
         return None
 
-    def render_minimap(self, width: int = 50, height: int = 25,
-                       show_fog: bool = True):
-        """ASCII minimap renderer with fog, agents, flares, landmarks."""
-        # Scale factors
+    def _viewer_layer(self, viewer: str) -> FogLayer:
+        agent = next((a for a in self.agents if a.agent_id == viewer), None)
+        if agent is None:
+            raise ValueError(f"unknown agent {viewer!r} for team {self.team}")
+        return agent.fog_layer
+
+    def _minimap_canvas(self, width: int, height: int, show_fog: bool,
+                        viewer: Optional[str] = None) -> MinimapCanvas:
+        """
+        Cached canvas per resolution; fog cells resync from dirty tiles only.
+        With `viewer`, fog comes from that agent's own (shared) fog layer and
+        only tiles whose bits changed since its last frame are redrawn.
+        """
+        layer = self._viewer_layer(viewer) if viewer is not None else None
+        key   = (width, height, show_fog, viewer)
+        entry = self._minimaps.get(key)
+        if entry is None:
+            sx = MAP_W / width
+            sy = MAP_H / height
+            canvas = MinimapCanvas(width, height, fill='░' if show_fog else '·')
+            # fog tile → minimap cells sampling it
+            tile_cells: Dict[Tuple[int,int], List[Tuple[int,int]]] = defaultdict(list)
+            if show_fog:
+                for gy in range(height):
+                    for gx in range(width):
+                        tile_x = int((gx * sx + sx/2) // FOG_TILE)
+                        tile_y = int((gy * sy + sy/2) // FOG_TILE)
+                        if (0 <= tile_x < self.fog.cols and
+                                0 <= tile_y < self.fog.rows):
+                            tile_cells[(tile_x, tile_y)].append((gx, gy))
+            canvas.load_static(static_layer("map", width, height, _landmark_layer))
+            entry = self._minimaps[key] = [canvas, tile_cells,
+                                           None if layer is None else (0, 0)]
+
+        canvas, tile_cells, epoch = entry
+        if show_fog and layer is not None:
+            explored, visible = epoch
+            changed = (layer.explored ^ explored) | (layer.visible ^ visible)
+            cols    = layer.cols
+            while changed:
+                low  = changed & -changed
+                bit  = low.bit_length() - 1
+                ch   = FOG_CHARS[layer.state(bit)]
+                for gx, gy in tile_cells.get((bit % cols, bit // cols), ()):
+                    canvas.set_base(gx, gy, ch)
+                changed ^= low
+            entry[2] = (layer.explored, layer.visible)
+        elif show_fog:
+            dirty = self.fog.drain_dirty()
+            # another resolution drained the fog since our last frame → full resync
+            tiles = dirty if epoch == self.fog.epoch - 1 else tile_cells.keys()
+            for tile in tiles:
+                ch = FOG_CHARS[self.fog.grid[tile[1]][tile[0]]]
+                for gx, gy in tile_cells.get(tile, ()):
+                    canvas.set_base(gx, gy, ch)
+            entry[2] = self.fog.epoch
+
+        # Moving layer: agents, then blinking flares on top
         sx = MAP_W / width
         sy = MAP_H / height
-        grid = [['·'] * width for _ in range(height)]
-
-        # Fog overlay
-        if show_fog:
-            for gy in range(height):
-                for gx in range(width):
-                    wx = gx * sx + sx/2
-                    wy = gy * sy + sy/2
-                    tile_x = int(wx // FOG_TILE)
-                    tile_y = int(wy // FOG_TILE)
-                    if (0 <= tile_x < self.fog.cols and
-                            0 <= tile_y < self.fog.rows):
-                        v = self.fog.grid[tile_y][tile_x]
-                        if v == 0:   grid[gy][gx] = '░'
-                        elif v == 1: grid[gy][gx] = '·'
-                        else:        grid[gy][gx] = ' '
-                    else:
-                        grid[gy][gx] = '░'
-
-        # Landmarks
-        lm_chars = {
-            "Parliament_Hall": 'P', "Clock_Tower": 'C',
-            "North_Stadium": 'S',   "South_Stadium": 's',
-            "East_Tower": 'E',       "West_Tower": 'W',
-            "Battle_Ground_A": 'A', "Battle_Ground_B": 'B',
-            "North_Shore": '~',      "South_Shore": '~',
-            "Alpha_Spawn": '⊕',     "Omega_Spawn": '⊗',
-        }
-        for lm_name, (lx, ly) in LANDMARKS.items():
-            gx = min(int(lx / sx), width-1)
-            gy = min(int(ly / sy), height-1)
-            grid[gy][gx] = lm_chars.get(lm_name, 'L')
-
-        # Agents
-        team_char = {'ALPHA': '▲', 'OMEGA': '▼', 'MOB': 'M'}
+        marks: Dict[Tuple[int,int], str] = {}
+        agent_ch = MINIMAP_TEAM_CHARS.get(self.team, '?')
         for agent in self.agents:
-            gx = min(int(agent.position[0] / sx), width-1)
-            gy = min(int(agent.position[1] / sy), height-1)
-            grid[gy][gx] = team_char.get(self.team, '?')
-
-        # Active flares (blink)
+            marks[(min(int(agent.position[0] / sx), width-1),
+                   min(int(agent.position[1] / sy), height-1))] = agent_ch
         for flare in self.flare_mgr.flares:
             if flare.is_visible(self.tick_num):
-                gx = min(int(flare.position[0] / sx), width-1)
-                gy = min(int(flare.position[1] / sy), height-1)
-                grid[gy][gx] = '*'   # flare blink character
-
-        # Captured points
-        cap_chars = {'ALPHA': '🔶', 'OMEGA': '🔷', 'Neutral': '⬜'}
-
-        # Render
+                marks[(min(int(flare.position[0] / sx), width-1),
+                       min(int(flare.position[1] / sy), height-1))] = '*'
+        canvas.set_overlay(marks)
+        return canvas
+
+    def minimap_frame(self, width: int = 50, height: int = 25,
+                      show_fog: bool = True, viewer: Optional[str] = None) -> str:
+        """
+        Bordered ASCII minimap (fog, landmarks, agents, flares) as one string.
+        `viewer` draws the fog one agent knows (own + pooled) instead of the team's.
+        """
+        canvas   = self._minimap_canvas(width, height, show_fog, viewer)
+        fog_pct  = (self.fog.explored_pct if viewer is None
+                    else self._viewer_layer(viewer).explored_pct)
+        view_tag = f"Team {self.team}" if viewer is None else f"{viewer} ({self.team})"
         border = '═' * (width + 4)
-        print(f"\n  ╔{border}╗")
-        print(f"  ║  PARLIAMENT CITY MINIMAP  |  Team {self.team}  "
-              f"|  Tick {self.tick_num:03d}  "
-              f"|  Fog: {100-self.fog.explored_pct:.0f}% unexplored  ║")
-        print(f"  ╠{border}╣")
-        for gy, row in enumerate(grid):
-            line = ''.join(row)
-            print(f"  ║  {line}  ║")
-        print(f"  ╠{border}╣")
+        lines  = [f"\n  ╔{border}╗",
+                  f"  ║  PARLIAMENT CITY MINIMAP  |  {view_tag}  "
+                  f"|  Tick {self.tick_num:03d}  "
+                  f"|  Fog: {100-fog_pct:.0f}% unexplored  ║",
+                  f"  ╠{border}╣"]
+        lines.extend(f"  ║  {line}  ║" for line in canvas.rows())
+        canvas.diff()   # a full frame counts as sent
+        lines.append(f"  ╠{border}╣")
         # Legend
-        print(f"  ║  ▲=Team Agent  *=Flare  P=Parliament  C=Clock  "
-              f"S=Stadium  E/W=Tower  A/B=BattleGrd  ~=Shore  ░=Fog  ║")
-        print(f"  ╚{border}╝")
+        lines.append(f"  ║  ▲=Team Agent  *=Flare  P=Parliament  C=Clock  "
+                     f"S=Stadium  E/W=Tower  A/B=BattleGrd  ~=Shore  ░=Fog  ║")
+        lines.append(f"  ╚{border}╝")
+        return '\n'.join(lines)
+
+    def minimap_diff(self, width: int = 50, height: int = 25,
+                     show_fog: bool = True,
+                     viewer: Optional[str] = None) -> List[Tuple[int, str]]:
+        """Grid rows changed since the last frame/diff at this resolution."""
+        return self._minimap_canvas(width, height, show_fog, viewer).diff()
+
+    def render_minimap(self, width: int = 50, height: int = 25,
+                       show_fog: bool = True):
+        """ASCII minimap renderer with fog, agents, flares, landmarks."""
+        print(self.minimap_frame(width, height, show_fog))
 
         # Agent position table
         print(f"\n  Agent Positions (Team {self.team}):")
@@ -607,9 +835,7 @@ class MapNavigator:
             print(f"    {icon} {pt:<22} → {ctrl}")
 
     def flush_log(self):
-        out = self.log[:]
-        self.log.clear()
-        return out
+        return self.log.flush()
 
 # ─────────────────────────────────────────────────────────────────────
 #  FULL MAP NAVIGATION DEMO
@@ -700,6 +926,11 @@ def run_map_navigation_demo():
     print(f"\n  🗺️  Final Map Coverage:")
     print(f"    Team ALPHA fog explored: {alpha_nav.fog.explored_pct:.1f}%")
     print(f"    Team OMEGA fog explored: {omega_nav.fog.explored_pct:.1f}%")
+    for a in alpha_agents:
+        print(f"    {a.agent_id:<14} knows: {a.fog_layer.explored_pct:.1f}% (own + pooled)")
+
+    print(f"\n  🌫️  What Ignis-Prime knows (own fog + layers pooled with nearby allies):")
+    print(alpha_nav.minimap_frame(width=55, height=22, viewer="Ignis-Prime"))
     print()
 
 if __name__ == "__main__":
@@ -0,0 +1,98 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════╗
+║       NAVIG — CACHED MINIMAP CANVAS                                     ║
+║  Layered ASCII grid · Dirty-cell recompose · Full frame or row diff     ║
+╚══════════════════════════════════════════════════════════════════════════╝
+
+Shared by the map minimap (Backend 4) and the radar minimap (Backend 5).
+
+Each cell is composed as   overlay  >  static  >  base
+  - base:    background per cell (fog shading, blank radar floor)
+  - static:  landmarks / radar nodes — set once per resolution
+  - overlay: moving things (agents, flares, blips, jammers) — replaced per frame
+
+Only cells whose layers changed since the last frame are recomposed, and only
+rows that contain such cells are re-joined into strings.
+
+Static layers depend only on world data and resolution, so static_layer()
+keeps one per (world.WORLD_VERSION, kind, width, height) for the whole
+process: every match's navigator and radar reuse the same build.
+"""
+
+from typing import Callable, List, Tuple, Dict, Set
+
+_STATIC_LAYERS: Dict[Tuple, Dict[Tuple[int,int], str]] = {}
+
+
+def static_layer(kind: str, width: int, height: int,
+                 build: Callable[[int, int], Dict[Tuple[int,int], str]]
+                 ) -> Dict[Tuple[int,int], str]:
+    """Shared {cell: char} static layer; built once per world version + resolution."""
+    from world import WORLD_VERSION
+    key = (WORLD_VERSION, kind, width, height)
+    layer = _STATIC_LAYERS.get(key)
+    if layer is None:
+        layer = _STATIC_LAYERS[key] = build(width, height)
+    return layer
+
+
+class MinimapCanvas:
+    def __init__(self, width: int, height: int, fill: str = ' '):
+        self.width   = width
+        self.height  = height
+        self.base:    List[List[str]] = [[fill] * width for _ in range(height)]
+        self.static:  Dict[Tuple[int,int], str] = {}
+        self.overlay: Dict[Tuple[int,int], str] = {}
+        self._cells:  List[List[str]] = [row[:] for row in self.base]
+        self._rows:   List[str] = [''.join(row) for row in self._cells]
+        self._stale_rows:   Set[int] = set()   # rows needing a re-join
+        self._unsent_rows:  Set[int] = set(range(height))   # rows changed since last diff()
+
+    def _recompose(self, gx: int, gy: int):
+        cell = (gx, gy)
+        ch = self.overlay.get(cell) or self.static.get(cell) or self.base[gy][gx]
+        if self._cells[gy][gx] != ch:
+            self._cells[gy][gx] = ch
+            self._stale_rows.add(gy)
+            self._unsent_rows.add(gy)
+
+    def set_static(self, gx: int, gy: int, ch: str):
+        self.static[(gx, gy)] = ch
+        self._recompose(gx, gy)
+
+    def load_static(self, layer: Dict[Tuple[int,int], str]):
+        for (gx, gy), ch in layer.items():
+            self.set_static(gx, gy, ch)
+
+    def set_base(self, gx: int, gy: int, ch: str):
+        if self.base[gy][gx] != ch:
+            self.base[gy][gx] = ch
+            self._recompose(gx, gy)
+
+    def set_overlay(self, marks: Dict[Tuple[int,int], str]):
+        """Replace the overlay layer; only cells that differ are recomposed."""
+        old, self.overlay = self.overlay, marks
+        for cell, ch in marks.items():
+            if old.get(cell) != ch:
+                self._recompose(*cell)
+        for cell in old:
+            if cell not in marks:
+                self._recompose(*cell)
+
+    def rows(self) -> List[str]:
+        for gy in self._stale_rows:
+            self._rows[gy] = ''.join(self._cells[gy])
+        self._stale_rows.clear()
+        return self._rows
+
+    def render(self) -> str:
+        """Whole grid as one newline-joined string."""
+        self._unsent_rows.clear()
+        return '\n'.join(self.rows())
+
+    def diff(self) -> List[Tuple[int, str]]:
+        """(row_index, row_text) for rows changed since the previous diff/render."""
+        rows = self.rows()
+        out = [(gy, rows[gy]) for gy in sorted(self._unsent_rows)]
+        self._unsent_rows.clear()
+        return out
@@ -18,44 +18,21 @@ Renders:
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 import math
+import os
+import sys
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)   # repo root → shared `world` package
+from world.elements import (ELEMENTS, ELEMENT_EMOJI, TYPE_CHART, AGENT_STATS,
+                            MATCHUP_MATRIX)
+from world.elements import ELEMENT_TEAM as TEAM
 
 # ─────────────────────────────────────────────────────────────────────
-#  DATA DEFINITIONS (mirrors metahuman_swarm.py)
+#  DATA DEFINITIONS
 # ─────────────────────────────────────────────────────────────────────
 
-ELEMENTS = ["Fire", "Water", "Thunder", "Earth", "Grass", "Sand", "Flying", "Dark"]
-ELEMENT_EMOJI = {
-    "Fire":    "🔥", "Water":   "💧", "Thunder": "⚡",
-    "Earth":   "🌍", "Grass":   "🌿", "Sand":    "🏜️ ",
-    "Flying":  "🌪️ ", "Dark":    "🌑",
-}
-TEAM = {
-    "Fire": "ALPHA", "Water": "ALPHA", "Thunder": "ALPHA", "Earth": "ALPHA",
-    "Grass": "OMEGA", "Sand": "OMEGA", "Flying": "OMEGA", "Dark": "OMEGA",
-}
-
-# Type effectiveness: TYPE_CHART[attacker][defender] = multiplier
-TYPE_CHART: Dict[str, Dict[str, float]] = {
-    "Fire":    {"Grass":2.0, "Earth":1.5, "Sand":1.0,  "Water":0.5, "Thunder":1.0,"Flying":1.0,"Dark":1.0, "Fire":1.0},
-    "Water":   {"Fire":2.0,  "Sand":1.5,  "Grass":0.5, "Thunder":0.5,"Earth":1.0, "Flying":1.0,"Dark":1.0, "Water":1.0},
-    "Thunder": {"Water":2.0, "Flying":2.0,"Earth":0.5, "Grass":1.0, "Fire":1.0,  "Sand":1.0,  "Dark":1.0,  "Thunder":1.0},
-    "Earth":   {"Thunder":2.0,"Fire":1.5, "Sand":1.5,  "Grass":0.5, "Flying":0.0,"Water":1.0, "Dark":1.0,  "Earth":1.0},
-    "Grass":   {"Water":2.0, "Earth":1.5, "Sand":1.5,  "Fire":0.5,  "Flying":0.5,"Thunder":1.0,"Dark":1.0, "Grass":1.0},
-    "Sand":    {"Thunder":1.5,"Flying":1.0,"Water":0.5,"Grass":0.5, "Fire":1.0,  "Earth":1.0, "Dark":1.0,  "Sand":1.0},
-    "Flying":  {"Grass":2.0, "Earth":2.0, "Thunder":0.5,"Water":1.0,"Fire":1.0,  "Sand":1.0,  "Dark":1.0,  "Flying":1.0},
-    "Dark":    {"Thunder":1.5,"Grass":1.5,"Flying":1.5, "Water":1.0,"Fire":1.0,  "Sand":1.0,  "Earth":1.0, "Dark":1.0},
-}
-
-AGENT_STATS: Dict[str, Dict] = {
-    "Ignis-Prime":   {"element":"Fire",    "team":"ALPHA","hp":280,"atk":90,"def":55,"spd":8.0, "range":18,"role":"Offense",        "emoji":"🔥"},
-    "AquaVex":       {"element":"Water",   "team":"ALPHA","hp":320,"atk":70,"def":80,"spd":6.5, "range":20,"role":"Support/Control","emoji":"💧"},
-    "Volt-Surge":    {"element":"Thunder", "team":"ALPHA","hp":250,"atk":95,"def":45,"spd":10.0,"range":22,"role":"Burst DPS",      "emoji":"⚡"},
-    "TerraKnight":   {"element":"Earth",   "team":"ALPHA","hp":400,"atk":75,"def":95,"spd":5.0, "range":12,"role":"Tank",           "emoji":"🌍"},
-    "Sylvan-Wraith": {"element":"Grass",   "team":"OMEGA","hp":300,"atk":72,"def":70,"spd":7.0, "range":16,"role":"Control",        "emoji":"🌿"},
-    "DustSerpent":   {"element":"Sand",    "team":"OMEGA","hp":270,"atk":80,"def":60,"spd":9.0, "range":19,"role":"Debuffer",       "emoji":"🏜️ "},
-    "ZephyrBlade":   {"element":"Flying",  "team":"OMEGA","hp":240,"atk":88,"def":40,"spd":12.0,"range":25,"role":"Skirmisher",     "emoji":"🌪️ "},
-    "Voidwalker":    {"element":"Dark",    "team":"OMEGA","hp":290,"atk":92,"def":50,"spd":8.5, "range":20,"role":"Assassin",       "emoji":"🌑"},
-}
+# ELEMENTS, ELEMENT_EMOJI, TEAM, TYPE_CHART, AGENT_STATS → world.elements
 
 ABILITIES: Dict[str, List[Dict]] = {
     "Ignis-Prime": [
@@ -196,13 +173,12 @@ class TableRenderer:
         print("  " + "─" * (header_col + col_w * len(ELEMENTS)))
 
         # Rows: ATTACKING elements
-        for atk in ELEMENTS:
+        for atk, mults in zip(ELEMENTS, MATCHUP_MATRIX):
             emoji = ELEMENT_EMOJI.get(atk, "  ")
             team  = TEAM[atk]
             team_tag = "🔶" if team == "ALPHA" else "🔷"
             row   = f"  {team_tag}{emoji}{atk:<10}"
-            for def_elem in ELEMENTS:
-                mult = TYPE_CHART.get(atk, {}).get(def_elem, 1.0)
+            for mult in mults:
                 label = self.EFFECTIVENESS_LABELS.get(mult, f"{mult}×   ")
                 row += f"{label:<{col_w}}"
             print(row)
@@ -0,0 +1,93 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════╗
+║   SHARED — STRUCTURED EVENT LOG                                         ║
+║   Event Codes · Ring Buffer · Format on Demand · Live Sinks             ║
+╚══════════════════════════════════════════════════════════════════════════╝
+
+Hot paths record ``(code, args)`` instead of building an f-string. A code is
+either a ``str.format`` template or a callable returning the line, so a
+record costs one tuple; the text is only built when the log is read
+(``flush`` / ``lines`` / iteration) or when a sink is attached.
+
+Args are stored as passed — hand over values (numbers, ids, tuples), not
+objects that keep changing after the event.
+
+    log = EventLog()
+    log.emit("  📍 [{}] discovered landmark [{}]", agent_id, lm)
+    log.append("  pre-formatted lines still work")
+    for line in log.flush(): print(line)
+
+``emit(log, code, *args)`` accepts a plain list as well, for callers that
+still pass ``List[str]`` logs around.
+"""
+from collections import deque
+from typing import Callable, Iterable, Iterator, List, Optional
+
+EVENT_LOG_CAPACITY = 4096   # records kept per log; oldest drop off first
+
+_LINE = "{}"   # code for pre-formatted lines
+
+
+def format_event(code, args) -> str:
+    return code.format(*args) if type(code) is str else code(*args)
+
+
+class EventLog:
+    """Ring buffer of (code, args) records, formatted on read."""
+    __slots__ = ("records", "sink")
+
+    def __init__(self, capacity: Optional[int] = EVENT_LOG_CAPACITY,
+                 sink: Optional[Callable[[str], None]] = None):
+        self.records: deque = deque(maxlen=capacity)
+        self.sink = sink
+
+    def emit(self, code, *args):
+        self.records.append((code, args))
+        if self.sink is not None:
+            self.sink(format_event(code, args))
+
+    def append(self, line: str):
+        self.emit(_LINE, line)
+
+    def extend(self, lines: Iterable[str]):
+        if isinstance(lines, EventLog):
+            for code, args in lines.records:
+                self.emit(code, *args)
+            return
+        for line in lines:
+            self.emit(_LINE, line)
+
+    def attach(self, sink: Callable[[str], None]):
+        """Receive every new line as it is recorded (formats eagerly)."""
+        self.sink = sink
+
+    def detach(self):
+        self.sink = None
+
+    def lines(self) -> List[str]:
+        return [format_event(code, args) for code, args in self.records]
+
+    def flush(self) -> List[str]:
+        out = self.lines()
+        self.records.clear()
+        return out
+
+    def clear(self):
+        self.records.clear()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.lines())
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __bool__(self) -> bool:
+        return bool(self.records)
+
+
+def emit(log, code, *args):
+    """Record on an EventLog; plain lists get the formatted line right away."""
+    if type(log) is list:
+        log.append(format_event(code, args))
+    else:
+        log.emit(code, *args)
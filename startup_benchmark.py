@@ -0,0 +1,62 @@
+"""
+Startup benchmark - cold import time of each backend entry point
+
+Every target is imported in a fresh interpreter (no warm module cache),
+repeated N times; the median wall time is reported. Run before/after a
+change to check that worker boot does not regress:
+
+    python startup_benchmark.py            # 7 runs per target
+    python startup_benchmark.py 15         # 15 runs per target
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# (label, working dir, import statement)
+TARGETS = [
+    ("world",                     ROOT,                                   "import world"),
+    ("world.city",                ROOT,                                   "import world.city"),
+    ("world.city + warm()",       ROOT,                                   "import world; world.warm()"),
+    ("Intel shared_constants",    os.path.join(ROOT, "Intel_Intelligence"), "import shared_constants"),
+    ("Intel infrastructure",      os.path.join(ROOT, "Intel_Intelligence"), "import infrastructure_engine"),
+    ("Intel ai_intelligence",     os.path.join(ROOT, "Intel_Intelligence"), "import ai_intelligence"),
+    ("Navig map_navigation",      os.path.join(ROOT, "Navig"),            "import map_navigation"),
+    ("Navig enemy_mob_navigation", os.path.join(ROOT, "Navig"),           "import enemy_mob_navigation"),
+    ("web_server",                ROOT,                                   "import web_server"),
+]
+
+PROBE = ("import sys, time; sys.path.insert(0, '.'); t = time.perf_counter(); {stmt}; "
+         "print((time.perf_counter() - t) * 1000)")
+
+
+def time_import(cwd: str, stmt: str, runs: int):
+    samples = []
+    for _ in range(runs):
+        proc = subprocess.run([sys.executable, "-c", PROBE.format(stmt=stmt)],
+                              cwd=cwd, capture_output=True, text=True)
+        if proc.returncode != 0:
+            err = proc.stderr.strip().splitlines()
+            return None, err[-1] if err else f"exit {proc.returncode}"
+        samples.append(float(proc.stdout.strip().splitlines()[-1]))
+    return samples, None
+
+
+def main(runs: int = 7):
+    print(f"\n  Cold import time — median of {runs} fresh interpreters\n")
+    print(f"  {'Target':<28} {'median':>9} {'min':>9} {'max':>9}")
+    print("  " + "─" * 58)
+    for label, cwd, stmt in TARGETS:
+        samples, err = time_import(cwd, stmt, runs)
+        if samples is None:
+            print(f"  {label:<28} unavailable ({err})")
+            continue
+        print(f"  {label:<28} {statistics.median(samples):>7.1f}ms "
+              f"{min(samples):>7.1f}ms {max(samples):>7.1f}ms")
+    print()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 7)
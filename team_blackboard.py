@@ -0,0 +1,185 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════╗
+║   SHARED — TEAM BLACKBOARD                                              ║
+║   One Enemy Track per Target · O(1) Sightings · Per-Agent Read Views    ║
+╚══════════════════════════════════════════════════════════════════════════╝
+
+A team keeps one EnemyTrack per enemy (position, velocity, tick, confidence)
+instead of copying each sighting into every ally. A sighting is one write;
+allies read through a BlackboardView, which also remembers what its agent
+has already searched out ("cleared") so per-agent search state survives
+without per-agent copies of the tracks.
+
+    board = TeamBlackboard("ALPHA", ttl=20)
+    board.report("Ignis-Prime", "Voidwalker", (90.0, 90.0), tick=12)
+    view  = board.view("AquaVex")
+    view.latest().pos, view.predict("Voidwalker", tick=15)
+
+A report can name its ``readers`` (e.g. the hivemind members at report
+time); None means the whole team. Later joiners do not see it, and a
+reader left out of a newer report of the same target keeps the report it
+already had until it goes stale, as if the sighting had been copied to it.
+"""
+from dataclasses import dataclass, replace
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+
+@dataclass
+class EnemyTrack:
+    target_id:  str
+    pos:        Tuple[float, float]
+    velocity:   Tuple[float, float]   # map units per tick, from the last two reports
+    tick:       int
+    confidence: float                 # 0–1 at report time
+    reporter:   str
+    seq:        int                   # board write counter at the last report
+    readers:    Optional[FrozenSet[str]] = None   # who may read it; None = whole team
+
+    def readable_by(self, agent_id: str) -> bool:
+        return self.readers is None or agent_id in self.readers
+
+    def age(self, tick: int) -> int:
+        return tick - self.tick
+
+    def predict(self, tick: int) -> Tuple[float, float]:
+        """Dead-reckoned position at `tick`."""
+        dt = tick - self.tick
+        return (self.pos[0] + self.velocity[0] * dt,
+                self.pos[1] + self.velocity[1] * dt)
+
+    def confidence_at(self, tick: int, ttl: Optional[int]) -> float:
+        if not ttl:
+            return self.confidence
+        return self.confidence * max(0.0, 1.0 - self.age(tick) / ttl)
+
+
+class TeamBlackboard:
+    """Per-team store of enemy tracks; every write is O(1)."""
+    def __init__(self, team: str, ttl: Optional[int] = None):
+        self.team    = team
+        self.ttl     = ttl                # ticks a track stays fresh; None = forever
+        self.tracks: Dict[str, EnemyTrack] = {}
+        self.seq     = 0
+        self.latest: Optional[EnemyTrack] = None
+        # agent → target → the last report it could read, kept after a newer
+        # report of that target left it out
+        self.held: Dict[str, Dict[str, EnemyTrack]] = {}
+
+    def report(self, reporter: str, target_id: str, pos: Tuple[float, float],
+               tick: int, confidence: float = 1.0,
+               readers: Optional[FrozenSet[str]] = None) -> EnemyTrack:
+        self.seq += 1
+        track = self.tracks.get(target_id)
+        if track is None:
+            track = EnemyTrack(target_id, pos, (0.0, 0.0), tick, confidence,
+                               reporter, self.seq, readers)
+            self.tracks[target_id] = track
+        else:
+            if track.readers is not None and readers is not None:
+                dropped = track.readers - readers
+                if dropped:
+                    kept = replace(track)
+                    for aid in dropped:
+                        self.held.setdefault(aid, {})[target_id] = kept
+            dt = tick - track.tick
+            if dt > 0:
+                track.velocity = ((pos[0] - track.pos[0]) / dt,
+                                  (pos[1] - track.pos[1]) / dt)
+            track.pos, track.tick, track.confidence = pos, tick, confidence
+            track.reporter, track.seq, track.readers = reporter, self.seq, readers
+        self.latest = track
+        return track
+
+    def get(self, target_id: str) -> Optional[EnemyTrack]:
+        return self.tracks.get(target_id)
+
+    def get_for(self, agent_id: str, target_id: str) -> Optional[EnemyTrack]:
+        """Newest report of `target_id` that `agent_id` may read."""
+        track = self.tracks.get(target_id)
+        if track is not None and track.readable_by(agent_id):
+            return track
+        return self.held.get(agent_id, {}).get(target_id)
+
+    def readable(self, agent_id: str) -> List[EnemyTrack]:
+        out = [t for t in self.tracks.values() if t.readable_by(agent_id)]
+        held = self.held.get(agent_id)
+        if held:
+            out += [h for tid, h in held.items()
+                    if tid not in self.tracks or not self.tracks[tid].readable_by(agent_id)]
+        return out
+
+    def is_fresh(self, track: EnemyTrack, tick: int) -> bool:
+        return self.ttl is None or track.age(tick) < self.ttl
+
+    def fresh(self, tick: int) -> List[EnemyTrack]:
+        return [t for t in self.tracks.values() if self.is_fresh(t, tick)]
+
+    def predict(self, target_id: str, tick: int) -> Optional[Tuple[float, float]]:
+        track = self.tracks.get(target_id)
+        return track.predict(tick) if track is not None else None
+
+    def forget(self, target_id: str):
+        track = self.tracks.pop(target_id, None)
+        if track is not None and track is self.latest:
+            self.latest = max(self.tracks.values(), key=lambda t: t.seq, default=None)
+        for held in self.held.values():
+            held.pop(target_id, None)
+
+    def purge_stale(self, tick: int):
+        if self.ttl is None:
+            return
+        for tid in [tid for tid, t in self.tracks.items() if not self.is_fresh(t, tick)]:
+            self.forget(tid)
+        for aid, held in list(self.held.items()):
+            for tid in [tid for tid, t in held.items() if not self.is_fresh(t, tick)]:
+                del held[tid]
+            if not held:
+                del self.held[aid]
+
+    def view(self, agent_id: str) -> "BlackboardView":
+        return BlackboardView(agent_id, self)
+
+    def render(self, tick: int) -> str:
+        lines = [f"  📋 Blackboard [{self.team}]: {len(self.tracks)} track(s)"]
+        for t in sorted(self.tracks.values(), key=lambda t: -t.seq):
+            px, py = t.predict(tick)
+            lines.append(f"    🎯 {t.target_id:<18} at ({t.pos[0]:.0f},{t.pos[1]:.0f}) "
+                         f"{t.age(tick)}t ago → ({px:.0f},{py:.0f})  "
+                         f"conf:{t.confidence_at(tick, self.ttl):.2f}  by {t.reporter}")
+        return "\n".join(lines)
+
+
+class BlackboardView:
+    """One agent's read view of its team board plus its own search state."""
+    __slots__ = ("agent_id", "board", "cleared_seq")
+
+    def __init__(self, agent_id: str, board: TeamBlackboard):
+        self.agent_id    = agent_id
+        self.board       = board
+        self.cleared_seq = 0    # tracks at or below this seq were already searched
+
+    def get(self, target_id: str) -> Optional[EnemyTrack]:
+        return self.board.get_for(self.agent_id, target_id)
+
+    def fresh(self, tick: int) -> List[EnemyTrack]:
+        board = self.board
+        return [t for t in board.readable(self.agent_id) if board.is_fresh(t, tick)]
+
+    def latest(self) -> Optional[EnemyTrack]:
+        """Newest report this agent may read and has not cleared yet."""
+        track = self.board.latest
+        if track is None or track.seq <= self.cleared_seq:
+            return None
+        if not track.readable_by(self.agent_id):
+            track = max(self.board.readable(self.agent_id), key=lambda t: t.seq, default=None)
+            if track is None or track.seq <= self.cleared_seq:
+                return None
+        return track
+
+    def predict(self, target_id: str, tick: int) -> Optional[Tuple[float, float]]:
+        track = self.get(target_id)
+        return track.predict(tick) if track is not None else None
+
+    def clear(self):
+        """Mark everything reported so far as searched (for this agent only)."""
+        self.cleared_seq = self.board.seq
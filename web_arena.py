@@ -3,43 +3,67 @@ WebBattleArena - Web-enabled battle arena with real-time broadcasting
 """
 from typing import Dict, List, Optional, Set
 import asyncio
+import os
+import sys
 from datetime import datetime
 from Swarm_engine import BattleArena, MetaAgent, Element, Team
 
+_INTEL = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Intel_Intelligence")
+if _INTEL not in sys.path:
+    sys.path.append(_INTEL)   # Intel backends import their siblings by bare name
+from infrastructure_engine import WebSocketFeed
+
 class WebBattleArena(BattleArena):
     """Extended arena with WebSocket support and session management."""
     
     def __init__(self, battle_id: str, num_mobs: int = 12):
         super().__init__(num_mobs)
         self.battle_id = battle_id
-        self.connected_clients: Set = set()
+        self.feed = WebSocketFeed(frame_meta={"battle_id": battle_id})   # per-channel fan-out + replay
         self.paused = False
         self.created_at = datetime.now()
         self.spectator_mode = False
         
+    @property
+    def connected_clients(self) -> Set:
+        return set(self.feed.channels["broadcast"].clients)
+    
+    @staticmethod
+    def team_intel(brain) -> Dict:
+        """What one team knows: its plan plus the enemy tracks on its blackboard."""
+        return {
+            "phase":     brain.strategy_phase,
+            "formation": brain.formation,
+            "objective": brain.objective.name if brain.objective else None,
+            "enemy_tracks": [
+                {"target": t.target_id, "x": round(t.pos[0], 1), "y": round(t.pos[1], 1),
+                 "age": t.age(brain.tick), "reporter": t.reporter}
+                for t in brain.blackboard.tracks.values()
+            ],
+        }
+    
     async def broadcast_state(self, state: Dict):
-        """Broadcast game state to all connected clients."""
-        if not self.connected_clients:
-            return
-        
-        message = {"type": "game_state", "data": state, "battle_id": self.battle_id}
-        dead_clients = set()
-        
-        for client in self.connected_clients:
-            try:
-                await client.send_json(message)
-            except:
-                dead_clients.add(client)
-        
-        self.connected_clients -= dead_clients
+        """
+        Broadcast game state to all connected clients (serialized once).
+        Team channels also get their own team's intel; spectators get both.
+        """
+        self.feed.tick_num = self.tick
+        self.feed.push("game_state", state)
+        alpha = self.team_intel(self.brain_alpha)
+        beta  = self.team_intel(self.brain_beta)
+        self.feed.push("team_intel", alpha, "team_alpha")
+        self.feed.push("team_intel", beta,  "team_omega")    # Team.BETA
+        self.feed.push("spectator_state", {"alpha": alpha, "beta": beta}, "spectator")
+        await self.feed.flush_async()
     
-    def add_client(self, websocket):
-        """Register new client connection."""
-        self.connected_clients.add(websocket)
+    async def add_client(self, websocket, channel: str = "broadcast",
+                         resume: Optional[Dict[str, int]] = None) -> bool:
+        """Replay missed frames, then register; False if a resync was sent."""
+        return await self.feed.attach(websocket, channel, resume)
     
     def remove_client(self, websocket):
         """Unregister client connection."""
-        self.connected_clients.discard(websocket)
+        self.feed.disconnect(websocket)
     
     def toggle_pause(self) -> bool:
         """Pause/resume battle."""
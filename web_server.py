@@ -4,13 +4,12 @@ FastAPI Web Server - Real-time battle server
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from typing import Dict, Optional
+from functools import lru_cache
 import asyncio
 import uuid
 
 from web_arena import WebBattleArena
 from multiplayer_controller import MultiplayerController, SessionManager
-from tournament_manager import TournamentManager
-from web_swarm_brain import StrategyMarketplace
 
 app = FastAPI(title="Swarm Intelligence Battle API")
 
@@ -26,8 +25,24 @@ app.add_middleware(
 # Global managers
 active_battles: Dict[str, WebBattleArena] = {}
 session_manager = SessionManager()
-tournament_manager = TournamentManager()
-strategy_marketplace = StrategyMarketplace()
+
+@app.on_event("startup")
+async def warm_world():
+    """Build the world lookup rasters at boot, not on the first battle's first lookup."""
+    import world
+    world.warm()
+
+# Matchmaking/tournaments and the strategy marketplace are off the battle
+# path, so they are imported and built on first use rather than at boot.
+@lru_cache(maxsize=None)
+def get_tournament_manager():
+    from tournament_manager import TournamentManager
+    return TournamentManager()
+
+@lru_cache(maxsize=None)
+def get_strategy_marketplace():
+    from web_swarm_brain import StrategyMarketplace
+    return StrategyMarketplace()
 
 @app.post("/battle/create")
 async def create_battle(num_mobs: int = 12):
@@ -54,9 +69,24 @@ async def toggle_pause(battle_id: str):
     paused = arena.toggle_pause()
     return {"paused": paused}
 
+def parse_resume(resume: Optional[str]) -> Dict[str, int]:
+    """Parse "broadcast:120,team_alpha:17" into {"broadcast": 120, "team_alpha": 17}."""
+    out = {}
+    for part in (resume or "").split(","):
+        name, _, seq = part.partition(":")
+        if name and seq.isdigit():
+            out[name] = int(seq)
+    return out
+
 @app.websocket("/battle/{battle_id}/connect")
-async def battle_websocket(websocket: WebSocket, battle_id: str):
-    """WebSocket endpoint for real-time battle updates."""
+async def battle_websocket(websocket: WebSocket, battle_id: str,
+                           channel: str = "broadcast", resume: Optional[str] = None):
+    """
+    WebSocket endpoint for real-time battle updates.
+    ?channel= team_alpha | team_omega (BETA) | spectator (broadcast is always on);
+    ?resume=broadcast:<seq>,<channel>:<seq> replays frames missed since a drop
+    before any live frame is sent.
+    """
     await websocket.accept()
     
     arena = active_battles.get(battle_id)
@@ -65,7 +95,12 @@ async def battle_websocket(websocket: WebSocket, battle_id: str):
         await websocket.close()
         return
     
-    arena.add_client(websocket)
+    try:
+        await arena.add_client(websocket, channel, parse_resume(resume))
+    except ValueError as e:
+        await websocket.send_json({"error": str(e)})
+        await websocket.close()
+        return
     player_id = str(uuid.uuid4())
     
     # Assign player to agent
@@ -105,6 +140,7 @@ async def battle_websocket(websocket: WebSocket, battle_id: str):
 @app.post("/matchmaking/join")
 async def join_queue(player_id: str):
     """Join matchmaking queue."""
+    tournament_manager = get_tournament_manager()
     tournament_manager.add_to_queue(player_id)
     match = tournament_manager.create_match()
     if match:
@@ -114,28 +150,28 @@ async def join_queue(player_id: str):
 @app.get("/leaderboard")
 async def get_leaderboard(limit: int = 10):
     """Get top players."""
-    return tournament_manager.get_leaderboard(limit)
+    return get_tournament_manager().get_leaderboard(limit)
 
 @app.get("/player/{player_id}/history")
 async def get_match_history(player_id: str):
     """Get player match history."""
-    return tournament_manager.get_match_history(player_id)
+    return get_tournament_manager().get_match_history(player_id)
 
 @app.post("/strategy/upload")
 async def upload_strategy(author: str, name: str, config: Dict):
     """Upload strategy to marketplace."""
-    strategy_marketplace.upload_strategy(author, name, config)
+    get_strategy_marketplace().upload_strategy(author, name, config)
     return {"status": "uploaded", "strategy": f"{author}_{name}"}
 
 @app.get("/strategy/top")
 async def get_top_strategies(limit: int = 10):
     """Get top strategies."""
-    return strategy_marketplace.get_top_strategies(limit)
+    return get_strategy_marketplace().get_top_strategies(limit)
 
 @app.get("/strategy/{strategy_id}")
 async def download_strategy(strategy_id: str):
     """Download strategy."""
-    config = strategy_marketplace.download_strategy(strategy_id)
+    config = get_strategy_marketplace().download_strategy(strategy_id)
     if not config:
         raise HTTPException(status_code=404, detail="Strategy not found")
     return config
@@ -0,0 +1,53 @@
+"""
+World definition shared by every backend (Swarm_engine, Navig, Intel_Intelligence,
+assets). Tables are defined once, frozen, and their derived lookups (matchup
+matrices, distance matrices, rasters) are built at import time.
+
+    world.city      Parliament City 200×200 map, roads, zones, roster
+    world.elements  type charts + stat tables, dense matchup matrices
+    world.arena     Swarm_engine 800×600 zone layout
+    world.lookup    nearest-landmark / zone rasters
+
+Backends living in sub-folders put the repo root on sys.path and import from
+here, e.g. ``from world.city import LANDMARKS``.
+
+``WORLD_VERSION`` is a content hash of every table; caches that depend on
+world data should key off it (Navig's shared minimap static layers do). It
+is computed on first access.
+
+Rasters build on their first lookup; long-running workers can call
+``world.warm()`` once at boot to pay that cost before the first battle.
+"""
+
+
+def warm():
+    """Build every lazily-derived table now."""
+    from world import city
+    for raster in (city.LANDMARK_RASTER, city.POI_RASTER, city.ZONE_RASTER):
+        raster.warm()
+
+
+def _compute_version() -> str:
+    import hashlib
+    import json
+    from world import arena, city, elements
+    from world.frozen import thaw
+    tables = {
+        "city":     [thaw(getattr(city, n)) for n in
+                     ("LANDMARKS", "ROAD_GRAPH", "ZONE_BOUNDS", "KEY_POINTS",
+                      "ELEMENT_OF", "TEAM_OF", "SPAWN_OF")] + [city.MAP_W, city.MAP_H],
+        "elements": [thaw(getattr(elements, n)) for n in
+                     ("TYPE_CHART", "AGENT_STATS", "ARENA_ELEMENT_CHART",
+                      "ARENA_AGENT_STATS")],
+        "arena":    [thaw(arena.ARENA_ZONES), arena.MAP_WIDTH, arena.MAP_HEIGHT],
+    }
+    blob = json.dumps(tables, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(blob.encode()).hexdigest()[:12]
+
+
+def __getattr__(name):
+    if name == "WORLD_VERSION":
+        value = _compute_version()
+        globals()["WORLD_VERSION"] = value
+        return value
+    raise AttributeError(f"module 'world' has no attribute {name!r}")
@@ -0,0 +1,29 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════╗
+║   BATTLE ARENA — 800×600 zone layout used by Swarm_engine               ║
+╚══════════════════════════════════════════════════════════════════════════╝
+"""
+import math
+
+MAP_WIDTH  = 800
+MAP_HEIGHT = 600
+
+# (name, x, y, radius, strategic_value, is_highground, is_chokepoint)
+ARENA_ZONES = (
+    ("Parliament_Core",     400, 300, 60,  10, False, True),
+    ("Clock_Tower",         550, 150, 30,   7, True,  False),
+    ("North_Stadium",       250, 100, 50,   5, False, False),
+    ("South_Stadium",       550, 500, 50,   5, False, False),
+    ("East_Road_Network",   700, 300, 40,   4, False, True),
+    ("West_Shoreline",      100, 300, 45,   3, False, False),
+    ("Alpha_Spawn",          60,  60, 35,   1, False, False),
+    ("Beta_Spawn",          740, 540, 35,   1, False, False),
+    ("High_Tower_NE",       680, 120, 25,   6, True,  False),
+    ("High_Tower_SW",       120, 480, 25,   6, True,  False),
+    ("Battle_Ground_West",  200, 400, 55,   8, False, False),
+    ("Battle_Ground_East",  600, 200, 55,   8, False, False),
+)
+
+# Zone-centre distance matrix, indexed like ARENA_ZONES
+ZONE_DIST = tuple(
+    tuple(math.hypot(a[1]-b[1], a[2]-b[2]) for b in ARENA_ZONES) for a in ARENA_ZONES)
@@ -0,0 +1,95 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════╗
+║   PARLIAMENT CITY — 200×200 map, landmarks, roads, zones, roster        ║
+║   Used by Navig/*, Intel_Intelligence/* and assets/Swarm_Ai_agents      ║
+╚══════════════════════════════════════════════════════════════════════════╝
+
+Derived tables (landmark distance matrix, nearest-landmark and zone
+rasters) are built once here at import time and shared by every engine.
+"""
+import math
+from typing import Tuple, Dict, List
+
+from world.frozen import freeze
+from world.lookup import NearestLandmarkRaster, ZoneRaster
+
+MAP_W = 200
+MAP_H = 200
+
+LANDMARKS: Dict[str, Tuple[float, float]] = freeze({
+    "Parliament_Hall":  (100, 100), "Clock_Tower":      (100,  60),
+    "North_Stadium":    (100,  30), "South_Stadium":    (100, 170),
+    "East_Tower":       (160, 100), "West_Tower":       ( 40, 100),
+    "North_Shore":      ( 50,  10), "South_Shore":      (150, 190),
+    "Battle_Ground_A":  ( 60,  60), "Battle_Ground_B":  (140, 140),
+    "Road_Junction_N":  (100,  75), "Road_Junction_S":  (100, 125),
+    "Road_Junction_E":  (130, 100), "Road_Junction_W":  ( 70, 100),
+    "Alpha_Spawn":      ( 22,  22), "Omega_Spawn":      (178, 178),
+})
+
+# Landmarks that are destinations in their own right (no road junctions)
+POI_LANDMARKS: Dict[str, Tuple[float, float]] = freeze(
+    {k: v for k, v in LANDMARKS.items() if not k.startswith("Road_Junction")})
+
+ROAD_GRAPH: Dict[str, List[str]] = freeze({
+    "Alpha_Spawn":     ["Road_Junction_W", "Battle_Ground_A", "North_Shore"],
+    "Omega_Spawn":     ["Road_Junction_E", "Battle_Ground_B", "South_Shore"],
+    "Road_Junction_N": ["Parliament_Hall", "Clock_Tower", "Road_Junction_W", "Road_Junction_E"],
+    "Road_Junction_S": ["Parliament_Hall", "Road_Junction_W", "Road_Junction_E", "South_Stadium"],
+    "Road_Junction_E": ["Parliament_Hall", "Road_Junction_N", "Road_Junction_S", "East_Tower"],
+    "Road_Junction_W": ["Parliament_Hall", "Road_Junction_N", "Road_Junction_S", "West_Tower"],
+    "Parliament_Hall": ["Road_Junction_N", "Road_Junction_S", "Road_Junction_E", "Road_Junction_W"],
+    "Clock_Tower":     ["Road_Junction_N", "North_Stadium"],
+    "North_Stadium":   ["Clock_Tower", "North_Shore"],
+    "South_Stadium":   ["Road_Junction_S", "South_Shore"],
+    "East_Tower":      ["Road_Junction_E", "Battle_Ground_B"],
+    "West_Tower":      ["Road_Junction_W", "Battle_Ground_A"],
+    "Battle_Ground_A": ["West_Tower", "Alpha_Spawn", "Road_Junction_W"],
+    "Battle_Ground_B": ["East_Tower", "Omega_Spawn", "Road_Junction_E"],
+    "North_Shore":     ["Alpha_Spawn", "North_Stadium"],
+    "South_Shore":     ["Omega_Spawn", "South_Stadium"],
+})
+
+# (x_min, y_min, x_max, y_max), inclusive; first match wins
+ZONE_BOUNDS: Dict[str, Tuple[int, int, int, int]] = freeze({
+    "Parliament_Core": (85, 85, 115, 115),
+    "Clock_Tower":     (90, 50, 110,  70),
+    "North_Stadium":   (75, 15, 125,  45),
+    "South_Stadium":   (75,155, 125, 185),
+    "East_Tower":      (145,85, 175, 115),
+    "West_Tower":      (25,  85,  55, 115),
+    "Battle_A":        (45,  45,  75,  75),
+    "Battle_B":        (125,125, 155, 155),
+    "North_Shore":     (0,   0,   80,  20),
+    "South_Shore":     (120,180, 200, 200),
+})
+
+KEY_POINTS = ("Parliament_Hall", "Clock_Tower", "North_Stadium",
+              "South_Stadium", "East_Tower", "West_Tower")
+
+# ── Roster ───────────────────────────────────────────────────────────
+ALPHA_AGENTS = ("Ignis-Prime", "AquaVex", "Volt-Surge", "TerraKnight")
+OMEGA_AGENTS = ("Sylvan-Wraith", "DustSerpent", "ZephyrBlade", "Voidwalker")
+
+ELEMENT_OF: Dict[str, str] = freeze({
+    "Ignis-Prime":"Fire",   "AquaVex":"Water",
+    "Volt-Surge":"Thunder", "TerraKnight":"Earth",
+    "Sylvan-Wraith":"Grass","DustSerpent":"Sand",
+    "ZephyrBlade":"Flying", "Voidwalker":"Dark",
+})
+
+TEAM_OF: Dict[str, str] = freeze({a: "ALPHA" for a in ALPHA_AGENTS} |
+                                 {a: "OMEGA" for a in OMEGA_AGENTS})
+SPAWN_OF: Dict[str, Tuple[float, float]] = freeze(
+    {"ALPHA": (22.0, 22.0), "OMEGA": (178.0, 178.0)})
+
+# ── Derived tables (built once) ──────────────────────────────────────
+LANDMARK_DIST: Dict[str, Dict[str, float]] = freeze({
+    a: {b: math.sqrt((pa[0]-pb[0])**2 + (pa[1]-pb[1])**2)
+        for b, pb in LANDMARKS.items()}
+    for a, pa in LANDMARKS.items()
+})
+
+LANDMARK_RASTER = NearestLandmarkRaster(LANDMARKS, MAP_W, MAP_H)
+POI_RASTER      = NearestLandmarkRaster(POI_LANDMARKS, MAP_W, MAP_H)
+ZONE_RASTER     = ZoneRaster(ZONE_BOUNDS, MAP_W, MAP_H)
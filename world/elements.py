@@ -0,0 +1,81 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════╗
+║   ELEMENTS — type charts and per-agent stat tables                      ║
+╚══════════════════════════════════════════════════════════════════════════╝
+
+Two charts exist on purpose:
+  - TYPE_CHART           Parliament City roster (assets/table_component)
+  - ARENA_ELEMENT_CHART  800×600 battle arena (Swarm_engine), keyed by the
+                         lowercase Element enum values; missing pairs = 1.0
+Each also has a dense ELEMENTS×ELEMENTS matrix built at import time.
+"""
+from typing import Dict, List
+
+from world.frozen import freeze
+
+ELEMENTS = ("Fire", "Water", "Thunder", "Earth", "Grass", "Sand", "Flying", "Dark")
+ELEMENT_INDEX: Dict[str, int] = freeze({e: i for i, e in enumerate(ELEMENTS)})
+
+ELEMENT_EMOJI: Dict[str, str] = freeze({
+    "Fire":    "🔥", "Water":   "💧", "Thunder": "⚡",
+    "Earth":   "🌍", "Grass":   "🌿", "Sand":    "🏜️ ",
+    "Flying":  "🌪️ ", "Dark":    "🌑",
+})
+ELEMENT_TEAM: Dict[str, str] = freeze({
+    "Fire": "ALPHA", "Water": "ALPHA", "Thunder": "ALPHA", "Earth": "ALPHA",
+    "Grass": "OMEGA", "Sand": "OMEGA", "Flying": "OMEGA", "Dark": "OMEGA",
+})
+
+# Type effectiveness: TYPE_CHART[attacker][defender] = multiplier
+TYPE_CHART: Dict[str, Dict[str, float]] = freeze({
+    "Fire":    {"Grass":2.0, "Earth":1.5, "Sand":1.0,  "Water":0.5, "Thunder":1.0,"Flying":1.0,"Dark":1.0, "Fire":1.0},
+    "Water":   {"Fire":2.0,  "Sand":1.5,  "Grass":0.5, "Thunder":0.5,"Earth":1.0, "Flying":1.0,"Dark":1.0, "Water":1.0},
+    "Thunder": {"Water":2.0, "Flying":2.0,"Earth":0.5, "Grass":1.0, "Fire":1.0,  "Sand":1.0,  "Dark":1.0,  "Thunder":1.0},
+    "Earth":   {"Thunder":2.0,"Fire":1.5, "Sand":1.5,  "Grass":0.5, "Flying":0.0,"Water":1.0, "Dark":1.0,  "Earth":1.0},
+    "Grass":   {"Water":2.0, "Earth":1.5, "Sand":1.5,  "Fire":0.5,  "Flying":0.5,"Thunder":1.0,"Dark":1.0, "Grass":1.0},
+    "Sand":    {"Thunder":1.5,"Flying":1.0,"Water":0.5,"Grass":0.5, "Fire":1.0,  "Earth":1.0, "Dark":1.0,  "Sand":1.0},
+    "Flying":  {"Grass":2.0, "Earth":2.0, "Thunder":0.5,"Water":1.0,"Fire":1.0,  "Sand":1.0,  "Dark":1.0,  "Flying":1.0},
+    "Dark":    {"Thunder":1.5,"Grass":1.5,"Flying":1.5, "Water":1.0,"Fire":1.0,  "Sand":1.0,  "Earth":1.0, "Dark":1.0},
+})
+
+AGENT_STATS: Dict[str, Dict] = freeze({
+    "Ignis-Prime":   {"element":"Fire",    "team":"ALPHA","hp":280,"atk":90,"def":55,"spd":8.0, "range":18,"role":"Offense",        "emoji":"🔥"},
+    "AquaVex":       {"element":"Water",   "team":"ALPHA","hp":320,"atk":70,"def":80,"spd":6.5, "range":20,"role":"Support/Control","emoji":"💧"},
+    "Volt-Surge":    {"element":"Thunder", "team":"ALPHA","hp":250,"atk":95,"def":45,"spd":10.0,"range":22,"role":"Burst DPS",      "emoji":"⚡"},
+    "TerraKnight":   {"element":"Earth",   "team":"ALPHA","hp":400,"atk":75,"def":95,"spd":5.0, "range":12,"role":"Tank",           "emoji":"🌍"},
+    "Sylvan-Wraith": {"element":"Grass",   "team":"OMEGA","hp":300,"atk":72,"def":70,"spd":7.0, "range":16,"role":"Control",        "emoji":"🌿"},
+    "DustSerpent":   {"element":"Sand",    "team":"OMEGA","hp":270,"atk":80,"def":60,"spd":9.0, "range":19,"role":"Debuffer",       "emoji":"🏜️ "},
+    "ZephyrBlade":   {"element":"Flying",  "team":"OMEGA","hp":240,"atk":88,"def":40,"spd":12.0,"range":25,"role":"Skirmisher",     "emoji":"🌪️ "},
+    "Voidwalker":    {"element":"Dark",    "team":"OMEGA","hp":290,"atk":92,"def":50,"spd":8.5, "range":20,"role":"Assassin",       "emoji":"🌑"},
+})
+
+# Battle-arena chart (attacker → {target: multiplier}), sparse
+ARENA_ELEMENT_CHART: Dict[str, Dict[str, float]] = freeze({
+    "fire":    {"grass": 2.0, "earth": 1.5, "water": 0.5, "sand": 0.8},
+    "water":   {"fire": 2.0,  "sand": 1.5,  "thunder": 0.7, "grass": 0.8},
+    "thunder": {"water": 2.0, "flying": 2.0, "earth": 0.5, "grass": 1.0},
+    "earth":   {"thunder": 2.0, "fire": 0.8, "grass": 0.8, "flying": 0.3},
+    "grass":   {"water": 2.0, "sand": 2.0, "fire": 0.5, "flying": 0.8},
+    "sand":    {"thunder": 1.5, "fire": 0.7, "water": 0.7, "grass": 0.5},
+    "flying":  {"grass": 1.5, "earth": 2.0, "thunder": 0.5, "dark": 0.8},
+    "dark":    {"thunder": 1.5, "fire": 1.2, "grass": 0.9, "water": 0.9},
+})
+
+# Battle-arena base stats per element
+ARENA_AGENT_STATS: Dict[str, Dict] = freeze({
+    "fire":    {"hp": 180, "atk": 90, "def": 50, "spd": 4.2, "role": "Assault"},
+    "water":   {"hp": 220, "atk": 70, "def": 80, "spd": 3.5, "role": "Support-Tank"},
+    "thunder": {"hp": 160, "atk": 100,"def": 45, "spd": 5.0, "role": "Skirmisher"},
+    "earth":   {"hp": 260, "atk": 75, "def": 100,"spd": 2.8, "role": "Tank"},
+    "grass":   {"hp": 200, "atk": 65, "def": 70, "spd": 3.8, "role": "Support"},
+    "sand":    {"hp": 170, "atk": 80, "def": 60, "spd": 4.5, "role": "Disruptor"},
+    "flying":  {"hp": 155, "atk": 95, "def": 40, "spd": 5.5, "role": "Flanker"},
+    "dark":    {"hp": 175, "atk": 105,"def": 50, "spd": 4.8, "role": "Assassin"},
+})
+
+# ── Derived dense matrices: M[ELEMENT_INDEX[atk]][ELEMENT_INDEX[def]] ─
+MATCHUP_MATRIX = tuple(
+    tuple(TYPE_CHART.get(a, {}).get(d, 1.0) for d in ELEMENTS) for a in ELEMENTS)
+ARENA_MATCHUP_MATRIX = tuple(
+    tuple(ARENA_ELEMENT_CHART.get(a.lower(), {}).get(d.lower(), 1.0) for d in ELEMENTS)
+    for a in ELEMENTS)
@@ -0,0 +1,20 @@
+"""Read-only views for world tables (shared by every engine, never mutated)."""
+from types import MappingProxyType
+
+
+def freeze(obj):
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(obj, dict):
+        return MappingProxyType({k: freeze(v) for k, v in obj.items()})
+    if isinstance(obj, (list, tuple)):
+        return tuple(freeze(v) for v in obj)
+    return obj
+
+
+def thaw(obj):
+    """Plain dict/list copy of a frozen table (for hashing / serialising)."""
+    if isinstance(obj, MappingProxyType) or isinstance(obj, dict):
+        return {k: thaw(v) for k, v in obj.items()}
+    if isinstance(obj, tuple):
+        return [thaw(v) for v in obj]
+    return obj
@@ -0,0 +1,124 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════╗
+║   WORLD LOOKUP RASTERS — nearest landmark (Voronoi) · zone id           ║
+║   Built once per landmark/zone table · O(1) position lookups             ║
+╚══════════════════════════════════════════════════════════════════════════╝
+
+The map is cut into RASTER_CELL × RASTER_CELL cells. For each cell we store
+only the landmarks (or zones) that can possibly answer a query inside it, so
+a lookup is one index plus, near a Voronoi edge / zone border, a check of the
+two or three candidates. Results are identical to a full linear scan,
+including tie-breaks (first in table order wins).
+
+Cell tables are built on the first lookup (or by warm()), so importing a
+module that declares a raster costs nothing until it is queried.
+"""
+import math
+from typing import Dict, List, Optional, Tuple
+
+RASTER_CELL = 5.0
+OPEN_FIELD  = "Open_Field"
+
+def _dist(a, b): return math.sqrt((a[0]-b[0])**2 + (a[1]-b[1])**2)
+
+
+class NearestLandmarkRaster:
+    """Precomputed nearest-landmark lookup for a fixed landmark table."""
+
+    def __init__(self, landmarks: Dict[str, Tuple[float, float]],
+                 width: float, height: float, cell: float = RASTER_CELL):
+        self.landmarks = dict(landmarks)
+        self.width, self.height, self.cell = width, height, cell
+        self.cols = max(1, math.ceil(width / cell))
+        self.rows = max(1, math.ceil(height / cell))
+        self._cells: Optional[List[Tuple[str, ...]]] = None   # built on first lookup
+
+    def warm(self) -> "NearestLandmarkRaster":
+        """Build the cell table now instead of on the first lookup."""
+        if self._cells is None:
+            self._cells = self._build()
+        return self
+
+    def _build(self) -> List[Tuple[str, ...]]:
+        cell, width, height = self.cell, self.width, self.height
+        pts = [(n, lx, ly) for n, (lx, ly) in self.landmarks.items()]
+        cells: List[Tuple[str, ...]] = []
+        for gy in range(self.rows):
+            y0, y1 = gy * cell, min((gy + 1) * cell, height)
+            # per-row y terms are shared by every cell in the row
+            ys = [(min(max(ly, y0), y1) - ly) ** 2 for _, _, ly in pts]
+            yu = [max(abs(ly - y0), abs(ly - y1)) ** 2 for _, _, ly in pts]
+            for gx in range(self.cols):
+                x0, x1 = gx * cell, min((gx + 1) * cell, width)
+                lower = [(min(max(lx, x0), x1) - lx) ** 2 + ys[i]
+                         for i, (_, lx, _) in enumerate(pts)]
+                best_upper = math.sqrt(min(max(abs(lx - x0), abs(lx - x1)) ** 2 + yu[i]
+                                           for i, (_, lx, _) in enumerate(pts)))
+                limit = (best_upper + 1e-9) ** 2
+                cells.append(tuple(pts[i][0] for i, lo in enumerate(lower)
+                                   if lo <= limit))
+        return cells
+
+    def _scan(self, pos, names) -> str:
+        return min(names, key=lambda k: _dist(pos, self.landmarks[k]))
+
+    def nearest(self, pos: Tuple[float, float]) -> str:
+        x, y = pos
+        if not (0 <= x <= self.width and 0 <= y <= self.height):
+            return self._scan(pos, self.landmarks)
+        gx = min(int(x // self.cell), self.cols - 1)
+        gy = min(int(y // self.cell), self.rows - 1)
+        cells = self._cells if self._cells is not None else self.warm()._cells
+        cands = cells[gy * self.cols + gx]
+        return cands[0] if len(cands) == 1 else self._scan(pos, cands)
+
+
+class ZoneRaster:
+    """Precomputed zone-id lookup for a table of inclusive (x1,y1,x2,y2) rects."""
+
+    def __init__(self, bounds: Dict[str, Tuple[float, float, float, float]],
+                 width: float, height: float, cell: float = RASTER_CELL,
+                 default: str = OPEN_FIELD):
+        self.bounds  = dict(bounds)
+        self.default = default
+        self.width, self.height, self.cell = width, height, cell
+        self.cols = max(1, math.ceil(width / cell))
+        self.rows = max(1, math.ceil(height / cell))
+        self._cells: Optional[List[Tuple]] = None   # built on first lookup
+
+    def warm(self) -> "ZoneRaster":
+        """Build the cell table now instead of on the first lookup."""
+        if self._cells is None:
+            self._cells = self._build()
+        return self
+
+    def _build(self) -> List[Tuple]:
+        cell, width, height = self.cell, self.width, self.height
+        items = list(self.bounds.items())
+        cells: List[Tuple] = []
+        for gy in range(self.rows):
+            y0, y1 = gy * cell, min((gy + 1) * cell, height)
+            row_items = [(name, rect) for name, rect in items
+                         if rect[1] <= y1 and rect[3] >= y0]
+            for gx in range(self.cols):
+                x0, x1 = gx * cell, min((gx + 1) * cell, width)
+                cells.append(tuple((name, rect) for name, rect in row_items
+                                   if rect[0] <= x1 and rect[2] >= x0))
+        return cells
+
+    @staticmethod
+    def _first(pos, items, default):
+        x, y = pos
+        for name, (x1, y1, x2, y2) in items:
+            if x1 <= x <= x2 and y1 <= y <= y2:
+                return name
+        return default
+
+    def zone(self, pos: Tuple[float, float]):
+        x, y = pos
+        if not (0 <= x <= self.width and 0 <= y <= self.height):
+            return self._first(pos, self.bounds.items(), self.default)
+        gx = min(int(x // self.cell), self.cols - 1)
+        gy = min(int(y // self.cell), self.rows - 1)
+        cells = self._cells if self._cells is not None else self.warm()._cells
+        return self._first(pos, cells[gy * self.cols + gx], self.default)